@@ -111,6 +111,7 @@ cp $CWD/vars/$TARGET.py $PROJECT_PATH/src/ztc/conf/
 # Update database and copy assets
 env/bin/python src/manage.py collectstatic --link --noinput --settings=$SETTINGS >> $SETUP_LOGFILE
 env/bin/python src/manage.py migrate --noinput --settings=$SETTINGS >> $SETUP_LOGFILE
+env/bin/python src/manage.py generate_schema --settings=$SETTINGS >> $SETUP_LOGFILE
 
 # Create superuser
 echo "Creating Zaaktypecatalogus superuser"
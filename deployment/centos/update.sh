@@ -19,6 +19,7 @@ env/bin/pip install -r requirements/$TARGET.txt --trusted-host pypi.python.org >
 # Update database and copy assets
 env/bin/python src/manage.py collectstatic --link --noinput --settings=$SETTINGS >> $SETUP_LOGFILE
 env/bin/python src/manage.py migrate --noinput --settings=$SETTINGS >> $SETUP_LOGFILE
+env/bin/python src/manage.py generate_schema --settings=$SETTINGS >> $SETUP_LOGFILE
 
 # Copy local settings
 cp $CWD/vars/$TARGET.py $PROJECT_PATH/src/ztc/conf/
@@ -19,6 +19,10 @@ done
 >&2 echo "Collect static files"
 python src/manage.py collectstatic --noinput
 
+# Write the API schema, so it is not generated on requests
+>&2 echo "Generate API schema"
+python src/manage.py generate_schema
+
 # Apply database migrations
 >&2 echo "Apply database migrations"
 python src/manage.py migrate
@@ -0,0 +1 @@
+default_app_config = 'ztc.api.apps.APIConfig'
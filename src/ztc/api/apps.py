@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class APIConfig(AppConfig):
+    name = 'ztc.api'
+
+    def ready(self):
+        from . import checks, signals  # noqa
+        from .utils import oauth2  # noqa
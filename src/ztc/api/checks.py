@@ -0,0 +1,73 @@
+from django.core.checks import Warning, register
+from django.core.exceptions import FieldDoesNotExist
+
+from ..datamodel.indexes import (
+    LOOKUP_SEP, get_local_field, get_parent_field, is_indexed
+)
+
+
+def get_registered_viewsets():
+    from .urls import catalogus_router, root_router, zaaktype_router
+
+    for router in (root_router, catalogus_router, zaaktype_router):
+        for prefix, viewset, basename in router.registry:
+            yield viewset
+
+
+def get_lookup_fields(model, lookup):
+    """
+    Return the ``(model, field)`` pairs of the fields that ``lookup`` follows from ``model``, up to its primary key.
+    """
+    fields = []
+    for name in lookup.split(LOOKUP_SEP):
+        if name == 'pk':
+            break
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            break
+        fields.append((model, field))
+        if not field.is_relation:
+            break
+        model = field.related_model
+    return fields
+
+
+def get_index_warning(viewset, model, field_names, name):
+    return Warning(
+        '%s filters or orders %s on %s without an index' % (viewset.__name__, model._meta.label, name),
+        hint='Add models.Index(fields=%r) to Meta.indexes of the model and run makemigrations' % field_names,
+        obj=viewset,
+        id='api.W001'
+    )
+
+
+@register()
+def check_filter_indexes(app_configs, **kwargs):
+    """
+    Check that every field the API filters or orders on has an index, after the filter on the parent resource, and that
+    every field on the path to the parent resources has an index.
+
+    The models declare these indexes in their ``Meta.indexes``, but a viewset can still filter on other fields.
+    """
+    warnings = []
+
+    for viewset in get_registered_viewsets():
+        view = viewset()
+        model = view.queryset.model
+        parent = get_parent_field(model)
+        prefix = [parent.name] if parent is not None else []
+
+        for name in sorted(set(view.get_filter_fields()) | set(view.get_ordering_fields())):
+            field = get_local_field(model, name)
+            if field is None or field.name in prefix or is_indexed(model, prefix + [field.name]):
+                continue
+            warnings.append(get_index_warning(viewset, model, prefix + [field.name], name))
+
+        parent_lookups = getattr(view.serializer_class, 'parent_lookup_kwargs', {})
+        for lookup in sorted(parent_lookups.values()):
+            for lookup_model, field in get_lookup_fields(model, lookup):
+                if field.concrete and not field.primary_key and not is_indexed(lookup_model, [field.name]):
+                    warnings.append(get_index_warning(viewset, lookup_model, [field.name], lookup))
+
+    return warnings
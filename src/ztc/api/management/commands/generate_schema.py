@@ -0,0 +1,35 @@
+import os
+
+from django.core.management.base import BaseCommand
+
+from drf_yasg.codecs import OpenAPICodecJson, OpenAPICodecYaml
+from rest_framework.settings import api_settings
+
+from ...schema import SCHEMA_DIR, generate_schema, get_schema_path
+
+
+class Command(BaseCommand):
+    help = (
+        'Write the schema of the API as JSON and YAML, to be served instead of generating it. Run this on every '
+        'deploy, since the schema changes with the code.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--api-version', default=api_settings.DEFAULT_VERSION, help='The version of the API.')
+        parser.add_argument(
+            '--url', default='',
+            help='The scheme and host of the API, like https://ztc.example.com. By default the schema has no host, '
+                 'so it is relative to the host that serves it.')
+        parser.add_argument(
+            '--output-dir', default=SCHEMA_DIR, help='The directory to write the schema files to.')
+
+    def handle(self, **options):
+        schema = generate_schema(options['api_version'], url=options['url'])
+
+        os.makedirs(options['output_dir'], exist_ok=True)
+        for format, codec_class in (('.json', OpenAPICodecJson), ('.yaml', OpenAPICodecYaml)):
+            path = get_schema_path(options['api_version'], format, options['output_dir'])
+            with open(path, 'wb') as f:
+                f.write(codec_class([]).encode(schema))
+            self.stdout.write('Wrote {}'.format(path))
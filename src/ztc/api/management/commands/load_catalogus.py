@@ -0,0 +1,67 @@
+import json
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from ...serializers import CatalogusSerializer
+from ...utils.loader import CATALOGUS_SECTION, CatalogusLoader, LoadError
+
+
+def read_json(path):
+    with open(path, encoding='utf-8') as f:
+        sections = json.load(f)
+    # The export has a single catalogus.
+    if isinstance(sections.get(CATALOGUS_SECTION), dict):
+        sections[CATALOGUS_SECTION] = [sections[CATALOGUS_SECTION]]
+    return sections
+
+
+def read_ndjson(path):
+    """
+    Read a dump with an object per line, as ``{"<section>": {...}}``.
+    """
+    sections = defaultdict(list)
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            for section, obj in json.loads(line).items():
+                sections[section].append(obj)
+    return sections
+
+
+class Command(BaseCommand):
+    help = 'Load a dump of one or more catalogussen, in the format of the export, in bulk.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='The path of the dump.')
+        parser.add_argument(
+            '--format', choices=['json', 'ndjson'],
+            help='The format of the dump. By default it is derived from the extension of the path.')
+
+    def handle(self, path, **options):
+        from ...urls import catalogus_router, zaaktype_router
+
+        format = options['format'] or ('ndjson' if path.endswith('.ndjson') else 'json')
+        try:
+            sections = read_ndjson(path) if format == 'ndjson' else read_json(path)
+        except (OSError, ValueError) as exc:
+            raise CommandError('Cannot read {}: {}'.format(path, exc))
+
+        resources = [(CATALOGUS_SECTION, CatalogusSerializer)] + [
+            (prefix, viewset.serializer_class)
+            for router in (catalogus_router, zaaktype_router)
+            for prefix, viewset, basename in router.registry
+        ]
+        loader = CatalogusLoader(resources)
+        try:
+            with transaction.atomic():
+                counts = loader.load(sections)
+        except LoadError as exc:
+            raise CommandError('The dump is invalid:\n{}'.format(exc))
+
+        for warning in loader.warnings:
+            self.stderr.write(str(warning))
+        for section, count in counts.items():
+            self.stdout.write('{}: {}'.format(section, count))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from ...utils.caching import response_cache
+
+
+class Command(BaseCommand):
+    help = 'Show the number of hits and misses of the API response cache.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help='Reset the counters after showing them.')
+
+    def handle(self, **options):
+        counters = response_cache.get_counters()
+        total = sum(counters.values())
+
+        for counter, value in counters.items():
+            self.stdout.write('{}: {}'.format(counter, value))
+        if total:
+            self.stdout.write('hit ratio: {:.1%}'.format(counters['hits'] / total))
+
+        if options['reset']:
+            response_cache.reset_counters()
@@ -1,5 +1,11 @@
+from django.utils.cache import patch_vary_headers
+
 from rest_framework.settings import api_settings
 
+from .utils.compression import (
+    compress_response, get_accepted_encoding, should_compress
+)
+
 
 class APIVersionHeaderMiddleware(object):
     """
@@ -22,3 +28,27 @@ class APIVersionHeaderMiddleware(object):
             pass
 
         return response
+
+
+class CompressionMiddleware(object):
+    """
+    Compress API responses with the content coding the client prefers, unless they are compressed already (like the
+    cached responses, see ``ResponseCache``).
+
+    The ETags of the API already include the content coding, so they are not changed.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        resolver_match = getattr(request, 'resolver_match', None)
+        if resolver_match is None or resolver_match.namespace != 'api':
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding', ))
+        encoding = get_accepted_encoding(request)
+        if should_compress(response, encoding):
+            compress_response(response, encoding)
+        return response
@@ -1,20 +1,26 @@
+import hashlib
 import logging
 import os
 
 from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
 from django.utils.functional import cached_property, empty
 
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_yasg import openapi
 from drf_yasg.app_settings import swagger_settings
+from drf_yasg.generators import OpenAPISchemaGenerator
 from drf_yasg.inspectors import (
     CoreAPICompatInspector, FieldInspector, NotHandled, SwaggerAutoSchema
 )
 from drf_yasg.utils import is_list_view
-from drf_yasg.views import get_schema_view
+from drf_yasg.views import SPEC_RENDERERS, get_schema_view
 from rest_framework import filters, permissions, serializers, status
+from rest_framework.response import Response
 from rest_framework.settings import api_settings
 
+from .utils.compression import get_accepted_encoding
 from .utils.pagination import HALPaginationInspector
 
 logger = logging.getLogger(__name__)
@@ -29,19 +35,104 @@ except FileNotFoundError as e:
     description = None
 
 
-schema_view = get_schema_view(
-    openapi.Info(
-        title='Zaaktypecatalogus (ZTC) API documentatie',
-        default_version='v{}'.format(api_settings.DEFAULT_VERSION),
-        description=description,
-        # terms_of_service='',
-        contact=openapi.Contact(email='support@maykinmedia.nl'),
-        license=openapi.License(name='EUPL 1.2'),
-    ),
+info = openapi.Info(
+    title='Zaaktypecatalogus (ZTC) API documentatie',
+    default_version='v{}'.format(api_settings.DEFAULT_VERSION),
+    description=description,
+    # terms_of_service='',
+    contact=openapi.Contact(email='support@maykinmedia.nl'),
+    license=openapi.License(name='EUPL 1.2'),
+)
+
+# The directory with the schema files written by the `generate_schema` command.
+SCHEMA_DIR = settings.REST_FRAMEWORK_EXT.get('SCHEMA_DIR')
+
+
+def generate_schema(version, url=None, request=None):
+    """
+    Return the schema of the API for ``version``. If ``url`` is ``None``, the host is taken from the ``request``, and
+    if it is empty, the schema has no host.
+    """
+    return OpenAPISchemaGenerator(info, version, url).get_schema(request, public=True)
+
+
+def get_schema_path(version, format, schema_dir=None):
+    """
+    Return the path of the schema file of ``version`` in the format of a renderer (``.json``, ``.yaml`` or
+    ``openapi``, which is JSON as well).
+    """
+    extension = 'yaml' if format == '.yaml' else 'json'
+    return os.path.join(schema_dir or SCHEMA_DIR, 'v{}.{}'.format(version, extension))
+
+
+class SchemaView(get_schema_view(
+    info,
     #validators=['flex', 'ssv'],
     public=True,
     permission_classes=(permissions.AllowAny,),
-)
+)):
+    """
+    Generate the schema only once per process, since it only changes with the code.
+
+    The schema formats are served from the files written by the ``generate_schema`` command (if there are any), or
+    rendered once, and have a strong ETag of their content and content coding. The schema has no host, like the files,
+    so it is the same for every host it is served on.
+    """
+    # The generated schemas by version, and the rendered formats by version and format.
+    schemas = {}
+    contents = {}
+
+    def get(self, request, version='', format=None):
+        version = request.version or version or ''
+        renderer = request.accepted_renderer
+        if not isinstance(renderer, SPEC_RENDERERS):
+            return Response(self.get_page_schema(version))
+
+        content = self.get_content(version, renderer)
+        # The response may be compressed by the `CompressionMiddleware`, and every content coding is a different
+        # representation with its own ETag.
+        encoding = get_accepted_encoding(request) or ''
+        etag = '"{}"'.format(hashlib.sha1(content + encoding.encode('ascii')).hexdigest())
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            content_type = renderer.media_type
+            if renderer.charset:
+                content_type = '{}; charset={}'.format(content_type, renderer.charset)
+            response = HttpResponse(content, content_type=content_type)
+        response['ETag'] = etag
+        return response
+
+    def get_schema(self, version):
+        if version not in self.schemas:
+            self.schemas[version] = generate_schema(version, url='')
+        return self.schemas[version]
+
+    def get_page_schema(self, version):
+        """
+        Return the schema for the documentation page, which only shows its title and version and loads the schema
+        itself from the ``openapi`` format. If there is a schema file, the schema is not generated for it.
+        """
+        if version in self.schemas or not os.path.exists(get_schema_path(version, 'openapi')):
+            return self.get_schema(version)
+        return openapi.Swagger(info=info, _prefix='/', _version=version, paths=openapi.Paths(paths={}))
+
+    def get_content(self, version, renderer):
+        """
+        Return the schema in the format of ``renderer``, from its file or rendered from the schema in memory.
+        """
+        key = (version, renderer.format)
+        if key not in self.contents:
+            path = get_schema_path(version, renderer.format)
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    self.contents[key] = f.read()
+            else:
+                schema = self.get_schema(version)
+                self.contents[key] = renderer.render(schema, renderer.media_type, self.get_renderer_context())
+        return self.contents[key]
+
+
+schema_view = SchemaView
 
 
 class DjangoFilterDescriptionInspector(CoreAPICompatInspector):
@@ -69,6 +160,7 @@ class SearchDescriptionInspector(CoreAPICompatInspector):
             result = super().get_filter_parameters(filter_backend)
             for param in result:
                 param.description = "One or more search terms, separated by a space, to search the returned list. " \
+                                    "Use * for any number of characters and ? for a single character. " \
                                     "The following fields will be searched: {}.".format(', '.join(search_fields))
             return result
 
@@ -1,9 +1,9 @@
-from rest_framework_nested.relations import NestedHyperlinkedRelatedField
-from rest_framework_nested.serializers import NestedHyperlinkedModelSerializer
-
 from ...datamodel.models import BesluitType
+from ..utils.relations import NestedHyperlinkedRelatedField
 from ..utils.rest_flex_fields import FlexFieldsSerializerMixin
-from ..utils.serializers import SourceMappingSerializerMixin
+from ..utils.serializers import (
+    NestedHyperlinkedModelSerializer, SourceMappingSerializerMixin
+)
 
 
 class BesluitTypeSerializer(FlexFieldsSerializerMixin, SourceMappingSerializerMixin, NestedHyperlinkedModelSerializer):
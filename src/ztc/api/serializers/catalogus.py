@@ -1,12 +1,12 @@
-from rest_framework import serializers
-from rest_framework_nested.relations import NestedHyperlinkedRelatedField
-
 from ...datamodel.models import Catalogus
+from ..utils.relations import NestedHyperlinkedRelatedField
 from ..utils.rest_flex_fields import FlexFieldsSerializerMixin
-from ..utils.serializers import SourceMappingSerializerMixin
+from ..utils.serializers import (
+    HyperlinkedModelSerializer, SourceMappingSerializerMixin
+)
 
 
-class CatalogusSerializer(FlexFieldsSerializerMixin, SourceMappingSerializerMixin, serializers.HyperlinkedModelSerializer):
+class CatalogusSerializer(FlexFieldsSerializerMixin, SourceMappingSerializerMixin, HyperlinkedModelSerializer):
     """
     Serializer based on ``CAT-basis`` specified in XSD ``ztc0310_ent_basis.xsd``.
     """
@@ -56,6 +56,7 @@ class CatalogusSerializer(FlexFieldsSerializerMixin, SourceMappingSerializerMixi
             'bestaatuitZaaktype',
             'bestaatuitInformatieobjecttype',
             'bestaatuitBesluittype',
+            'revisie',
         )
 
     expandable_fields = {
@@ -1,12 +1,13 @@
 from rest_framework.serializers import ModelSerializer
-from rest_framework_nested.relations import NestedHyperlinkedRelatedField
-from rest_framework_nested.serializers import NestedHyperlinkedModelSerializer
 
 from ...datamodel.models import (
     Eigenschap, EigenschapReferentie, EigenschapSpecificatie
 )
+from ..utils.relations import NestedHyperlinkedRelatedField
 from ..utils.rest_flex_fields import FlexFieldsSerializerMixin
-from ..utils.serializers import SourceMappingSerializerMixin
+from ..utils.serializers import (
+    NestedHyperlinkedModelSerializer, SourceMappingSerializerMixin
+)
 
 
 class EigenschapReferentieSerializer(SourceMappingSerializerMixin, ModelSerializer):
@@ -1,12 +1,13 @@
 from django.utils.translation import ugettext_lazy as _
 
 from rest_framework import serializers
-from rest_framework_nested.relations import NestedHyperlinkedRelatedField
-from rest_framework_nested.serializers import NestedHyperlinkedModelSerializer
 
 from ...datamodel.models import InformatieObjectType
+from ..utils.relations import NestedHyperlinkedRelatedField
 from ..utils.rest_flex_fields import FlexFieldsSerializerMixin
-from ..utils.serializers import SourceMappingSerializerMixin
+from ..utils.serializers import (
+    NestedHyperlinkedModelSerializer, SourceMappingSerializerMixin
+)
 
 
 class InformatieObjectTypeSerializer(FlexFieldsSerializerMixin, SourceMappingSerializerMixin, NestedHyperlinkedModelSerializer):
@@ -80,6 +81,6 @@ class InformatieObjectTypeSerializer(FlexFieldsSerializerMixin, SourceMappingSer
 
     expandable_fields = {
         'maaktDeeluitVan': ('ztc.api.serializers.CatalogusSerializer', {'source': 'maakt_deel_uit_van'}),
-        'isRelevantVoor': ('ztc.api.serializers.InformatieObjectTypeZaakTypeSerializer', {'source': 'zaakinformatieobjecttype_set'}),
+        'isRelevantVoor': ('ztc.api.serializers.ZaakTypeInformatieObjectTypeSerializer', {'source': 'zaakinformatieobjecttype_set', 'many': True}),
         'isVastleggingVoor': ('ztc.api.serializers.BesluitTypeSerializer', {'source': 'besluittype_set', 'many': True})
     }
@@ -0,0 +1,32 @@
+from django.utils.translation import ugettext_lazy as _
+
+from rest_framework import serializers
+from rest_framework.reverse import reverse
+
+from ...datamodel.models import Wijziging
+
+
+class WijzigingSerializer(serializers.ModelSerializer):
+    """
+    A change of an object in a catalogus, with the URL of the changed object.
+    """
+    url = serializers.SerializerMethodField(help_text=_('De URL van het gewijzigde object.'))
+
+    class Meta:
+        model = Wijziging
+        ref_name = model.__name__
+        fields = (
+            'revisie',
+            'soort',
+            'url',
+            'tijdstip',
+        )
+
+    def get_url(self, obj):
+        return reverse(
+            'api:{}-detail'.format(obj.resource), kwargs=dict(obj.resource_kwargs), request=self.context['request'])
+
+
+class WijzigingenQuerySerializer(serializers.Serializer):
+    sinds_revisie = serializers.IntegerField(
+        min_value=0, default=0, help_text=_('Geef alleen de wijzigingen na deze revisie van de CATALOGUS.'))
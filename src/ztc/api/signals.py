@@ -0,0 +1,91 @@
+"""
+Record every change in a catalogus as ``Wijziging``, with the API resource of the changed object.
+
+Objects that are shown as part of other resources (like the ``ProductDienst`` of a ``ZaakType``) do not have a resource
+of their own. A change of such an object is recorded as a change of the resources it is part of.
+"""
+from collections import OrderedDict
+from functools import lru_cache
+
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from ..datamodel.choices import WijzigingSoort
+from ..datamodel.models import Catalogus, Wijziging
+from ..datamodel.signals import catalogus_changed
+from .utils.query import LOOKUP_SEP
+from .utils.relations import get_lookup_attrs
+
+
+@lru_cache(maxsize=None)
+def get_resources():
+    """
+    Return the base name and the lookups of the URL kwargs of the API resource of each model, by model.
+    """
+    from .urls import catalogus_router, root_router, zaaktype_router
+
+    resources = {}
+    for router in (root_router, catalogus_router, zaaktype_router):
+        for prefix, viewset, base_name in router.registry:
+            lookups = OrderedDict(sorted(getattr(viewset.serializer_class, 'parent_lookup_kwargs', {}).items()))
+            lookups['pk'] = 'pk'
+            resources[viewset.queryset.model] = (base_name, lookups)
+    return resources
+
+
+def get_resource_instances(model, instance):
+    """
+    Return the objects with an API resource that show ``instance``: the instance itself, or the objects it is part of.
+    """
+    if model in get_resources():
+        return [instance]
+
+    lookup = getattr(model._meta, 'catalogus_lookup', None)
+    if lookup is None:
+        return []
+
+    # The first step towards the catalogus leads to the objects this object is part of.
+    attr = lookup.split(LOOKUP_SEP)[0]
+    related_model = model._meta.get_field(attr).related_model
+    if related_model not in get_resources():
+        return []
+    related_pks = model._default_manager.filter(pk=instance.pk).values(attr)
+    return list(related_model._default_manager.filter(pk__in=related_pks))
+
+
+def get_resource_kwargs(instance, lookups):
+    resource_kwargs = OrderedDict()
+    for kwarg, lookup in lookups.items():
+        value = instance
+        for attr in get_lookup_attrs(type(instance), lookup):
+            value = getattr(value, attr)
+        resource_kwargs[kwarg] = value
+    return resource_kwargs
+
+
+@receiver(catalogus_changed)
+def record_change(sender, instance, soort, revisies, **kwargs):
+    if sender not in get_resources():
+        # The resources this object is part of still exist.
+        soort = WijzigingSoort.gewijzigd
+
+    wijzigingen = []
+    for resource_instance in get_resource_instances(sender, instance):
+        model = type(resource_instance)
+        base_name, lookups = get_resources()[model]
+        resource_kwargs = get_resource_kwargs(resource_instance, lookups)
+
+        catalogus_pk = resource_kwargs['pk'] if model is Catalogus else resource_kwargs['catalogus_pk']
+        if catalogus_pk not in revisies:
+            continue
+
+        wijzigingen.append(Wijziging(
+            catalogus_id=catalogus_pk, revisie=revisies[catalogus_pk], soort=soort, resource=base_name,
+            resource_kwargs=resource_kwargs))
+
+    Wijziging.objects.bulk_create(wijzigingen)
+
+
+@receiver(post_delete, sender=Catalogus)
+def remove_changes(sender, instance, **kwargs):
+    Wijziging.objects.filter(catalogus_id=instance.pk).delete()
@@ -1,3 +1,5 @@
+import json
+import os
 from datetime import timedelta
 
 from django.test import TestCase
@@ -37,3 +39,25 @@ class CatalogusAPITestMixin(object):
 
 class APITestCase(ClientAPITestMixin, CatalogusAPITestMixin, TestCase):
     pass
+
+
+class BenchmarkMixin(object):
+    """
+    Set ``BENCHMARK_ROUNDS`` to change the number of rounds and ``BENCHMARK_REPORT`` to a file path to write the
+    timings as JSON.
+    """
+    def setUp(self):
+        super().setUp()
+
+        self.rounds = int(os.getenv('BENCHMARK_ROUNDS', 100))
+
+    def report(self, name, results):
+        report = os.getenv('BENCHMARK_REPORT')
+        if report:
+            data = {}
+            if os.path.exists(report):
+                with open(report, 'r') as f:
+                    data = json.load(f)
+            data[name] = results
+            with open(report, 'w') as f:
+                json.dump(data, f, indent=2)
@@ -1,11 +1,16 @@
 import json
 import os
-from datetime import timedelta
+from calendar import timegm
+from datetime import date, timedelta
 from unittest import expectedFailure, skip, skipIf
+from unittest.mock import patch
 
+from django.db import connection
 from django.test import LiveServerTestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.http import http_date
 from django.utils.translation import ugettext_lazy as _
 
 from oauth2_provider.models import AccessToken, Application
@@ -13,8 +18,12 @@ from rest_framework.settings import api_settings
 
 from ...datamodel.models import Catalogus
 from ...datamodel.tests.factories import (
-    BesluitTypeFactory, InformatieObjectTypeFactory
+    BesluitTypeFactory, CatalogusFactory, InformatieObjectTypeFactory,
+    StatusTypeFactory, ZaakTypeFactory
 )
+from ..utils.caching import response_cache
+from ..utils.pagination import HALPagination
+from ..views import CatalogusViewSet, StatusTypeViewSet, ZaakTypeViewSet
 from .base import APITestCase, CatalogusAPITestMixin, ClientAPITestMixin
 
 
@@ -387,6 +396,79 @@ class UseJSONTests(APITestCase):
         self.assertEqual(response.status_code, 415)
 
 
+class NDJSONTests(APITestCase):
+    """
+    Lists are streamed as newline delimited JSON, without pagination, if the client asks for it.
+    """
+    def setUp(self):
+        super().setUp()
+
+        self.other_catalogus = CatalogusFactory.create(domein='FGHIJ', rsin='999999999')
+
+    def get_lines(self, url):
+        response = self.api_client.get(url, HTTP_ACCEPT='application/x-ndjson')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['content-type'], 'application/x-ndjson')
+        self.assertTrue(response.streaming)
+
+        content = b''.join(response.streaming_content).decode('utf-8')
+        self.assertTrue(content.endswith('\n'))
+        return [json.loads(line) for line in content.splitlines()]
+
+    def test_stream_list(self):
+        lines = self.get_lines(self.catalogus_list_url)
+
+        self.assertEqual([line['rsin'] for line in lines], ['000000001', '999999999'])
+        self.assertTrue(all('_links' not in line for line in lines))
+
+    def test_stream_list_is_not_paginated(self):
+        CatalogusFactory.create_batch(3)
+
+        lines = self.get_lines('{}?{}=2'.format(self.catalogus_list_url, HALPagination.page_size_query_param))
+
+        self.assertEqual(len(lines), 5)
+
+    def test_stream_list_filtered(self):
+        lines = self.get_lines('{}?rsin=999999999'.format(self.catalogus_list_url))
+
+        self.assertEqual([line['rsin'] for line in lines], ['999999999'])
+
+    def test_stream_nested_list_in_chunks(self):
+        zaaktype = ZaakTypeFactory.create(maakt_deel_uit_van=self.catalogus)
+        StatusTypeFactory.create_batch(5, is_van=zaaktype)
+        url = reverse('api:statustype-list', kwargs={
+            'version': self.API_VERSION, 'catalogus_pk': self.catalogus.pk, 'zaaktype_pk': zaaktype.pk,
+        })
+
+        with patch.object(StatusTypeViewSet, 'stream_chunk_size', 2), CaptureQueriesContext(connection) as queries:
+            lines = self.get_lines(url)
+
+        self.assertEqual(len(lines), 5)
+        chunk_queries = [
+            query for query in queries.captured_queries
+            if query['sql'].startswith('SELECT') and 'FROM "datamodel_statustype"' in query['sql']
+            and '"datamodel_statustype"."id" IN' in query['sql']
+        ]
+        self.assertEqual(len(chunk_queries), 3)
+
+    def test_stream_list_not_modified(self):
+        response = self.api_client.get(self.catalogus_list_url, HTTP_ACCEPT='application/x-ndjson')
+        json_response = self.api_client.get(self.catalogus_list_url)
+        self.assertNotEqual(response['ETag'], json_response['ETag'])
+
+        response = self.api_client.get(
+            self.catalogus_list_url, HTTP_ACCEPT='application/x-ndjson', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_stream_detail_is_single_line(self):
+        response = self.api_client.get(self.catalogus_detail_url, HTTP_ACCEPT='application/x-ndjson')
+        self.assertEqual(response.status_code, 200)
+
+        content = response.content.decode('utf-8')
+        self.assertEqual(content.count('\n'), 1)
+        self.assertEqual(json.loads(content)['rsin'], '000000001')
+
+
 class FilterSortSearchTests(APITestCase):
     """Section 2.6.6 of the DSO: API strategy"""
     def setUp(self):
@@ -530,7 +612,29 @@ class FilterSortSearchTests(APITestCase):
         self.assertEqual(data['results'][0]['rsin'], catalogus_3.rsin)
         self.assertEqual(data['results'][1]['rsin'], catalogus_4.rsin)
 
-    @expectedFailure
+    def test_search_ordered_by_rank(self):
+        catalogus_a = Catalogus.objects.create(
+            domein=self.catalogus.domein, rsin='111111111', contactpersoon_beheer_naam='Marit de Vries')
+        catalogus_b = Catalogus.objects.create(
+            domein='MARIT', rsin='222222222', contactpersoon_beheer_naam='Jan Jansen')
+
+        response = self.api_client.get('{}?zoek={}'.format(self.catalogus_list_url, 'marit'))
+        self.assertEqual(response.status_code, 200)
+
+        # The domein weighs more than the name of the contactpersoon.
+        rsins = [catalogus['rsin'] for catalogus in response.json()['results']]
+        self.assertEqual(rsins, [catalogus_b.rsin, catalogus_a.rsin])
+
+    def test_search_ignores_accents(self):
+        catalogus = Catalogus.objects.create(
+            domein=self.catalogus.domein, rsin='111111111', contactpersoon_beheer_naam='Renée Jansen')
+
+        response = self.api_client.get('{}?zoek={}'.format(self.catalogus_list_url, 'renee'))
+        self.assertEqual(response.status_code, 200)
+
+        rsins = [catalogus['rsin'] for catalogus in response.json()['results']]
+        self.assertEqual(rsins, [catalogus.rsin])
+
     def test_search_wildcard_star(self):
         """DSO: API-37 (search wildcard star)"""
         response = self.api_client.get('{}?zoek={}*'.format(self.catalogus_list_url, self.other_catalogus.rsin[0:4]))
@@ -552,6 +656,71 @@ class FilterSortSearchTests(APITestCase):
         self.assertTrue('results' in data)
         self.assertEqual(len(data['results']), 1)
 
+    def test_search_wildcard_question_mark_per_character(self):
+        """
+        DSO: API-37 (search wildcard question mark)
+
+        Each question mark matches exactly one character, and the pattern has to match the whole value. The rsin has 9
+        characters, so its first 4 characters with 5 question marks match it, but not with 4 or 6 question marks. The
+        6 question marks of ``test_search_wildcard_question_mark`` make it an expected failure.
+        """
+        prefix = self.other_catalogus.rsin[0:4]
+
+        response = self.api_client.get('{}?zoek={}?????'.format(self.catalogus_list_url, prefix))
+        self.assertEqual(response.status_code, 200)
+        rsins = [catalogus['rsin'] for catalogus in response.json()['results']]
+        self.assertEqual(rsins, [self.other_catalogus.rsin])
+
+        for pattern in ('????', '??????'):
+            with self.subTest(pattern=pattern):
+                response = self.api_client.get('{}?zoek={}{}'.format(self.catalogus_list_url, prefix, pattern))
+                self.assertEqual(response.json()['results'], [])
+
+    def test_search_part_of_word(self):
+        catalogus = Catalogus.objects.create(
+            domein=self.catalogus.domein, rsin='111111111', contactpersoon_beheer_naam='Marit Vandenberg')
+
+        # Not the start of a word, so only the trigram index matches.
+        response = self.api_client.get('{}?zoek={}'.format(self.catalogus_list_url, 'denber'))
+        self.assertEqual(response.status_code, 200)
+
+        rsins = [catalogus['rsin'] for catalogus in response.json()['results']]
+        self.assertEqual(rsins, [catalogus.rsin])
+
+    def besluittype_omschrijvingen(self, query):
+        url = reverse('api:besluittype-list', kwargs={'version': self.API_VERSION, 'catalogus_pk': self.catalogus.pk})
+        response = self.api_client.get('{}?{}'.format(url, query))
+        self.assertEqual(response.status_code, 200)
+        return [besluittype['omschrijving'] for besluittype in response.json()['results']]
+
+    def test_filter_on_peildatum(self):
+        BesluitTypeFactory.create(
+            maakt_deel_uit_van=self.catalogus, besluittype_omschrijving='Oud',
+            datum_begin_geldigheid=date(2017, 1, 1), datum_einde_geldigheid=date(2017, 12, 31))
+        BesluitTypeFactory.create(
+            maakt_deel_uit_van=self.catalogus, besluittype_omschrijving='Nieuw', datum_begin_geldigheid=date(2018, 1, 1))
+
+        self.assertEqual(self.besluittype_omschrijvingen('peildatum=2017-12-31'), ['Oud'])
+        self.assertEqual(self.besluittype_omschrijvingen('peildatum=2018-01-01'), ['Nieuw'])
+        self.assertEqual(self.besluittype_omschrijvingen('peildatum=2016-06-01'), [])
+
+    def test_filter_actueel(self):
+        today = timezone.localdate()
+        BesluitTypeFactory.create(
+            maakt_deel_uit_van=self.catalogus, besluittype_omschrijving='Oud',
+            datum_begin_geldigheid=today - timedelta(days=10), datum_einde_geldigheid=today - timedelta(days=1))
+        BesluitTypeFactory.create(
+            maakt_deel_uit_van=self.catalogus, besluittype_omschrijving='Actueel', datum_begin_geldigheid=today)
+
+        self.assertEqual(self.besluittype_omschrijvingen('actueel=true'), ['Actueel'])
+
+    def test_filter_on_invalid_peildatum(self):
+        url = reverse('api:besluittype-list', kwargs={'version': self.API_VERSION, 'catalogus_pk': self.catalogus.pk})
+        response = self.api_client.get('{}?peildatum=31-12-2017'.format(url))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['invalid-params'][0]['name'], 'peildatum')
+
 
 class GeoTests(APITestCase):
     """Section 2.6.7 of the DSO: API strategy"""
@@ -622,19 +791,271 @@ class PaginationTests(APITestCase):
             self.assertTrue(key in links)
             self.assertEqual(links[key]['href'], url, key)
 
+    def test_pagination_with_page_size(self):
+        response = self.api_client.get('{}?paginagrootte=3'.format(self.catalogus_list_url))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Pagination-Limit'], '3')
+        self.assertEqual(response['X-Pagination-Count'], '2')
+        self.assertEqual(len(response.json()['results']), 3)
+
+    @patch.object(HALPagination, 'max_page_size', 4)
+    def test_pagination_with_page_size_above_maximum(self):
+        response = self.api_client.get('{}?paginagrootte=1000'.format(self.catalogus_list_url))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Pagination-Limit'], '4')
+        self.assertEqual(len(response.json()['results']), 4)
+
+    @patch.object(HALPagination, 'chunk_size', 2)
+    def test_pagination_in_chunks(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.api_client.get('{}?paginagrootte=10'.format(self.catalogus_list_url))
+        self.assertEqual(response.status_code, 200)
+
+        rsins = [catalogus['rsin'] for catalogus in response.json()['results']]
+        self.assertEqual(rsins, ['000000001', '222222222', '333333333', '444444444', '555555555'])
+
+        # Each chunk of 2 catalogussen is fetched separately.
+        queries = [
+            query['sql'] for query in context.captured_queries
+            if 'FROM "datamodel_catalogus"' in query['sql'] and 'LIMIT' in query['sql']
+        ]
+        self.assertEqual(len(queries), 3)
+
+    def walk_cursor_pages(self, url):
+        rsins = []
+        while url:
+            response = self.api_client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertFalse('X-Total-Count' in response)
+            self.assertEqual(response['X-Pagination-Limit'], '2')
+
+            data = response.json()
+            self.assertFalse('last' in data['_links'])
+            rsins.extend(catalogus['rsin'] for catalogus in data['results'])
+            url = data['_links'].get('next', {}).get('href')
+        return rsins
+
+    def test_pagination_using_cursor(self):
+        rsins = self.walk_cursor_pages('{}?cursor='.format(self.catalogus_list_url))
+
+        self.assertEqual(rsins, ['000000001', '222222222', '333333333', '444444444', '555555555'])
+
+    def test_pagination_using_cursor_with_ordering(self):
+        rsins = self.walk_cursor_pages('{}?sorteer=-rsin&cursor='.format(self.catalogus_list_url))
+
+        self.assertEqual(rsins, ['555555555', '444444444', '333333333', '222222222', '000000001'])
+
+    def test_pagination_using_cursor_backwards(self):
+        first_page = self.api_client.get('{}?cursor='.format(self.catalogus_list_url)).json()
+        self.assertFalse('prev' in first_page['_links'])
+
+        second_page = self.api_client.get(first_page['_links']['next']['href']).json()
+        self.assertEqual(second_page['_links']['first']['href'], 'http://testserver/api/v1/catalogussen/?cursor=')
+
+        previous_page = self.api_client.get(second_page['_links']['prev']['href']).json()
+        self.assertEqual(previous_page['results'], first_page['results'])
+        self.assertTrue('next' in previous_page['_links'])
+        self.assertFalse('prev' in previous_page['_links'])
+
+    def test_pagination_using_invalid_cursor(self):
+        response = self.api_client.get('{}?cursor=invalid'.format(self.catalogus_list_url))
+
+        self.assertEqual(response.status_code, 404)
+
+    @patch.object(HALPagination, 'count_strategy', 'cached')
+    def test_pagination_with_cached_count(self):
+        self.api_client.get(self.catalogus_list_url)
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.api_client.get('{}?pagina=2'.format(self.catalogus_list_url))
+
+        self.assertEqual(response['X-Total-Count'], '5')
+        self.assertFalse(any('COUNT(*)' in query['sql'] for query in context.captured_queries))
+
+        # The count is invalidated with the catalogussen.
+        CatalogusFactory.create()
+        response = self.api_client.get('{}?pagina=2'.format(self.catalogus_list_url))
+
+        self.assertEqual(response['X-Total-Count'], '6')
+        self.assertEqual(response['X-Pagination-Count'], '3')
+
+    def test_pagination_headers_of_cached_response(self):
+        url = '{}?pagina=2'.format(self.catalogus_list_url)
+        response = self.api_client.get(url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+
+        cached_response = self.api_client.get(url)
+        self.assertEqual(cached_response['X-Cache'], 'HIT')
+        for header in ('X-Total-Count', 'X-Pagination-Count', 'X-Pagination-Page', 'X-Pagination-Limit'):
+            self.assertEqual(cached_response[header], response[header], header)
+        self.assertEqual(cached_response['X-Pagination-Page'], '2')
+
+        # The first request compresses the cached response, the second gets the cached compressed variant.
+        self.api_client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        compressed_response = self.api_client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(compressed_response['Content-Encoding'], 'gzip')
+        self.assertEqual(compressed_response['X-Total-Count'], '5')
+
+    @patch.object(HALPagination, 'count_strategy', 'estimated')
+    @patch('ztc.api.utils.pagination.get_count_estimate', return_value=100000)
+    def test_pagination_with_estimated_count(self, get_count_estimate):
+        rsins = []
+        url = self.catalogus_list_url
+        while url:
+            response = self.api_client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response['X-Total-Count-Estimate'], '100000')
+            self.assertFalse('X-Total-Count' in response)
+            self.assertFalse('X-Pagination-Count' in response)
+
+            data = response.json()
+            self.assertFalse('last' in data['_links'])
+            rsins.extend(catalogus['rsin'] for catalogus in data['results'])
+            url = data['_links'].get('next', {}).get('href')
+
+        # The pages end with the results, not with the estimate.
+        self.assertEqual(rsins, ['000000001', '222222222', '333333333', '444444444', '555555555'])
+
 
 class CachingTests(APITestCase):
     """Section 2.6.9 of the DSO: API strategy"""
 
-    @skip('This API does not implement caching yet.')
+    def test_etag_response_header(self):
+        response = self.api_client.get(self.catalogus_detail_url)
+        self.assertEqual(response.status_code, 200)
+
+        etag = response['ETag']
+        self.assertTrue(etag.startswith('"') and etag.endswith('"'))
+
+        # The ETag is stable as long as nothing changes.
+        response = self.api_client.get(self.catalogus_detail_url)
+        self.assertEqual(response['ETag'], etag)
+
+        # It depends on the query parameters.
+        response = self.api_client.get(self.catalogus_detail_url, {'fields': 'rsin'})
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_if_none_match_request_header(self):
+        response = self.api_client.get(self.catalogus_list_url)
+        etag = response['ETag']
+
+        with patch.object(CatalogusViewSet, 'get_serializer') as get_serializer:
+            response = self.api_client.get(self.catalogus_list_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+        get_serializer.assert_not_called()
+
+    def test_etag_changes_with_catalogus(self):
+        zaaktype = ZaakTypeFactory.create(maakt_deel_uit_van=self.catalogus)
+        zaaktype_list_url = reverse('api:zaaktype-list', kwargs={
+            'version': self.API_VERSION,
+            'catalogus_pk': self.catalogus.pk,
+        })
+        etag = self.api_client.get(zaaktype_list_url)['ETag']
+
+        # A change in another catalogus has no effect.
+        ZaakTypeFactory.create(maakt_deel_uit_van=CatalogusFactory.create())
+        response = self.api_client.get(zaaktype_list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        StatusTypeFactory.create(is_van=zaaktype)
+        response = self.api_client.get(zaaktype_list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_etag_changes_with_catalogus_list(self):
+        etag = self.api_client.get(self.catalogus_list_url)['ETag']
+
+        CatalogusFactory.create()
+
+        response = self.api_client.get(self.catalogus_list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_response_cache(self):
+        response_cache.reset_counters()
+
+        response = self.api_client.get(self.catalogus_detail_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['X-Cache'], 'MISS')
+
+        cached_response = self.api_client.get(self.catalogus_detail_url)
+        self.assertEqual(cached_response.status_code, 200)
+        self.assertEqual(cached_response['X-Cache'], 'HIT')
+        self.assertEqual(cached_response['ETag'], response['ETag'])
+        self.assertEqual(cached_response.json(), response.json())
+
+        self.assertEqual(response_cache.get_counters(), {'hits': 1, 'misses': 1})
+
+    def test_response_cache_normalizes_query_params(self):
+        self.api_client.get(self.catalogus_detail_url, {'fields': 'rsin,domein'})
+
+        response = self.api_client.get(self.catalogus_detail_url, {'fields': 'domein,rsin,rsin'})
+        self.assertEqual(response['X-Cache'], 'HIT')
+        self.assertEqual(set(response.json()), {'rsin', 'domein'})
+
+    def test_response_cache_invalidated_per_catalogus(self):
+        zaaktype = ZaakTypeFactory.create(maakt_deel_uit_van=self.catalogus)
+        zaaktype_list_url = reverse('api:zaaktype-list', kwargs={
+            'version': self.API_VERSION,
+            'catalogus_pk': self.catalogus.pk,
+        })
+        self.api_client.get(zaaktype_list_url)
+
+        # A change in another catalogus has no effect.
+        ZaakTypeFactory.create(maakt_deel_uit_van=CatalogusFactory.create())
+        response = self.api_client.get(zaaktype_list_url)
+        self.assertEqual(response['X-Cache'], 'HIT')
+
+        StatusTypeFactory.create(is_van=zaaktype)
+        response = self.api_client.get(zaaktype_list_url)
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(len(response.json()['results'][0]['heeftStatustype']), 1)
+
     def test_last_modified_response_header(self):
         """DSO: API-47 (last modified response header)"""
-        pass
+        response = self.api_client.get(self.catalogus_detail_url)
+        self.assertEqual(response.status_code, 200)
+
+        catalogus = Catalogus.objects.get(pk=self.catalogus.pk)
+        self.assertEqual(response['Last-Modified'], http_date(timegm(catalogus.laatst_gewijzigd.utctimetuple())))
+
+        # A change in a nested object changes the modification time of the catalogus as well.
+        later = timezone.now() + timedelta(minutes=5)
+        with patch('django.utils.timezone.now', return_value=later):
+            StatusTypeFactory.create(is_van=ZaakTypeFactory.create(maakt_deel_uit_van=self.catalogus))
+
+        response = self.api_client.get(self.catalogus_detail_url)
+        self.assertEqual(response['Last-Modified'], http_date(timegm(later.utctimetuple())))
+
+        # Removed catalogussen can not be detected by their modification time.
+        response = self.api_client.get(self.catalogus_list_url)
+        self.assertNotIn('Last-Modified', response)
 
-    @skip('This API does not implement caching yet.')
     def test_is_modified_since_request_header(self):
         """DSO: API-47 (is modified since request header)"""
-        pass
+        zaaktype = ZaakTypeFactory.create(maakt_deel_uit_van=self.catalogus)
+        zaaktype_list_url = reverse('api:zaaktype-list', kwargs={
+            'version': self.API_VERSION,
+            'catalogus_pk': self.catalogus.pk,
+        })
+        last_modified = self.api_client.get(zaaktype_list_url)['Last-Modified']
+
+        with patch.object(ZaakTypeViewSet, 'get_serializer') as get_serializer:
+            response = self.api_client.get(zaaktype_list_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['Last-Modified'], last_modified)
+        get_serializer.assert_not_called()
+
+        with patch('django.utils.timezone.now', return_value=timezone.now() + timedelta(minutes=5)):
+            zaaktype.delete()
+
+        response = self.api_client.get(zaaktype_list_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['results'], [])
 
 
 class RateLimitTests(APITestCase):
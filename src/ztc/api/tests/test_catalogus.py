@@ -19,6 +19,7 @@ class CatalogusAPITests(APITestCase):
         response = self.api_client.get(self.catalogus_detail_url)
         self.assertEqual(response.status_code, 200)
 
+        self.catalogus.refresh_from_db()
         expected = {
             'domein': self.catalogus.domein,
             'url': 'http://testserver{}'.format(self.catalogus_detail_url),
@@ -28,7 +29,8 @@ class CatalogusAPITests(APITestCase):
             'contactpersoonBeheerEmailadres': self.catalogus.contactpersoon_beheer_emailadres,
             'bestaatuitInformatieobjecttype': [],
             'bestaatuitZaaktype': [],
-            'bestaatuitBesluittype': []
+            'bestaatuitBesluittype': [],
+            'revisie': self.catalogus.revisie,
         }
         self.assertEqual(response.json(), expected)
 
@@ -0,0 +1,20 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from ..checks import check_filter_indexes
+from ..views import ZaakTypeViewSet
+
+
+class FilterIndexCheckTests(SimpleTestCase):
+
+    def test_filter_fields_indexed(self):
+        self.assertEqual(check_filter_indexes(None), [])
+
+    def test_filter_field_without_index(self):
+        with patch.object(ZaakTypeViewSet, 'get_filter_fields', return_value=['doel']):
+            warnings = check_filter_indexes(None)
+
+        self.assertEqual([warning.id for warning in warnings], ['api.W001'])
+        self.assertEqual(warnings[0].obj, ZaakTypeViewSet)
+        self.assertIn("['maakt_deel_uit_van', 'doel']", warnings[0].hint)
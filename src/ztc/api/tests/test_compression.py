@@ -0,0 +1,91 @@
+import gzip
+import json
+from unittest.mock import patch
+
+from django.test import RequestFactory, SimpleTestCase
+
+from ..utils import compression
+from ..utils.caching import response_cache
+from ..utils.compression import get_accepted_encoding
+from .base import APITestCase
+
+
+class AcceptEncodingTests(SimpleTestCase):
+
+    def get_encoding(self, accept_encoding):
+        return get_accepted_encoding(RequestFactory().get('/', HTTP_ACCEPT_ENCODING=accept_encoding))
+
+    @patch.object(compression, 'brotli', None)
+    def test_gzip(self):
+        self.assertEqual(self.get_encoding('gzip'), 'gzip')
+        self.assertEqual(self.get_encoding('deflate, gzip;q=0.5'), 'gzip')
+        self.assertEqual(self.get_encoding('*'), 'gzip')
+        self.assertEqual(self.get_encoding('br'), None)
+
+    def test_not_accepted(self):
+        self.assertEqual(self.get_encoding(''), None)
+        self.assertEqual(self.get_encoding('identity'), None)
+        self.assertEqual(self.get_encoding('gzip;q=0'), None)
+        self.assertEqual(self.get_encoding('gzip;q=0, br;q=0'), None)
+
+    def test_quality(self):
+        self.assertEqual(self.get_encoding('br;q=0.5, gzip;q=0.8'), 'gzip')
+
+
+@patch.object(compression, 'COMPRESSION_MIN_LENGTH', 0)
+@patch.object(compression, 'brotli', None)
+class CompressionAPITests(APITestCase):
+
+    def test_gzip(self):
+        response = self.api_client.get(self.catalogus_detail_url)
+        compressed_response = self.api_client.get(self.catalogus_detail_url, HTTP_ACCEPT_ENCODING='gzip')
+
+        self.assertEqual(compressed_response.status_code, 200)
+        self.assertEqual(compressed_response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', compressed_response['Vary'])
+        self.assertEqual(gzip.decompress(compressed_response.content), response.content)
+
+        self.assertNotIn('Content-Encoding', response)
+        self.assertIn('Accept-Encoding', response['Vary'])
+
+    def test_etag_per_encoding(self):
+        etag = self.api_client.get(self.catalogus_detail_url)['ETag']
+        compressed_etag = self.api_client.get(self.catalogus_detail_url, HTTP_ACCEPT_ENCODING='gzip')['ETag']
+        self.assertNotEqual(compressed_etag, etag)
+
+        response = self.api_client.get(
+            self.catalogus_detail_url, HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=compressed_etag)
+        self.assertEqual(response.status_code, 304)
+
+        response = self.api_client.get(self.catalogus_detail_url, HTTP_IF_NONE_MATCH=compressed_etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_compressed_once(self):
+        response_cache.reset_counters()
+
+        with patch('ztc.api.utils.caching.compress', wraps=compression.compress) as compress:
+            response = self.api_client.get(self.catalogus_detail_url, HTTP_ACCEPT_ENCODING='gzip')
+            cached_response = self.api_client.get(self.catalogus_detail_url, HTTP_ACCEPT_ENCODING='gzip')
+
+        self.assertEqual(compress.call_count, 1)
+        self.assertEqual(cached_response['X-Cache'], 'HIT')
+        self.assertEqual(cached_response['Content-Encoding'], 'gzip')
+        self.assertEqual(cached_response.content, response.content)
+        self.assertEqual(cached_response['ETag'], response['ETag'])
+        self.assertEqual(response_cache.get_counters(), {'hits': 1, 'misses': 1})
+
+    def test_cached_response_compressed_on_hit(self):
+        response = self.api_client.get(self.catalogus_detail_url)
+
+        compressed_response = self.api_client.get(self.catalogus_detail_url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(compressed_response['X-Cache'], 'HIT')
+        self.assertEqual(compressed_response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(compressed_response.content), response.content)
+
+    def test_streaming(self):
+        response = self.api_client.get(
+            self.catalogus_list_url, HTTP_ACCEPT='application/x-ndjson', HTTP_ACCEPT_ENCODING='gzip')
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        content = gzip.decompress(b''.join(response.streaming_content)).decode('utf-8')
+        self.assertEqual([json.loads(line)['rsin'] for line in content.splitlines()], ['000000001'])
@@ -0,0 +1,82 @@
+import json
+from unittest.mock import patch
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ztc.datamodel.tests.factories import (
+    CatalogusFactory, StatusTypeFactory, ZaakTypeFactory
+)
+
+from ..views import CatalogusViewSet
+from .base import APITestCase
+
+
+class ExportAPITests(APITestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        self.zaaktype = ZaakTypeFactory.create(maakt_deel_uit_van=self.catalogus)
+        self.statustype = StatusTypeFactory.create(is_van=self.zaaktype)
+
+        self.export_url = reverse('api:catalogus-export', kwargs={
+            'version': self.API_VERSION,
+            'pk': self.catalogus.pk,
+        })
+
+    def get_url(self, view_name, **kwargs):
+        return 'http://testserver{}'.format(reverse(view_name, kwargs=dict(version=self.API_VERSION, **kwargs)))
+
+    def get_export(self):
+        response = self.api_client.get(self.export_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return json.loads(b''.join(response.streaming_content).decode('utf-8'))
+
+    def test_export(self):
+        data = self.get_export()
+
+        self.assertEqual(data['catalogus']['url'], self.get_url('api:catalogus-detail', pk=self.catalogus.pk))
+        self.assertEqual(
+            [zaaktype['url'] for zaaktype in data['zaaktypen']],
+            [self.get_url('api:zaaktype-detail', catalogus_pk=self.catalogus.pk, pk=self.zaaktype.pk)]
+        )
+        self.assertEqual(
+            [statustype['url'] for statustype in data['statustypen']],
+            [self.get_url(
+                'api:statustype-detail',
+                catalogus_pk=self.catalogus.pk, zaaktype_pk=self.zaaktype.pk, pk=self.statustype.pk
+            )]
+        )
+        self.assertEqual(data['besluittypen'], [])
+
+    def test_export_excludes_other_catalogussen(self):
+        StatusTypeFactory.create(is_van__maakt_deel_uit_van=CatalogusFactory.create())
+
+        data = self.get_export()
+
+        self.assertEqual(len(data['zaaktypen']), 1)
+        self.assertEqual(len(data['statustypen']), 1)
+
+    @patch.object(CatalogusViewSet, 'export_chunk_size', 2)
+    def test_export_in_chunks(self):
+        StatusTypeFactory.create_batch(4, is_van=self.zaaktype)
+
+        with CaptureQueriesContext(connection) as queries:
+            data = self.get_export()
+
+        self.assertEqual(len(data['statustypen']), 5)
+        chunk_queries = [
+            query for query in queries.captured_queries
+            if query['sql'].startswith('SELECT') and 'FROM "datamodel_statustype"' in query['sql']
+            and '"datamodel_statustype"."id" IN' in query['sql']
+        ]
+        self.assertEqual(len(chunk_queries), 3)
+
+    def test_export_not_modified(self):
+        response = self.api_client.get(self.export_url)
+
+        response = self.api_client.get(self.export_url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
@@ -0,0 +1,63 @@
+import json
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.urls import reverse
+
+from ztc.datamodel.models import Catalogus, StatusType, ZaakType
+from ztc.datamodel.tests.factories import StatusTypeFactory, ZaakTypeFactory
+
+from .base import APITestCase
+
+
+class LoadCatalogusTests(APITestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        self.zaaktype = ZaakTypeFactory.create(maakt_deel_uit_van=self.catalogus)
+        StatusTypeFactory.create_batch(3, is_van=self.zaaktype)
+
+    def get_export(self):
+        url = reverse('api:catalogus-export', kwargs={'version': self.API_VERSION, 'pk': self.catalogus.pk})
+        response = self.api_client.get(url)
+        return json.loads(b''.join(response.streaming_content).decode('utf-8'))
+
+    def load(self, data, suffix='.json'):
+        with tempfile.NamedTemporaryFile('w', suffix=suffix, encoding='utf-8') as f:
+            f.write(data)
+            f.flush()
+            call_command('load_catalogus', f.name, stdout=StringIO(), stderr=StringIO())
+
+    def test_load_export(self):
+        data = self.get_export()
+        self.catalogus.delete()
+
+        self.load(json.dumps(data))
+
+        catalogus = Catalogus.objects.get()
+        self.assertEqual((catalogus.domein, catalogus.rsin), ('ABCDE', '000000001'))
+        zaaktype = ZaakType.objects.get(maakt_deel_uit_van=catalogus)
+        self.assertEqual(zaaktype.zaaktype_omschrijving, self.zaaktype.zaaktype_omschrijving)
+        self.assertEqual(StatusType.objects.filter(is_van=zaaktype).count(), 3)
+
+    def test_load_ndjson(self):
+        data = self.get_export()
+        self.catalogus.delete()
+
+        lines = [json.dumps({'catalogus': data.pop('catalogus')})] + [
+            json.dumps({section: obj}) for section, objects in data.items() for obj in objects
+        ]
+        self.load('\n'.join(lines), suffix='.ndjson')
+
+        self.assertEqual(StatusType.objects.filter(is_van__maakt_deel_uit_van__domein='ABCDE').count(), 3)
+
+    def test_load_invalid(self):
+        data = self.get_export()
+        self.catalogus.delete()
+        data['zaaktypen'][0]['einddatumObject'] = '1900-01-01'
+
+        with self.assertRaisesMessage(CommandError, 'Datum einde geldigheid is gelijk aan of gelegen na'):
+            self.load(json.dumps(data))
+        self.assertFalse(Catalogus.objects.exists())
@@ -0,0 +1,110 @@
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from oauth2_provider.models import AccessToken, Application
+
+from ..utils.oauth2 import OAuth2Validator, token_cache
+from .base import APITestCase
+
+
+class TokenCacheTests(APITestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        token_cache.clear_local()
+        self.addCleanup(token_cache.clear_local)
+
+    def get_token_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.api_client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return [query for query in queries.captured_queries if 'oauth2_provider_accesstoken' in query['sql']]
+
+    def test_no_queries_for_cached_token(self):
+        self.assertEqual(len(self.get_token_queries(self.catalogus_detail_url)), 1)
+
+        self.assertEqual(self.get_token_queries(self.catalogus_detail_url), [])
+        self.assertEqual(self.get_token_queries(self.catalogus_list_url), [])
+
+    def test_token_from_shared_cache(self):
+        self.get_token_queries(self.catalogus_detail_url)
+        token_cache.clear_local()
+
+        self.assertEqual(self.get_token_queries(self.catalogus_detail_url), [])
+
+    def test_cached_fields(self):
+        user = get_user_model().objects.create_user('client', password='secret')
+        AccessToken.objects.filter(pk=self.token.pk).update(user=user)
+        self.get_token_queries(self.catalogus_detail_url)
+
+        values = token_cache.cache.get(token_cache.get_key(self.token.token), version=token_cache.version)
+        self.assertEqual(values, {
+            'id': self.token.pk,
+            'expires': self.token.expires,
+            'scope': 'write read',
+            'application_id': None,
+            'user_id': user.pk,
+        })
+
+    def test_user_of_cached_token(self):
+        user = get_user_model().objects.create_user('client', password='secret')
+        AccessToken.objects.filter(pk=self.token.pk).update(user=user)
+        self.get_token_queries(self.catalogus_detail_url)
+
+        request = Mock()
+        with CaptureQueriesContext(connection) as queries:
+            self.assertTrue(OAuth2Validator().validate_bearer_token(self.token.token, ['read'], request))
+        self.assertEqual(len(queries), 0)
+
+        self.assertEqual(request.user.pk, user.pk)
+        self.assertEqual(request.access_token.pk, self.token.pk)
+
+    def test_expired_token(self):
+        self.get_token_queries(self.catalogus_detail_url)
+
+        with patch('django.utils.timezone.now', return_value=self.token.expires + timedelta(seconds=1)):
+            response = self.api_client.get(self.catalogus_detail_url)
+        self.assertEqual(response.status_code, 401)
+
+    def test_deleted_token(self):
+        self.get_token_queries(self.catalogus_detail_url)
+
+        self.token.delete()
+
+        response = self.api_client.get(self.catalogus_detail_url)
+        self.assertEqual(response.status_code, 401)
+
+    def test_revoked_token(self):
+        application = Application.objects.create(
+            client_type=Application.CLIENT_CONFIDENTIAL,
+            authorization_grant_type=Application.GRANT_CLIENT_CREDENTIALS,
+        )
+        AccessToken.objects.filter(pk=self.token.pk).update(application=application)
+        self.get_token_queries(self.catalogus_detail_url)
+
+        response = self.client.post(reverse('oauth2_provider:revoke-token'), {
+            'token': self.token.token,
+            'client_id': application.client_id,
+            'client_secret': application.client_secret,
+        }, secure=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(AccessToken.objects.filter(pk=self.token.pk).exists())
+
+        response = self.api_client.get(self.catalogus_detail_url)
+        self.assertEqual(response.status_code, 401)
+
+    def test_changed_token(self):
+        self.get_token_queries(self.catalogus_detail_url)
+
+        self.token.expires = timezone.now() - timedelta(seconds=1)
+        self.token.save()
+
+        response = self.api_client.get(self.catalogus_detail_url)
+        self.assertEqual(response.status_code, 401)
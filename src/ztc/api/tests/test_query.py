@@ -0,0 +1,133 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ztc.datamodel.models import Catalogus
+from ztc.datamodel.tests.factories import (
+    EigenschapFactory, StatusTypeFactory, ZaakTypeFactory
+)
+
+from ..serializers import CatalogusSerializer, ZaakTypeSerializer
+from ..utils.query import QueryPlan
+from ..utils.rest_flex_fields import (
+    EXPAND_ALL_VALUE, EXPAND_PARAM, FIELDS_PARAM
+)
+from .base import APITestCase
+
+
+class QueryPlanTests(TestCase):
+
+    def test_zaaktype_plan(self):
+        plan = QueryPlan.for_serializer(ZaakTypeSerializer())
+
+        # The catalogus is only linked to, which only needs the foreign key.
+        self.assertNotIn('maakt_deel_uit_van', plan.select_related)
+        self.assertIn('referentieproces', plan.select_related)
+        self.assertIn('product_dienst', plan.prefetches)
+        self.assertIn('statustype_set', plan.prefetches)
+        # The URL of a statustype only needs the foreign keys of its zaaktype.
+        self.assertEqual(plan.prefetches['statustype_set'].select_related, {'is_van'})
+
+    def test_sparse_fields_plan(self):
+        serializer_class = type('SparseCatalogusSerializer', (CatalogusSerializer, ), {'include_fields': ['rsin']})
+        plan = QueryPlan.for_serializer(serializer_class())
+
+        self.assertEqual(plan.select_related, set())
+        self.assertEqual(len(plan.prefetches), 0)
+        self.assertEqual(plan.get_only(), ['rsin'])
+
+    def test_sparse_fields_prefetch_plan(self):
+        serializer_class = type('SparseCatalogusSerializer', (CatalogusSerializer, ), {
+            'include_fields': ['url', 'bestaatuitZaaktype']
+        })
+        plan = QueryPlan.for_serializer(serializer_class())
+
+        self.assertEqual(plan.get_only(), [])
+        # Only the foreign key is needed to build the URLs of the zaaktypen.
+        self.assertEqual(plan.prefetches['zaaktype_set'].get_only(), ['maakt_deel_uit_van'])
+
+    def test_expanded_plan(self):
+        serializer_class = type('ExpandedCatalogusSerializer', (CatalogusSerializer, ), {
+            'expand': ['bestaatuitZaaktype.maaktDeelUitVan']
+        })
+        plan = QueryPlan.for_serializer(serializer_class())
+
+        zaaktype_plan = plan.prefetches['zaaktype_set']
+        self.assertIn('statustype_set', zaaktype_plan.prefetches)
+        self.assertIn('maakt_deel_uit_van', zaaktype_plan.select_related)
+        # The relations of the expanded catalogus of each zaaktype are prefetched through the selected catalogus.
+        self.assertIn('maakt_deel_uit_van__zaaktype_set', zaaktype_plan.prefetches)
+
+    def test_all_fields_plan(self):
+        plan = QueryPlan.for_serializer(ZaakTypeSerializer())
+
+        self.assertIsNone(plan.get_only())
+
+
+class QueryCountTests(APITestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        self.zaaktype_list_url = reverse('api:zaaktype-list', kwargs={
+            'version': self.API_VERSION,
+            'catalogus_pk': self.catalogus.pk,
+        })
+
+    def _create_zaaktype(self):
+        zaaktype = ZaakTypeFactory.create(maakt_deel_uit_van=self.catalogus)
+        # Also creates a ``RolType`` for the ``ZaakType``.
+        StatusTypeFactory.create(is_van=zaaktype)
+        EigenschapFactory.create(is_van=zaaktype)
+
+    def _capture_queries(self, url, params=None):
+        with CaptureQueriesContext(connection) as context:
+            response = self.api_client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return context.captured_queries
+
+    def _count_queries(self, url, params=None):
+        return len(self._capture_queries(url, params))
+
+    def test_zaaktype_list_queries_do_not_depend_on_size(self):
+        self._create_zaaktype()
+        expected = self._count_queries(self.zaaktype_list_url)
+
+        for i in range(5):
+            self._create_zaaktype()
+
+        self.assertEqual(self._count_queries(self.zaaktype_list_url), expected)
+
+    def test_catalogus_detail_queries_do_not_depend_on_size(self):
+        self._create_zaaktype()
+        expected = self._count_queries(self.catalogus_detail_url)
+
+        for i in range(5):
+            self._create_zaaktype()
+
+        self.assertEqual(self._count_queries(self.catalogus_detail_url), expected)
+
+    def test_expanded_catalogus_queries_do_not_depend_on_size(self):
+        for expand in [EXPAND_ALL_VALUE, 'bestaatuitZaaktype.maaktDeelUitVan']:
+            with self.subTest(expand=expand):
+                self._create_zaaktype()
+                params = {EXPAND_PARAM: expand}
+                expected = self._count_queries(self.catalogus_detail_url, params)
+
+                for i in range(5):
+                    self._create_zaaktype()
+
+                self.assertEqual(self._count_queries(self.catalogus_detail_url, params), expected)
+
+    def test_sparse_fields_only_load_used_columns(self):
+        self._create_zaaktype()
+
+        queries = [
+            query['sql'] for query in self._capture_queries(self.catalogus_detail_url, {FIELDS_PARAM: 'rsin'})
+            if Catalogus._meta.db_table in query['sql']
+        ]
+
+        self.assertEqual(len(queries), 1)
+        self.assertIn('"rsin"', queries[0])
+        self.assertNotIn('"domein"', queries[0])
@@ -0,0 +1,159 @@
+"""
+Query budgets for all API routes.
+
+A catalog is grown to several sizes and every route is requested as list, detail, with all expandable fields expanded
+and with a sparse fieldset. The number of queries may never exceed the budget in ``query_budgets.json`` and may never
+grow with the size of the catalog, which is how N+1 queries show up.
+
+Set ``QUERY_BUDGET_SIZES`` (ie. ``1,10``) to test other catalog sizes and ``QUERY_BUDGET_REPORT`` to a file path to
+write the measured query counts and times as JSON.
+"""
+import json
+import os
+from collections import OrderedDict
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ztc.datamodel.tests.factories import (
+    BesluitTypeFactory, EigenschapFactory, InformatieObjectTypeFactory,
+    ResultaatTypeFactory, StatusTypeFactory, ZaakObjectTypeFactory,
+    ZaakTypeFactory
+)
+from ztc.datamodel.tests.factories.relatieklassen import (
+    ZaakInformatieobjectTypeArchiefregimeFactory,
+    ZaakInformatieobjectTypeFactory, ZaakTypenRelatieFactory
+)
+
+from ..urls import catalogus_router, root_router, zaaktype_router
+from ..utils.rest_flex_fields import (
+    EXPAND_ALL_VALUE, EXPAND_PARAM, FIELDS_PARAM
+)
+from .base import APITestCase
+
+BUDGETS_FILE = os.path.join(os.path.dirname(__file__), 'query_budgets.json')
+
+# The URL kwargs (besides the version and the primary key) each router needs.
+ROUTERS = (
+    (root_router, ()),
+    (catalogus_router, ('catalogus_pk', )),
+    (zaaktype_router, ('catalogus_pk', 'zaaktype_pk')),
+)
+
+VARIANTS = OrderedDict([
+    ('list', ('list', {})),
+    ('detail', ('detail', {})),
+    ('expand', ('detail', {EXPAND_PARAM: EXPAND_ALL_VALUE})),
+    ('fields', ('list', {FIELDS_PARAM: 'url'})),
+])
+
+
+def load_budgets():
+    with open(BUDGETS_FILE, 'r') as f:
+        budgets = json.load(f)
+
+    sizes = os.getenv('QUERY_BUDGET_SIZES')
+    if sizes:
+        budgets['sizes'] = [int(size) for size in sizes.split(',')]
+    return budgets
+
+
+class QueryBudgetTests(APITestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        self.budgets = load_budgets()
+        self.zaaktypen = []
+        self.results = OrderedDict()
+
+    def tearDown(self):
+        report = os.getenv('QUERY_BUDGET_REPORT')
+        if report:
+            with open(report, 'w') as f:
+                json.dump(self.results, f, indent=2)
+
+        super().tearDown()
+
+    def grow_catalogus(self, size):
+        """
+        Add zaaktypen, each with one of every related object, until the catalog contains ``size`` zaaktypen.
+        """
+        for i in range(len(self.zaaktypen), size):
+            zaaktype = ZaakTypeFactory.create(maakt_deel_uit_van=self.catalogus)
+            # Also creates a ``RolType`` for the ``ZaakType``.
+            StatusTypeFactory.create(is_van=zaaktype)
+            EigenschapFactory.create(is_van=zaaktype)
+            ZaakObjectTypeFactory.create(is_relevant_voor=zaaktype)
+            ZaakTypenRelatieFactory.create(zaaktype_van=zaaktype, zaaktype_naar=zaaktype)
+
+            informatieobjecttype = InformatieObjectTypeFactory.create(maakt_deel_uit_van=self.catalogus, zaaktypes=None)
+            zaakinformatieobjecttype = ZaakInformatieobjectTypeFactory.create(
+                zaaktype=zaaktype, informatie_object_type=informatieobjecttype)
+            resultaattype = ResultaatTypeFactory.create(
+                is_relevant_voor=zaaktype, bepaalt_afwijkend_archiefregime_van=None)
+            ZaakInformatieobjectTypeArchiefregimeFactory.create(
+                zaak_informatieobject_type=zaakinformatieobjecttype, resultaattype=resultaattype)
+            BesluitTypeFactory.create(
+                maakt_deel_uit_van=self.catalogus, besluittype_omschrijving='Besluittype {}'.format(i),
+                zaaktypes=[zaaktype], is_resultaat_van=[resultaattype])
+
+            self.zaaktypen.append(zaaktype)
+
+    def get_routes(self):
+        """
+        Yield the base name, list URL and detail URL of every route.
+        """
+        zaaktype = self.zaaktypen[0]
+        values = {
+            'version': self.API_VERSION,
+            'catalogus_pk': self.catalogus.pk,
+            'zaaktype_pk': zaaktype.pk,
+        }
+
+        for router, url_kwargs in ROUTERS:
+            for prefix, viewset, base_name in router.registry:
+                kwargs = OrderedDict([('version', self.API_VERSION)])
+                kwargs.update((kwarg, values[kwarg]) for kwarg in url_kwargs)
+
+                queryset = viewset.queryset.model._default_manager.all()
+                for query_param, field_name in getattr(viewset.serializer_class, 'parent_lookup_kwargs', {}).items():
+                    queryset = queryset.filter(**{field_name: values[query_param]})
+                obj = queryset.first()
+
+                yield (
+                    base_name,
+                    reverse('api:{}-list'.format(base_name), kwargs=kwargs),
+                    reverse('api:{}-detail'.format(base_name), kwargs=dict(kwargs, pk=obj.pk)),
+                )
+
+    def measure(self, url, params):
+        with CaptureQueriesContext(connection) as context:
+            response = self.api_client.get(url, params)
+        self.assertEqual(response.status_code, 200, url)
+
+        return len(context), sum(float(query['time']) for query in context.captured_queries)
+
+    def test_query_budgets(self):
+        baseline = {}
+
+        for size in sorted(self.budgets['sizes']):
+            self.grow_catalogus(size)
+
+            for base_name, list_url, detail_url in self.get_routes():
+                budgets = self.budgets['budgets'][base_name]
+
+                for variant, (action, params) in VARIANTS.items():
+                    url = list_url if action == 'list' else detail_url
+                    num_queries, query_time = self.measure(url, params)
+
+                    self.results.setdefault(base_name, OrderedDict()).setdefault(variant, OrderedDict())[size] = {
+                        'queries': num_queries,
+                        'time': query_time,
+                    }
+
+                    with self.subTest(route=base_name, variant=variant, size=size):
+                        self.assertLessEqual(num_queries, budgets[variant])
+                        # The number of queries should not depend on the amount of data.
+                        self.assertEqual(num_queries, baseline.setdefault((base_name, variant), num_queries))
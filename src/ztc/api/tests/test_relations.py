@@ -0,0 +1,71 @@
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from ztc.datamodel.models import StatusType, ZaakType
+from ztc.datamodel.tests.factories import StatusTypeFactory, ZaakTypeFactory
+
+from ..utils.relations import get_lookup_attrs, url_template_cache
+from .base import APITestCase
+
+
+class LookupAttrsTests(TestCase):
+
+    def test_primary_key(self):
+        self.assertEqual(get_lookup_attrs(ZaakType, 'pk'), ('pk', ))
+
+    def test_foreign_key(self):
+        self.assertEqual(get_lookup_attrs(ZaakType, 'maakt_deel_uit_van__pk'), ('maakt_deel_uit_van_id', ))
+
+    def test_nested_foreign_key(self):
+        self.assertEqual(
+            get_lookup_attrs(StatusType, 'is_van__maakt_deel_uit_van__pk'), ('is_van', 'maakt_deel_uit_van_id'))
+
+    def test_other_field(self):
+        self.assertEqual(get_lookup_attrs(ZaakType, 'maakt_deel_uit_van__rsin'), ('maakt_deel_uit_van', 'rsin'))
+
+
+class URLTemplateTests(APITestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        self.zaaktype = ZaakTypeFactory.create(maakt_deel_uit_van=self.catalogus)
+        self.statustype = StatusTypeFactory.create(is_van=self.zaaktype)
+
+        self.zaaktype_detail_url = reverse('api:zaaktype-detail', kwargs={
+            'version': self.API_VERSION,
+            'catalogus_pk': self.catalogus.pk,
+            'pk': self.zaaktype.pk,
+        })
+
+    def test_urls_match_reverse(self):
+        response = self.api_client.get(self.zaaktype_detail_url)
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+        self.assertEqual(data['url'], 'http://testserver{}'.format(self.zaaktype_detail_url))
+        self.assertEqual(data['maaktDeelUitVan'], 'http://testserver{}'.format(self.catalogus_detail_url))
+        self.assertEqual(data['heeftStatustype'], ['http://testserver{}'.format(reverse('api:statustype-detail', kwargs={
+            'version': self.API_VERSION,
+            'catalogus_pk': self.catalogus.pk,
+            'zaaktype_pk': self.zaaktype.pk,
+            'pk': self.statustype.pk,
+        }))])
+
+    def test_templates_are_reused(self):
+        url_template_cache.clear()
+        self.api_client.get(self.zaaktype_detail_url)
+
+        with mock.patch('ztc.api.utils.relations.reverse') as mock_reverse:
+            response = self.api_client.get(self.zaaktype_detail_url)
+
+        self.assertEqual(response.status_code, 200)
+        mock_reverse.assert_not_called()
+
+    @override_settings(ALLOWED_HOSTS=['testserver', 'example.com'])
+    def test_templates_per_host(self):
+        response = self.api_client.get(self.zaaktype_detail_url, HTTP_HOST='example.com')
+
+        self.assertEqual(response.json()['url'], 'http://example.com{}'.format(self.zaaktype_detail_url))
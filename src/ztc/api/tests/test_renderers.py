@@ -0,0 +1,89 @@
+import timeit
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+from unittest import skipIf
+from unittest.mock import patch
+from uuid import UUID
+
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils.translation import ugettext_lazy as _
+
+from rest_framework import renderers
+
+from ztc.datamodel.tests.base_tests import HaaglandenMixin
+
+from ..utils.renderers import JSONRenderer, orjson
+from .base import BenchmarkMixin, ClientAPITestMixin
+
+
+class JSONRendererTests(SimpleTestCase):
+    """
+    The output is the same as that of the JSON renderer of DRF, whichever encoder is used.
+    """
+    data = OrderedDict([
+        ('url', 'http://testserver/api/v1/catalogussen/1/'),
+        ('omschrijving', 'Één twee "drie"\t\x01'),
+        ('datum', date(2018, 1, 30)),
+        ('tijdstip', datetime(2018, 1, 30, 12, 30, 15, 123456)),
+        ('bedrag', Decimal('1.50')),
+        ('uuid', UUID('6e9a4bc5-8a94-4b5c-8d8b-8f5e0d0e5f46')),
+        ('label', _('Catalogus')),
+        ('lijst', [1, None, True, (2, 3)]),
+        ('leeg', OrderedDict()),
+    ])
+
+    def assertSameOutput(self, data, accepted_media_type=None):
+        self.assertEqual(
+            JSONRenderer().render(data, accepted_media_type),
+            renderers.JSONRenderer().render(data, accepted_media_type),
+        )
+
+    @skipIf(orjson is None, 'orjson is not installed.')
+    def test_orjson(self):
+        self.assertSameOutput(self.data)
+
+    def test_without_orjson(self):
+        with patch('ztc.api.utils.renderers.orjson', None):
+            self.assertSameOutput(self.data)
+
+    def test_standard_library_encoder(self):
+        with patch.object(JSONRenderer, 'encoder', 'json'):
+            self.assertSameOutput(self.data)
+
+    def test_unsupported_by_orjson(self):
+        self.assertSameOutput({1: 'non-string key', 'big': 2 ** 70})
+
+    def test_indent(self):
+        self.assertSameOutput(self.data, 'application/json; indent=4')
+
+    def test_none(self):
+        self.assertEqual(JSONRenderer().render(None), b'')
+
+
+class RenderBenchmarkTests(ClientAPITestMixin, BenchmarkMixin, HaaglandenMixin, TestCase):
+    """
+    Compare the time to render the expanded responses of the Haaglanden catalogus with the JSON renderer of DRF.
+    """
+    def get_data(self, view_name, **kwargs):
+        url = reverse(view_name, kwargs=dict(version='1', **kwargs))
+        response = self.api_client.get('{}?expand=true'.format(url))
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def benchmark(self, name, data):
+        results = {
+            'drf': timeit.timeit(lambda: renderers.JSONRenderer().render(data), number=self.rounds) / self.rounds,
+            'ztc': timeit.timeit(lambda: JSONRenderer().render(data), number=self.rounds) / self.rounds,
+        }
+        self.report(name, results)
+
+        self.assertEqual(JSONRenderer().render(data), renderers.JSONRenderer().render(data))
+
+    def test_render_catalogus(self):
+        self.benchmark('render_catalogus', self.get_data('api:catalogus-detail', pk=self.catalogus.pk))
+
+    def test_render_zaaktype(self):
+        self.benchmark('render_zaaktype', self.get_data(
+            'api:zaaktype-detail', catalogus_pk=self.catalogus.pk, pk=self.zaaktype.pk))
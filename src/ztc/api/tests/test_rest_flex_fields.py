@@ -0,0 +1,165 @@
+import copy
+import importlib
+import timeit
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from ..serializers import (
+    CatalogusSerializer, InformatieObjectTypeSerializer, ZaakTypeSerializer
+)
+from ..utils.rest_flex_fields import (
+    EXPAND_ALL_VALUE, EXPAND_PARAM, FIELDS_PARAM, expandable_fields_registry,
+    field_tree_cache, get_dynamic_serializer_class, normalize_field_names
+)
+from .base import BenchmarkMixin
+
+
+class ExpandableFieldsRegistryTests(SimpleTestCase):
+
+    def test_resolves_serializer_classes(self):
+        expandable_fields = expandable_fields_registry.get(CatalogusSerializer)
+
+        serializer_class, settings = expandable_fields['bestaatuitZaaktype']
+        self.assertIs(serializer_class, ZaakTypeSerializer)
+        self.assertEqual(dict(settings), {'source': 'zaaktype_set', 'many': True})
+
+    def test_settings_are_read_only(self):
+        serializer_class, settings = expandable_fields_registry.get(CatalogusSerializer)['bestaatuitZaaktype']
+
+        with self.assertRaises(TypeError):
+            settings[EXPAND_PARAM] = ['maaktDeelUitVan']
+
+    def test_dynamic_subclasses_share_registration(self):
+        dynamic_class = type('DynamicFieldsModelSerializer', (CatalogusSerializer, ), {'expand': [EXPAND_ALL_VALUE]})
+
+        self.assertIs(expandable_fields_registry.get(dynamic_class), expandable_fields_registry.get(CatalogusSerializer))
+
+    def test_expanding_does_not_import(self):
+        expandable_fields_registry.get(CatalogusSerializer)
+        serializer_class = type('DynamicFieldsModelSerializer', (CatalogusSerializer, ), {'expand': [EXPAND_ALL_VALUE]})
+
+        with mock.patch('ztc.api.utils.rest_flex_fields.importlib.import_module') as import_module:
+            serializer = serializer_class()
+
+        import_module.assert_not_called()
+        self.assertIsInstance(serializer.fields['bestaatuitZaaktype'].child, ZaakTypeSerializer)
+
+    def test_nested_settings_do_not_leak(self):
+        serializer_class = type('DynamicFieldsModelSerializer', (InformatieObjectTypeSerializer, ), {
+            'expand': ['maaktDeeluitVan.bestaatuitZaaktype'],
+            'include_fields': ['maaktDeeluitVan.rsin'],
+        })
+        serializer_class()
+
+        serializer_class, settings = expandable_fields_registry.get(InformatieObjectTypeSerializer)['maaktDeeluitVan']
+        self.assertNotIn(EXPAND_PARAM, settings)
+        self.assertNotIn(FIELDS_PARAM, settings)
+
+
+class FieldTreeCacheTests(SimpleTestCase):
+
+    def test_normalize_field_names(self):
+        self.assertEqual(normalize_field_names(None), ())
+        self.assertEqual(normalize_field_names('url, rsin,url'), ('rsin', 'url'))
+        self.assertEqual(normalize_field_names(['rsin', 'url']), ('rsin', 'url'))
+
+    def test_dynamic_serializer_classes_are_cached(self):
+        serializer_class = get_dynamic_serializer_class(CatalogusSerializer, ('rsin', ), ())
+
+        self.assertIs(get_dynamic_serializer_class(CatalogusSerializer, ('rsin', ), ()), serializer_class)
+        self.assertEqual(serializer_class.include_fields, ('rsin', ))
+        self.assertIsNone(serializer_class.expand)
+
+    def test_fields_are_cached(self):
+        field_tree_cache.clear()
+        serializer_class = get_dynamic_serializer_class(ZaakTypeSerializer, (), ('url', 'omschrijving'))
+
+        with mock.patch.object(ZaakTypeSerializer, 'build_field', wraps=ZaakTypeSerializer().build_field) as build_field:
+            first = serializer_class()
+            self.assertEqual(list(first.fields), ['url', 'omschrijving'])
+            self.assertTrue(build_field.called)
+
+            build_field.reset_mock()
+            second = serializer_class()
+            self.assertEqual(list(second.fields), ['url', 'omschrijving'])
+            build_field.assert_not_called()
+
+        self.assertTrue(first.sparse_fieldset)
+        # Each serializer gets its own copy of the fields.
+        self.assertIsNot(first.fields['url'], second.fields['url'])
+        self.assertIs(first.fields['url'].parent, first)
+        self.assertIs(second.fields['url'].parent, second)
+
+    def test_expanded_fields_are_not_shared(self):
+        serializer_class = get_dynamic_serializer_class(ZaakTypeSerializer, ('maaktDeelUitVan', ), ())
+
+        first, second = serializer_class(), serializer_class()
+
+        self.assertEqual(first.expanded_fields, ['maaktDeelUitVan'])
+        self.assertIsInstance(first.fields['maaktDeelUitVan'], CatalogusSerializer)
+        self.assertIsNot(first.fields['maaktDeelUitVan'], second.fields['maaktDeelUitVan'])
+
+
+class LegacyExpandMixin(object):
+    """
+    The expansion as it was before the registry: copy the settings and import the serializer on every expand.
+    """
+    def _make_expanded_field_serializer(self, name, nested_expands, nested_includes):
+        serializer_class, serializer_settings = self.expandable_fields[name]
+        serializer_settings = copy.deepcopy(serializer_settings)
+
+        if serializer_settings.get('source') == name:
+            del serializer_settings['source']
+
+        if isinstance(serializer_class, str):
+            pieces = serializer_class.split('.')
+            class_name = pieces.pop()
+            if pieces[-1] != 'serializers':
+                pieces.append('serializers')
+            serializer_class = getattr(importlib.import_module('.'.join(pieces)), class_name)
+
+        return serializer_class(**serializer_settings)
+
+
+class ExpandBenchmarkTests(BenchmarkMixin, SimpleTestCase):
+    """
+    Micro-benchmarks of the per-request overhead of creating serializers.
+    """
+    def create_serializer(self, serializer_class, expand=(EXPAND_ALL_VALUE, ), include_fields=()):
+        serializer = get_dynamic_serializer_class(serializer_class, expand, include_fields)()
+        return serializer.fields
+
+    def test_expand_all_overhead(self):
+        rounds = self.rounds
+        legacy_class = type('LegacyCatalogusSerializer', (LegacyExpandMixin, CatalogusSerializer), {})
+
+        # Warm up the registry and the module cache.
+        self.create_serializer(CatalogusSerializer)
+        self.create_serializer(legacy_class)
+
+        results = {
+            'before': timeit.timeit(lambda: self.create_serializer(legacy_class), number=rounds) / rounds,
+            'after': timeit.timeit(lambda: self.create_serializer(CatalogusSerializer), number=rounds) / rounds,
+        }
+
+        self.report('expand_all_overhead', results)
+
+        self.assertEqual(
+            set(self.create_serializer(CatalogusSerializer)), set(self.create_serializer(legacy_class)))
+
+    def test_field_tree_cache(self):
+        def create_uncached():
+            field_tree_cache.clear()
+            return self.create_serializer(ZaakTypeSerializer, expand=())
+
+        def create_cached():
+            return self.create_serializer(ZaakTypeSerializer, expand=())
+
+        results = {
+            'uncached': timeit.timeit(create_uncached, number=self.rounds) / self.rounds,
+            'cached': timeit.timeit(create_cached, number=self.rounds) / self.rounds,
+        }
+        self.report('field_tree_cache', results)
+
+        self.assertEqual(list(create_uncached()), list(create_cached()))
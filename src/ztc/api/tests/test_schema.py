@@ -1,8 +1,14 @@
 import json
+import tempfile
+from io import StringIO
+from unittest.mock import patch
 
+from django.core.management import call_command
 from django.test import TransactionTestCase
 from django.urls import reverse
 
+from .. import schema
+from ..schema import SchemaView
 from .base import ClientAPITestMixin
 
 
@@ -13,6 +19,12 @@ class DocumentationAPITests(ClientAPITestMixin, TransactionTestCase):
         super().setUp()
 
         self.schema_url = reverse('api:api-schema', kwargs={'version': '1'})
+        self.schema_json_url = reverse('api:api-schema-json', kwargs={'version': '1', 'format': '.json'})
+
+        SchemaView.schemas.clear()
+        SchemaView.contents.clear()
+        self.addCleanup(SchemaView.schemas.clear)
+        self.addCleanup(SchemaView.contents.clear)
 
     def test_schema_does_not_contain_flex_serializers(self):
         """
@@ -27,3 +39,64 @@ class DocumentationAPITests(ClientAPITestMixin, TransactionTestCase):
         data = json.loads(response.content.decode('utf-8'))
 
         self.assertFalse('DynamicFieldsModel' in data)
+
+    def test_schema_is_generated_once(self):
+        with patch('ztc.api.schema.generate_schema', wraps=schema.generate_schema) as generate_schema:
+            response = self.api_client.get(self.schema_json_url)
+            self.assertEqual(response.status_code, 200)
+            cached_response = self.api_client.get(self.schema_json_url)
+            self.api_client.get('{}?format=openapi'.format(self.schema_url))
+            self.api_client.get(self.schema_url)
+
+        self.assertEqual(generate_schema.call_count, 1)
+        self.assertEqual(cached_response.content, response.content)
+
+    def test_schema_is_generated_once_for_every_host(self):
+        with patch('ztc.api.schema.generate_schema', wraps=schema.generate_schema) as generate_schema:
+            response = self.api_client.get(self.schema_json_url)
+            other_response = self.api_client.get(self.schema_json_url, HTTP_HOST='ztc.example.com')
+
+        self.assertEqual(generate_schema.call_count, 1)
+        self.assertEqual(other_response.content, response.content)
+        self.assertNotIn('host', json.loads(response.content.decode('utf-8')))
+        self.assertEqual(list(SchemaView.schemas), ['1'])
+
+    def test_schema_etag(self):
+        response = self.api_client.get(self.schema_json_url)
+        etag = response['ETag']
+
+        response = self.api_client.get(self.schema_json_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        response = self.api_client.get(self.schema_json_url.replace('.json', '.yaml'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_schema_etag_per_encoding(self):
+        etag = self.api_client.get(self.schema_json_url)['ETag']
+
+        response = self.api_client.get(self.schema_json_url, HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertNotEqual(response['ETag'], etag)
+
+        compressed_etag = response['ETag']
+        response = self.api_client.get(
+            self.schema_json_url, HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=compressed_etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_schema_from_file(self):
+        with tempfile.TemporaryDirectory() as schema_dir:
+            call_command('generate_schema', output_dir=schema_dir, stdout=StringIO())
+            with open(schema.get_schema_path('1', '.json', schema_dir), 'rb') as f:
+                content = f.read()
+
+            with patch.object(schema, 'SCHEMA_DIR', schema_dir), patch.object(schema, 'generate_schema') as generate_schema:
+                response = self.api_client.get(self.schema_json_url)
+                page_response = self.api_client.get(self.schema_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(page_response.status_code, 200)
+        self.assertEqual(response.content, content)
+        generate_schema.assert_not_called()
+        self.assertNotIn('host', json.loads(content.decode('utf-8')))
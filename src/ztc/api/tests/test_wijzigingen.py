@@ -0,0 +1,102 @@
+from django.urls import reverse
+
+from ztc.datamodel.models import Catalogus, Wijziging
+from ztc.datamodel.tests.factories import (
+    CatalogusFactory, ProductDienstFactory, StatusTypeFactory, ZaakTypeFactory
+)
+
+from .base import APITestCase
+
+
+class WijzigingenAPITests(APITestCase):
+
+    def setUp(self):
+        super().setUp()
+
+        self.zaaktype = ZaakTypeFactory.create(maakt_deel_uit_van=self.catalogus)
+
+        self.wijzigingen_url = reverse('api:catalogus-wijzigingen', kwargs={
+            'version': self.API_VERSION,
+            'pk': self.catalogus.pk,
+        })
+        self.zaaktype_detail_url = 'http://testserver{}'.format(reverse('api:zaaktype-detail', kwargs={
+            'version': self.API_VERSION,
+            'catalogus_pk': self.catalogus.pk,
+            'pk': self.zaaktype.pk,
+        }))
+
+    def get_revisie(self):
+        return Catalogus.objects.values_list('revisie', flat=True).get(pk=self.catalogus.pk)
+
+    def get_wijzigingen(self, sinds_revisie):
+        response = self.api_client.get(self.wijzigingen_url, {'sinds_revisie': sinds_revisie})
+        self.assertEqual(response.status_code, 200)
+        return response.json()['results']
+
+    def test_revisie_in_catalogus(self):
+        response = self.api_client.get(self.catalogus_detail_url)
+
+        self.assertEqual(response.json()['revisie'], self.get_revisie())
+
+    def test_all_changes(self):
+        wijzigingen = self.get_wijzigingen(0)
+
+        self.assertEqual(wijzigingen[0]['soort'], 'aangemaakt')
+        self.assertEqual(wijzigingen[0]['url'], 'http://testserver{}'.format(self.catalogus_detail_url))
+        self.assertIn(self.zaaktype_detail_url, [wijziging['url'] for wijziging in wijzigingen])
+        self.assertEqual(wijzigingen[-1]['revisie'], self.get_revisie())
+
+    def test_changes_since_revisie(self):
+        revisie = self.get_revisie()
+
+        statustype = StatusTypeFactory.create(is_van=self.zaaktype)
+        self.zaaktype.save()
+        ZaakTypeFactory.create(maakt_deel_uit_van=CatalogusFactory.create())
+
+        wijzigingen = self.get_wijzigingen(revisie)
+
+        statustype_detail_url = 'http://testserver{}'.format(reverse('api:statustype-detail', kwargs={
+            'version': self.API_VERSION,
+            'catalogus_pk': self.catalogus.pk,
+            'zaaktype_pk': self.zaaktype.pk,
+            'pk': statustype.pk,
+        }))
+        changes = [(wijziging['soort'], wijziging['url']) for wijziging in wijzigingen]
+        self.assertIn(('aangemaakt', statustype_detail_url), changes)
+        self.assertEqual(changes[-1], ('gewijzigd', self.zaaktype_detail_url))
+        self.assertTrue(all(wijziging['revisie'] > revisie for wijziging in wijzigingen))
+        self.assertTrue(all('/catalogussen/{}/'.format(self.catalogus.pk) in url for soort, url in changes))
+
+    def test_deleted(self):
+        revisie = self.get_revisie()
+
+        self.zaaktype.delete()
+
+        changes = [(wijziging['soort'], wijziging['url']) for wijziging in self.get_wijzigingen(revisie)]
+        self.assertIn(('verwijderd', self.zaaktype_detail_url), changes)
+
+    def test_change_of_embedded_object(self):
+        product_dienst = ProductDienstFactory.create()
+        self.zaaktype.product_dienst.add(product_dienst)
+        revisie = self.get_revisie()
+
+        product_dienst.naam = 'Nieuwe naam'
+        product_dienst.save()
+
+        changes = [(wijziging['soort'], wijziging['url']) for wijziging in self.get_wijzigingen(revisie)]
+        self.assertEqual(changes, [('gewijzigd', self.zaaktype_detail_url)])
+
+    def test_invalid_sinds_revisie(self):
+        response = self.api_client.get(self.wijzigingen_url, {'sinds_revisie': 'a'})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_deleted_catalogus(self):
+        catalogus = CatalogusFactory.create()
+        ZaakTypeFactory.create(maakt_deel_uit_van=catalogus)
+        self.assertTrue(catalogus.wijzigingen.exists())
+
+        catalogus_pk = catalogus.pk
+        catalogus.delete()
+
+        self.assertFalse(Wijziging.objects.filter(catalogus_id=catalogus_pk).exists())
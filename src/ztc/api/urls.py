@@ -37,8 +37,8 @@ API_PREFIX = r'^v(?P<version>\d+)'
 
 
 urlpatterns = [
-    url(r'{}/schema(?P<format>.json|.yaml)$'.format(API_PREFIX), schema_view.without_ui(cache_timeout=None), name='api-schema-json'),
-    url(r'{}/schema/$'.format(API_PREFIX), schema_view.with_ui('redoc', cache_timeout=None), name='api-schema'),
+    url(r'{}/schema(?P<format>.json|.yaml)$'.format(API_PREFIX), schema_view.without_ui(), name='api-schema-json'),
+    url(r'{}/schema/$'.format(API_PREFIX), schema_view.with_ui('redoc'), name='api-schema'),
 
     url('{}/'.format(API_PREFIX), include(root_router.urls)),
     url('{}/'.format(API_PREFIX), include(catalogus_router.urls)),
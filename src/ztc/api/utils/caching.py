@@ -0,0 +1,293 @@
+import hashlib
+from calendar import timegm
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import EmptyResultSet
+from django.db.models import Count, Max, Sum
+from django.http import HttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from rest_framework.renderers import BrowsableAPIRenderer
+
+from ...datamodel.models import Catalogus
+from .compression import (
+    compress, compress_response, get_accepted_encoding, should_compress
+)
+from .geldigheid import is_actueel
+from .rest_flex_fields import (
+    EXPAND_PARAM, FIELDS_PARAM, normalize_field_names
+)
+
+RESPONSE_CACHE = settings.REST_FRAMEWORK_EXT.get('RESPONSE_CACHE', 'default')
+RESPONSE_CACHE_TIMEOUT = settings.REST_FRAMEWORK_EXT.get('RESPONSE_CACHE_TIMEOUT', 60 * 60 * 24)
+
+
+def get_catalogus_state(catalogus_pk=None):
+    """
+    Return a fingerprint that changes whenever anything in the catalogus changes, or in any catalogus if no
+    ``catalogus_pk`` is given, and the time of the last change (or ``None`` if there are no catalogussen).
+
+    Every change increases the revisie of a catalogus. New catalogussen always get a higher primary key than the
+    existing ones, so together with the number of catalogussen, the sum of the primary keys changes whenever
+    catalogussen are added or removed. The time of the last change guards against primary keys that are reused after
+    the database was emptied.
+    """
+    queryset = Catalogus.objects.all()
+    if catalogus_pk is not None:
+        queryset = queryset.filter(pk=catalogus_pk)
+
+    aggregates = queryset.aggregate(
+        count=Count('pk'), pks=Sum('pk'), revisies=Sum('revisie'), laatst_gewijzigd=Max('laatst_gewijzigd'))
+    fingerprint = '{count}-{pks}-{revisies}-{laatst_gewijzigd}'.format(**aggregates)
+    return fingerprint, aggregates['laatst_gewijzigd']
+
+
+def normalize_query_params(query_params):
+    """
+    Return the query parameters as a sorted tuple. Only the last ``expand`` and ``fields`` parameters are used, and
+    their order and duplicates do not matter, so these are normalized.
+    """
+    params = []
+    for name, values in sorted(query_params.lists()):
+        if name in (EXPAND_PARAM, FIELDS_PARAM):
+            values = normalize_field_names(query_params.get(name))
+        params.append((name, tuple(values)))
+    return tuple(params)
+
+
+def get_etag(request, fingerprint):
+    """
+    Return a strong ETag for the response to ``request``, given the fingerprint of the data it shows.
+    """
+    components = [
+        fingerprint,
+        request.build_absolute_uri(request.path),
+        sorted(request.query_params.lists()),
+        request.accepted_media_type,
+        request.version,
+        # Every content coding is a different representation.
+        get_accepted_encoding(request),
+    ]
+    return '"{}"'.format(hashlib.sha1(repr(components).encode('utf-8')).hexdigest())
+
+
+class ResponseCache(object):
+    """
+    Rendered API responses, stored in the Django cache with the given ``alias``.
+
+    The responses are keyed by the fingerprint of the catalogus (or catalogussen) they show. Every change in a catalogus
+    changes its fingerprint, so only the responses of that catalogus are invalidated. Stale responses are never read
+    again and simply expire.
+    """
+    # The headers that are cached with the content, like those of the pagination. The ETag and modification time are
+    # set for every response.
+    cached_headers = (
+        'Allow', 'Vary', 'X-Total-Count', 'X-Total-Count-Estimate', 'X-Pagination-Count', 'X-Pagination-Page',
+        'X-Pagination-Limit',
+    )
+    # The version of the format of the cached responses. Responses cached in another format are not read.
+    version = 2
+
+    def __init__(self, alias, timeout):
+        self.alias = alias
+        self.timeout = timeout
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def get_key(self, request, fingerprint):
+        components = [
+            fingerprint,
+            request.build_absolute_uri(request.path),
+            normalize_query_params(request.query_params),
+            request.accepted_media_type,
+            request.version,
+            # Responses are only shared between clients with the same permissions.
+            getattr(request.auth, 'scope', None),
+        ]
+        return 'response:{}'.format(hashlib.sha1(repr(components).encode('utf-8')).hexdigest())
+
+    def get_variant_key(self, key, encoding):
+        return '{}:{}'.format(key, encoding)
+
+    def get_cached(self, key):
+        return self.cache.get(key, version=self.version)
+
+    def set_cached(self, key, response, content):
+        headers = [(name, response[name]) for name in self.cached_headers if response.has_header(name)]
+        self.cache.set(key, (content, response['Content-Type'], headers), self.timeout, version=self.version)
+
+    def get_response(self, cached):
+        content, content_type, headers = cached
+        response = HttpResponse(content, content_type=content_type)
+        for name, value in headers:
+            response[name] = value
+        return response
+
+    def get(self, key, encoding=None):
+        """
+        Return the cached response for ``key``, compressed with ``encoding`` if that is given and the response is long
+        enough, or ``None`` if there is none.
+
+        The compressed variant is cached as well, so it is only compressed once.
+        """
+        if encoding is not None:
+            cached = self.get_cached(self.get_variant_key(key, encoding))
+            if cached is not None:
+                self.count('hits')
+                response = self.get_response(cached)
+                return compress_response(response, encoding, response.content)
+
+        cached = self.get_cached(key)
+        self.count('hits' if cached is not None else 'misses')
+        if cached is None:
+            return None
+
+        response = self.get_response(cached)
+        if should_compress(response, encoding):
+            self.set_variant(key, response, encoding)
+        return response
+
+    def set(self, key, response, encoding=None):
+        """
+        Cache the (rendered) ``response`` for ``key``. If ``encoding`` is given and the response is long enough, the
+        response is compressed with it and the compressed variant is cached as well.
+        """
+        self.set_cached(key, response, response.content)
+        if should_compress(response, encoding):
+            self.set_variant(key, response, encoding)
+
+    def set_variant(self, key, response, encoding):
+        """
+        Compress ``response`` with ``encoding`` and cache the compressed variant.
+        """
+        content = compress(response.content, encoding)
+        self.set_cached(self.get_variant_key(key, encoding), response, content)
+        compress_response(response, encoding, content)
+
+    def get_count(self, queryset, fingerprint):
+        """
+        Return the number of objects in ``queryset``, which shows (part of) the catalogus with the given fingerprint.
+
+        The count is keyed by the SQL of the queryset, so every filter, search and ordering has its own count.
+        """
+        try:
+            query = queryset.query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+
+        key = 'count:{}'.format(hashlib.sha1(repr([fingerprint, query]).encode('utf-8')).hexdigest())
+        count = self.cache.get(key)
+        if count is None:
+            count = queryset.count()
+            self.cache.set(key, count, self.timeout)
+        return count
+
+    def count(self, counter):
+        key = 'response:{}'.format(counter)
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            # The counter does not exist (yet).
+            self.cache.add(key, 1, None)
+
+    def get_counters(self):
+        counters = self.cache.get_many(['response:hits', 'response:misses'])
+        return OrderedDict(
+            (counter, counters.get('response:{}'.format(counter), 0)) for counter in ('hits', 'misses'))
+
+    def reset_counters(self):
+        self.cache.delete_many(['response:hits', 'response:misses'])
+
+
+response_cache = ResponseCache(RESPONSE_CACHE, RESPONSE_CACHE_TIMEOUT)
+
+
+class ConditionalGetMixin(object):
+    """
+    Add an ``ETag`` and ``Last-Modified`` header to list and detail responses and respond with ``304 Not Modified`` if
+    the client already has the current version, before any object is serialized.
+
+    The ETag is derived from the revisie of the catalogus, instead of from the response body. Any change to the
+    objecttypen in a catalogus, including its nested objects, also updates the modification time of the catalogus.
+    """
+    def get_catalogus_pk(self):
+        """
+        Return the primary key of the catalogus the requested resource(s) are part of, or ``None`` for all catalogussen.
+        """
+        if 'catalogus_pk' in self.kwargs:
+            return self.kwargs['catalogus_pk']
+        if self.queryset.model is Catalogus:
+            return self.kwargs.get(self.lookup_url_kwarg or self.lookup_field)
+        return None
+
+    def get_conditional_response(self, request, handler, *args, **kwargs):
+        catalogus_pk = self.get_catalogus_pk()
+        fingerprint, last_modified = get_catalogus_state(catalogus_pk)
+        if is_actueel(request):
+            # The objects that are valid today change at midnight, without any change in the catalogus.
+            fingerprint = '{}-{}'.format(fingerprint, timezone.localdate())
+            last_modified = None
+        # The pagination uses the fingerprint to cache the number of results.
+        self.catalogus_fingerprint = fingerprint
+
+        etag = get_etag(request, fingerprint)
+        if catalogus_pk is None or last_modified is None:
+            # Removing a catalogus does not change the modification time of the others, only the ETag can tell.
+            last_modified = None
+        else:
+            last_modified = timegm(last_modified.utctimetuple())
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = self.get_response(request, fingerprint, handler, *args, **kwargs)
+
+        if response.status_code in (200, 304):
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified)
+        return response
+
+    def get_response(self, request, fingerprint, handler, *args, **kwargs):
+        """
+        Return the full response, given the fingerprint of the catalogus (or catalogussen) it shows.
+        """
+        return handler(request, *args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        return self.get_conditional_response(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.get_conditional_response(request, super().retrieve, *args, **kwargs)
+
+
+class CacheResponseMixin(ConditionalGetMixin):
+    """
+    Serve list and detail responses from the response cache, if it has the response for the current version of the
+    catalogus. The ``X-Cache`` header tells whether it did (``HIT``) or not (``MISS``).
+    """
+    response_cache = response_cache
+
+    def get_response(self, request, fingerprint, handler, *args, **kwargs):
+        if isinstance(request.accepted_renderer, BrowsableAPIRenderer):
+            # The browsable API shows the current user and CSRF tokens.
+            return super().get_response(request, fingerprint, handler, *args, **kwargs)
+
+        key = self.response_cache.get_key(request, fingerprint)
+        encoding = get_accepted_encoding(request)
+        response = self.response_cache.get(key, encoding)
+        if response is not None:
+            response['X-Cache'] = 'HIT'
+            return response
+
+        response = super().get_response(request, fingerprint, handler, *args, **kwargs)
+        if response.status_code == 200 and not response.streaming:
+            # The response is only rendered after the view returned it.
+            response.add_post_render_callback(lambda response: self.response_cache.set(key, response, encoding))
+        response['X-Cache'] = 'MISS'
+        return response
@@ -0,0 +1,105 @@
+"""
+Compress API responses with the content coding the client prefers: brotli (if it is installed) or gzip.
+
+Compressed variants of cached responses are cached as well, so each response is compressed once per version of the
+catalogus. The ETag includes the content coding, so each variant has its own strong ETag.
+"""
+from collections import OrderedDict
+
+from django.conf import settings
+from django.utils.text import (
+    compress_sequence as gzip_sequence, compress_string
+)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Shorter responses are not worth compressing.
+COMPRESSION_MIN_LENGTH = settings.REST_FRAMEWORK_EXT.get('COMPRESSION_MIN_LENGTH', 200)
+
+
+def brotli_sequence(sequence):
+    compressor = brotli.Compressor()
+    for item in sequence:
+        # Flush every item, so the client gets it right away.
+        yield compressor.process(item) + compressor.flush()
+    yield compressor.finish()
+
+
+def get_encoders():
+    """
+    Return the available content codings, in order of preference, with the functions to compress a string and a
+    sequence.
+    """
+    encoders = OrderedDict()
+    if brotli is not None:
+        encoders['br'] = (brotli.compress, brotli_sequence)
+    encoders['gzip'] = (compress_string, gzip_sequence)
+    return encoders
+
+
+def parse_accept_encoding(value):
+    """
+    Return the content codings in an ``Accept-Encoding`` header with their quality value.
+    """
+    codings = OrderedDict()
+    for part in value.split(','):
+        coding, *params = [piece.strip() for piece in part.split(';')]
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, sep, param_value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(param_value)
+                except ValueError:
+                    quality = 0.0
+        codings[coding.lower()] = quality
+    return codings
+
+
+def get_accepted_encoding(request):
+    """
+    Return the available content coding the client prefers, or ``None`` if it accepts none of them.
+    """
+    codings = parse_accept_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+    encoders = list(get_encoders())
+
+    accepted = []
+    for preference, encoding in enumerate(encoders):
+        quality = codings.get(encoding, codings.get('*', 0.0))
+        if quality > 0:
+            accepted.append((-quality, preference, encoding))
+    if not accepted:
+        return None
+    return min(accepted)[2]
+
+
+def compress(content, encoding):
+    return get_encoders()[encoding][0](content)
+
+
+def compress_response(response, encoding, content=None):
+    """
+    Compress the content of ``response`` with ``encoding``, or replace it with the already compressed ``content``.
+    """
+    if response.streaming:
+        response.streaming_content = get_encoders()[encoding][1](response.streaming_content)
+        del response['Content-Length']
+    else:
+        response.content = compress(response.content, encoding) if content is None else content
+        response['Content-Length'] = str(len(response.content))
+    response['Content-Encoding'] = encoding
+    return response
+
+
+def should_compress(response, encoding):
+    """
+    Return whether ``response`` should be compressed with ``encoding``.
+    """
+    if encoding is None or response.has_header('Content-Encoding'):
+        return False
+    return response.streaming or len(response.content) >= COMPRESSION_MIN_LENGTH
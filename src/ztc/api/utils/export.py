@@ -0,0 +1,65 @@
+from collections.abc import Mapping
+from itertools import islice
+
+from .query import QueryPlan
+
+CHUNK_SIZE = 100
+
+
+def iterate_with_cursor(queryset, chunk_size=CHUNK_SIZE):
+    """
+    Iterate over ``queryset`` with a query per ``chunk_size`` objects.
+
+    The primary keys are read in order with a server-side cursor, and the objects (and their prefetches) are loaded per
+    chunk, so only one chunk is kept in memory regardless of the size of the result.
+    """
+    pks = queryset.values_list('pk', flat=True).iterator()
+    while True:
+        chunk = list(islice(pks, chunk_size))
+        if not chunk:
+            return
+        yield from queryset.filter(pk__in=chunk)
+
+
+def serialize_with_cursor(serializer, queryset, chunk_size=CHUNK_SIZE):
+    """
+    Yield the representation of every object in ``queryset``, as given by ``serializer``.
+    """
+    for obj in iterate_with_cursor(queryset, chunk_size):
+        yield serializer.to_representation(obj)
+
+
+def get_export_sections(catalogus, routers, context, chunk_size=CHUNK_SIZE):
+    """
+    Yield the prefix of every resource nested in ``catalogus`` (as registered with the nested ``routers``) and an
+    iterator over its serialized objects in the catalogus.
+    """
+    for router in routers:
+        for prefix, viewset, basename in router.registry:
+            serializer = viewset.serializer_class(many=True, context=context)
+            lookup = serializer.child.parent_lookup_kwargs['catalogus_pk']
+
+            queryset = viewset.queryset.filter(**{lookup: catalogus.pk})
+            queryset = QueryPlan.for_serializer(serializer).apply(queryset)
+            yield prefix, serialize_with_cursor(serializer.child, queryset, chunk_size)
+
+
+def stream_json(sections, render):
+    """
+    Yield the JSON object with the keys and values in ``sections``, rendered in parts with ``render``.
+
+    A value that is not a mapping is iterated and rendered as a list, one item at a time, so the items do not have to
+    fit in memory.
+    """
+    yield b'{'
+    for i, (key, value) in enumerate(sections):
+        yield (b',' if i else b'') + render(key) + b':'
+        if isinstance(value, Mapping):
+            yield render(value)
+            continue
+
+        yield b'['
+        for j, item in enumerate(value):
+            yield (b',' if j else b'') + render(item)
+        yield b']'
+    yield b'}'
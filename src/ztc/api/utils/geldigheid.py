@@ -0,0 +1,80 @@
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from rest_framework import exceptions, filters
+from rest_framework.compat import coreapi, coreschema
+
+from ...datamodel.geldigheid import filter_geldig_op
+from ...datamodel.models.mixins import GeldigheidMixin
+
+PEILDATUM_PARAM = settings.REST_FRAMEWORK_EXT.get('PEILDATUM_PARAM', 'peildatum')
+ACTUEEL_PARAM = settings.REST_FRAMEWORK_EXT.get('ACTUEEL_PARAM', 'actueel')
+
+
+def is_actueel(request):
+    """
+    Return whether the request asks for the objects that are valid today.
+    """
+    return request.query_params.get(ACTUEEL_PARAM, '').lower() in ('true', '1')
+
+
+class PeildatumFilter(filters.BaseFilterBackend):
+    """
+    Only return the objects that are valid on the date in the ``peildatum`` query param (as ``YYYY-MM-DD``), or today
+    with ``actueel=true``. Models without a period of validity are not filtered.
+    """
+    peildatum_param = PEILDATUM_PARAM
+    actueel_param = ACTUEEL_PARAM
+
+    def get_peildatum(self, request):
+        value = request.query_params.get(self.peildatum_param)
+        if value:
+            try:
+                peildatum = parse_date(value)
+            except ValueError:
+                peildatum = None
+            if peildatum is None:
+                raise exceptions.ValidationError({
+                    self.peildatum_param: ['Geef een geldige datum op, in het formaat JJJJ-MM-DD.'],
+                })
+            return peildatum
+        if is_actueel(request):
+            return timezone.localdate()
+        return None
+
+    def filter_queryset(self, request, queryset, view):
+        if not issubclass(queryset.model, GeldigheidMixin):
+            return queryset
+
+        peildatum = self.get_peildatum(request)
+        if peildatum is None:
+            return queryset
+        return filter_geldig_op(queryset, peildatum)
+
+    def get_schema_fields(self, view):
+        assert coreapi is not None, 'coreapi must be installed to use `get_schema_fields()`'
+        assert coreschema is not None, 'coreschema must be installed to use `get_schema_fields()`'
+        if not issubclass(view.queryset.model, GeldigheidMixin):
+            return []
+        return [
+            coreapi.Field(
+                name=self.peildatum_param,
+                required=False,
+                location='query',
+                schema=coreschema.String(
+                    title='Peildatum',
+                    description='Only return the objects that are valid on this date (YYYY-MM-DD).',
+                    format='date',
+                ),
+            ),
+            coreapi.Field(
+                name=self.actueel_param,
+                required=False,
+                location='query',
+                schema=coreschema.Boolean(
+                    title='Actueel',
+                    description='Only return the objects that are valid today. Ignored if a peildatum is given.',
+                ),
+            ),
+        ]
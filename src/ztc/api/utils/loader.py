@@ -0,0 +1,363 @@
+"""
+Load a dump of a catalogus into the database in bulk.
+
+The dump has the format of the export: the catalogus and a list of objects per nested resource, with the field names
+of the API. Objects refer to each other by their URLs in the dump, which are mapped to the primary keys of the new
+objects. Only the fields that map to a column of the model (or a many-to-many relation, or an inline object) are
+loaded; fields that the API derives from other objects are ignored.
+
+The objects are inserted with ``bulk_create``, without calling ``save`` and without sending any signals. Each row is
+validated with ``Model.clean_fields`` (and ``invalid_geldigheid``, a check constraint of the tables) before it is
+inserted, and the rules of ``Model.clean`` that involve other rows are checked afterwards with a query per rule (see
+``VALIDATION_RULES``). This has to happen in a transaction, so the loaded objects can be rolled back if they are
+invalid.
+"""
+from collections import OrderedDict, defaultdict
+from urllib.parse import urlparse
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import models
+from django.db.models import Exists, F, OuterRef, Q
+from django.urls import Resolver404, resolve
+from django.utils.translation import ugettext_lazy as _
+
+from rest_framework.relations import ManyRelatedField, RelatedField
+from rest_framework.serializers import BaseSerializer, ListSerializer
+from rest_framework.settings import api_settings
+
+from ...datamodel.models import (
+    Eigenschap, ResultaatType, RolType, StatusType, ZaakObjectType, ZaakType
+)
+from ...datamodel.models.mixins import GeldigheidMixin, ZoekMixin
+from ...datamodel.search import update_zoek_vector
+
+CATALOGUS_SECTION = 'catalogus'
+
+LOOKUP_SEP = '__'
+
+
+class LoadError(Exception):
+    """
+    The dump could not be loaded, with the list of ``errors``.
+    """
+    def __init__(self, errors):
+        super().__init__('\n'.join(errors))
+        self.errors = errors
+
+
+def get_model_field(model, source):
+    """
+    Return the concrete field, or forward many-to-many field, of ``model`` that a serializer field with ``source``
+    shows, or ``None`` if it shows something else.
+    """
+    try:
+        field = model._meta.get_field(source)
+    except FieldDoesNotExist:
+        return None
+    return field if field.concrete else None
+
+
+def get_url_kwargs(url):
+    """
+    Return the keyword arguments (the primary keys of the object and its parents) in ``url``.
+    """
+    if not url:
+        return {}
+    try:
+        return resolve(urlparse(url).path).kwargs
+    except Resolver404:
+        return {}
+
+
+def get_dependencies(model):
+    """
+    Return the models that ``model`` has a foreign key to.
+    """
+    return {
+        field.related_model for field in model._meta.concrete_fields
+        if field.is_relation and field.related_model is not model
+    }
+
+
+def sort_resources(resources):
+    """
+    Return the ``(section, serializer class)`` pairs in ``resources`` ordered so every model comes after the models it
+    has a foreign key to.
+    """
+    models_ = {serializer_class.Meta.model for section, serializer_class in resources}
+    remaining = list(resources)
+    ordered, done = [], set()
+    while remaining:
+        for resource in remaining:
+            model = resource[1].Meta.model
+            if not (get_dependencies(model) & models_) - done - {model}:
+                break
+        else:
+            # A cycle of foreign keys: the remaining models are loaded in their given order.
+            resource = remaining[0]
+        remaining.remove(resource)
+        ordered.append(resource)
+        done.add(resource[1].Meta.model)
+    return ordered
+
+
+def invalid_geldigheid(instance):
+    """
+    Return whether the period of validity of ``instance`` ends before it begins. The tables have a check constraint for
+    this rule of ``GeldigheidMixin.clean``, so these objects cannot be inserted.
+    """
+    return (
+        isinstance(instance, GeldigheidMixin) and instance.datum_einde_geldigheid is not None and
+        instance.datum_begin_geldigheid is not None and
+        instance.datum_einde_geldigheid < instance.datum_begin_geldigheid
+    )
+
+
+def invalid_begin_geldigheid(zaaktype):
+    """
+    Return the rule of ``GeldigheidMixin._clean_geldigheid`` for models that belong to the ``zaaktype`` relation: the
+    datum begin geldigheid is the versiedatum of the zaaktype.
+    """
+    return lambda queryset: queryset.exclude(datum_begin_geldigheid=F('{}__versiedatum'.format(zaaktype)))
+
+
+def duplicate_zaaktype_omschrijving(queryset):
+    others = ZaakType.objects.filter(
+        maakt_deel_uit_van=OuterRef('maakt_deel_uit_van'), zaaktype_omschrijving=OuterRef('zaaktype_omschrijving'),
+    ).exclude(pk=OuterRef('pk'))
+    return queryset.annotate(duplicate=Exists(others)).filter(duplicate=True)
+
+
+EINDE_GELDIGHEID_MESSAGE = _('Datum einde geldigheid is gelijk aan of gelegen na de datum begin geldigheid.')
+GELDIGHEID_MESSAGE = _('De datum_begin_geldigheid moet gelijk zijn aan een Versiedatum van het gerelateerde zaaktype.')
+
+# The rules of ``Model.clean`` as ``(model, message, rule)``, where ``rule`` returns the invalid objects in a queryset.
+VALIDATION_RULES = (
+    (ZaakType, _("'Servicenorm behandeling' periode mag niet langer zijn dan de periode van 'Doorlooptijd behandeling'."),
+     lambda queryset: queryset.filter(servicenorm_behandeling__gt=F('doorlooptijd_behandeling'))),
+    (ZaakType, _('Zaaktype-omschrijving moet uniek zijn binnen de CATALOGUS.'), duplicate_zaaktype_omschrijving),
+    (ZaakType, GELDIGHEID_MESSAGE, lambda queryset: queryset.exclude(datum_begin_geldigheid=F('versiedatum'))),
+    (Eigenschap, _('Één van twee groepen attributen is verplicht: specificatie van eigenschap of referentie naar '
+                   'eigenschap'),
+     lambda queryset: queryset.filter(
+         Q(specificatie_van_eigenschap__isnull=True, referentie_naar_eigenschap__isnull=True) |
+         Q(specificatie_van_eigenschap__isnull=False, referentie_naar_eigenschap__isnull=False))),
+    (Eigenschap, GELDIGHEID_MESSAGE, invalid_begin_geldigheid('is_van')),
+    (ResultaatType, GELDIGHEID_MESSAGE, invalid_begin_geldigheid('is_relevant_voor')),
+    (RolType, GELDIGHEID_MESSAGE, invalid_begin_geldigheid('is_van')),
+    (StatusType, GELDIGHEID_MESSAGE, invalid_begin_geldigheid('is_van')),
+    (ZaakObjectType, GELDIGHEID_MESSAGE, invalid_begin_geldigheid('is_relevant_voor')),
+)
+
+
+class CatalogusLoader(object):
+    """
+    Load the sections of a dump with the serializer classes of ``resources``, ``(section, serializer class)`` pairs.
+
+    Objects that miss a required relation in the dump (the API does not show every relation), and references to objects
+    that are not in the dump, are skipped and reported in ``warnings``.
+    """
+    batch_size = 1000
+    # The number of invalid objects to report per rule.
+    max_errors = 10
+
+    def __init__(self, resources):
+        self.resources = sort_resources(resources)
+        # The model and primary key of the loaded objects, by their URL in the dump.
+        self.pks = {}
+        # The primary keys of the loaded objects, by their model and primary key in the dump.
+        self.old_pks = {}
+        # The primary keys of the loaded objects, by model.
+        self.loaded = OrderedDict()
+        # The many-to-many relations to add once all objects are loaded, as ``(field, instance, related)``.
+        self.relations = []
+        self.errors = []
+        self.warnings = []
+
+    def load(self, sections):
+        """
+        Load the objects in ``sections``, a mapping of the section names to lists of objects, and return the number of
+        objects loaded per section. Raises ``LoadError`` if the objects are invalid.
+        """
+        unknown = set(sections) - {section for section, serializer_class in self.resources}
+        if unknown:
+            raise LoadError([_('Onbekende onderdelen: {}.').format(', '.join(sorted(unknown)))])
+
+        counts = OrderedDict()
+        for section, serializer_class in self.resources:
+            counts[section] = self.load_objects(serializer_class(context={}), sections.get(section, []))
+
+        self.load_relations()
+        self.validate()
+        if self.errors:
+            raise LoadError(self.errors)
+
+        for model, pks in self.loaded.items():
+            if issubclass(model, ZoekMixin):
+                update_zoek_vector(model._default_manager.filter(pk__in=pks))
+        return counts
+
+    def resolve(self, url, model):
+        """
+        Return the primary key of the loaded object of ``model`` with ``url`` in the dump, or ``None``.
+        """
+        if url is None:
+            return None
+        if self.pks.get(url, (None, None))[0] is not model:
+            self.warnings.append(_('Verwijzing naar {} overgeslagen: {}.').format(model._meta.verbose_name, url))
+            return None
+        return self.pks[url][1]
+
+    def build(self, serializer, data, inline):
+        """
+        Return an (unsaved) instance of the model of ``serializer`` for the serialized ``data``.
+
+        Inline objects are built as well and added to ``inline`` as ``(field, instance, related)``.
+        """
+        model = serializer.Meta.model
+        instance = model()
+        for name, field in serializer.fields.items():
+            if name not in data or name == api_settings.URL_FIELD_NAME:
+                continue
+            model_field = get_model_field(model, field.source)
+            if model_field is None:
+                continue
+
+            value = data[name]
+            if isinstance(field, BaseSerializer):
+                if isinstance(field, ListSerializer):
+                    related = [self.build(field.child, item, inline) for item in value or []]
+                else:
+                    related = None if value is None else self.build(field, value, inline)
+                if model_field.many_to_many:
+                    self.relations.append((model_field, instance, related))
+                else:
+                    inline.append((model_field, instance, related))
+            elif isinstance(field, ManyRelatedField):
+                if model_field.many_to_many and model_field.remote_field.through._meta.auto_created:
+                    self.relations.append((model_field, instance, value))
+            elif isinstance(field, RelatedField):
+                setattr(instance, model_field.attname, self.resolve(value, model_field.related_model))
+            elif not field.read_only:
+                setattr(instance, model_field.attname, None if value is None else field.to_internal_value(value))
+        return instance
+
+    def set_parents(self, serializer, instance, url_kwargs):
+        """
+        Set the foreign keys to the parents of ``instance`` that the serializer does not show, from the primary keys in
+        its URL.
+        """
+        for url_kwarg, lookup in getattr(serializer, 'parent_lookup_kwargs', {}).items():
+            parts = lookup.split(LOOKUP_SEP)
+            if len(parts) != 2 or parts[1] != 'pk' or url_kwarg not in url_kwargs:
+                # Only direct parents are set.
+                continue
+            field = instance._meta.get_field(parts[0])
+            if getattr(instance, field.attname) is None:
+                old_pk = (field.related_model, str(url_kwargs[url_kwarg]))
+                setattr(instance, field.attname, self.old_pks.get(old_pk))
+
+    def is_complete(self, instance, url):
+        """
+        Return whether ``instance`` has all its required relations, or add a warning.
+        """
+        for field in instance._meta.concrete_fields:
+            if field.is_relation and not field.null and getattr(instance, field.attname) is None:
+                self.warnings.append(_('{} overgeslagen, {} ontbreekt.').format(url, field.verbose_name))
+                return False
+        return True
+
+    def create(self, model, instances, urls=None):
+        """
+        Validate and insert ``instances`` of ``model``. Instances that violate a check constraint are not inserted.
+        """
+        relation_fields = [field.name for field in model._meta.fields if field.is_relation]
+        valid = []
+        for i, instance in enumerate(instances):
+            label = urls[i] if urls else model._meta.verbose_name
+            try:
+                instance.clean_fields(exclude=relation_fields)
+            except ValidationError as exc:
+                self.errors.append('{}: {}'.format(label, exc.message_dict))
+            if invalid_geldigheid(instance):
+                self.errors.append('{}: {}'.format(label, EINDE_GELDIGHEID_MESSAGE))
+            else:
+                valid.append(instance)
+
+        model._default_manager.bulk_create(valid, batch_size=self.batch_size)
+        self.loaded.setdefault(model, []).extend(instance.pk for instance in valid)
+
+    def load_objects(self, serializer, objects):
+        """
+        Load the serialized ``objects`` and return the number of objects loaded.
+        """
+        model = serializer.Meta.model
+        inline, instances, urls = [], [], []
+        for data in objects:
+            url = data.get(api_settings.URL_FIELD_NAME)
+            instances.append(self.build(serializer, data, inline))
+            urls.append(url)
+
+        # Inline objects are created first, so the instances can refer to them.
+        inline_instances = defaultdict(list)
+        for field, instance, related in inline:
+            if related is not None:
+                inline_instances[type(related)].append(related)
+        for inline_model, related in inline_instances.items():
+            self.create(inline_model, related)
+        for field, instance, related in inline:
+            setattr(instance, field.name, related)
+
+        url_kwargs = [get_url_kwargs(url) for url in urls]
+        for instance, kwargs in zip(instances, url_kwargs):
+            self.set_parents(serializer, instance, kwargs)
+
+        complete = [i for i, instance in enumerate(instances) if self.is_complete(instance, urls[i])]
+        self.create(model, [instances[i] for i in complete], [urls[i] for i in complete])
+        for i in complete:
+            if urls[i] is not None:
+                self.pks[urls[i]] = (model, instances[i].pk)
+            if 'pk' in url_kwargs[i]:
+                self.old_pks[(model, str(url_kwargs[i]['pk']))] = instances[i].pk
+        return len(complete)
+
+    def load_relations(self):
+        """
+        Insert the rows of the many-to-many relations in their through tables.
+        """
+        # Relations of objects that were skipped are skipped as well.
+        relations = [(field, instance, related) for field, instance, related in self.relations if instance.pk]
+
+        inline_instances = defaultdict(list)
+        for field, instance, related in relations:
+            for obj in related:
+                if isinstance(obj, models.Model):
+                    inline_instances[type(obj)].append(obj)
+        for model, related in inline_instances.items():
+            self.create(model, related)
+
+        rows = defaultdict(set)
+        for field, instance, related in relations:
+            for obj in related:
+                pk = obj.pk if isinstance(obj, models.Model) else self.resolve(obj, field.related_model)
+                if pk is not None:
+                    rows[field].add((instance.pk, pk))
+
+        for field, pairs in rows.items():
+            through = field.remote_field.through
+            source = through._meta.get_field(field.m2m_field_name()).attname
+            target = through._meta.get_field(field.m2m_reverse_field_name()).attname
+            through._default_manager.bulk_create(
+                [through(**{source: pk, target: related_pk}) for pk, related_pk in pairs], batch_size=self.batch_size)
+
+    def validate(self):
+        """
+        Check the rules that involve other rows for all loaded objects, with a query per rule.
+        """
+        for model, pks in self.loaded.items():
+            queryset = model._default_manager.filter(pk__in=pks)
+            for rule_model, message, rule in VALIDATION_RULES:
+                if not issubclass(model, rule_model):
+                    continue
+                for obj in rule(queryset)[:self.max_errors]:
+                    self.errors.append('{} {}: {}'.format(model._meta.verbose_name, obj, message))
@@ -0,0 +1,155 @@
+"""
+Validate OAuth2 access tokens without a query for every request.
+
+Valid access tokens are cached in the memory of the process, for at most ``TOKEN_CACHE_LOCAL_TIMEOUT`` seconds, and in
+the shared cache. Only what the validation needs is cached: the expiry, the scopes and the primary keys of the token,
+its application and its user. The application and user are loaded when they are used. Neither cache keeps a token
+beyond its expiry, and every request still checks the expiry and scopes of the cached token.
+
+A revoked (deleted) or changed token is removed from both caches right away, see ``invalidate_token``. Other processes
+may still accept it from their copy in memory, for at most ``TOKEN_CACHE_LOCAL_TIMEOUT`` seconds.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.functional import SimpleLazyObject
+
+from oauth2_provider.models import get_access_token_model
+from oauth2_provider.oauth2_validators import (
+    OAuth2Validator as _OAuth2Validator
+)
+
+TOKEN_CACHE = settings.REST_FRAMEWORK_EXT.get('TOKEN_CACHE', 'default')
+TOKEN_CACHE_TIMEOUT = settings.REST_FRAMEWORK_EXT.get('TOKEN_CACHE_TIMEOUT', 60 * 5)
+TOKEN_CACHE_LOCAL_TIMEOUT = settings.REST_FRAMEWORK_EXT.get('TOKEN_CACHE_LOCAL_TIMEOUT', 10)
+TOKEN_CACHE_LOCAL_SIZE = settings.REST_FRAMEWORK_EXT.get('TOKEN_CACHE_LOCAL_SIZE', 1024)
+
+
+class TokenCache(object):
+    """
+    Access tokens by their token string, in a least recently used cache in memory with a timeout, backed by the Django
+    cache with the given ``alias``. The token strings are hashed, so they are not stored in the shared cache.
+    """
+    # The fields of the access tokens that are cached.
+    fields = ('id', 'expires', 'scope', 'application_id', 'user_id')
+    # The version of the cached values, to ignore the values of older code.
+    version = 2
+
+    def __init__(self, alias, timeout, local_timeout, local_size):
+        self.alias = alias
+        self.timeout = timeout
+        self.local_timeout = local_timeout
+        self.local_size = local_size
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def get_key(self, token):
+        return 'token:{}'.format(hashlib.sha256(token.encode('utf-8')).hexdigest())
+
+    def get_timeout(self, values, timeout):
+        """
+        Return ``timeout``, or the number of seconds until the cached access token expires if that is sooner.
+        """
+        if values['expires'] is None:
+            return 0
+        return max(0, min(timeout, int((values['expires'] - timezone.now()).total_seconds())))
+
+    def get(self, token):
+        """
+        Return the cached access token for the ``token`` string, or ``None``. It is not saved in the database, and its
+        application and user are loaded when they are used.
+        """
+        key = self.get_key(token)
+        values = self.get_local(key)
+        if values is None:
+            values = self.cache.get(key, version=self.version)
+            if values is None:
+                return None
+            self.set_local(key, values)
+        return get_access_token_model()(token=token, **values)
+
+    def set(self, token, access_token):
+        key = self.get_key(token)
+        values = {name: getattr(access_token, name) for name in self.fields}
+        timeout = self.get_timeout(values, self.timeout)
+        if timeout:
+            self.cache.set(key, values, timeout, version=self.version)
+        self.set_local(key, values)
+
+    def get_local(self, key):
+        with self._lock:
+            cached = self._local.get(key)
+            if cached is None:
+                return None
+            expires, values = cached
+            if expires <= time.monotonic():
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            return values
+
+    def set_local(self, key, values):
+        timeout = self.get_timeout(values, self.local_timeout)
+        if not timeout:
+            return
+        with self._lock:
+            self._local[key] = (time.monotonic() + timeout, values)
+            self._local.move_to_end(key)
+            while len(self._local) > self.local_size:
+                self._local.popitem(last=False)
+
+    def delete(self, token):
+        key = self.get_key(token)
+        with self._lock:
+            self._local.pop(key, None)
+        self.cache.delete(key, version=self.version)
+
+    def clear_local(self):
+        with self._lock:
+            self._local.clear()
+
+
+token_cache = TokenCache(TOKEN_CACHE, TOKEN_CACHE_TIMEOUT, TOKEN_CACHE_LOCAL_TIMEOUT, TOKEN_CACHE_LOCAL_SIZE)
+
+
+@receiver(post_save, sender=get_access_token_model())
+@receiver(post_delete, sender=get_access_token_model())
+def invalidate_token(sender, instance, **kwargs):
+    # Revoking a token (also with the `RevokeTokenView`) deletes it.
+    token_cache.delete(instance.token)
+
+
+class OAuth2Validator(_OAuth2Validator):
+    """
+    Validate bearer tokens with the ``token_cache``, and only look up the tokens that are not in it.
+    """
+    token_cache = token_cache
+
+    def validate_bearer_token(self, token, scopes, request):
+        if not token:
+            return False
+
+        access_token = self.token_cache.get(token)
+        if access_token is not None and access_token.is_valid(scopes):
+            request.client = SimpleLazyObject(lambda: access_token.application)
+            request.user = SimpleLazyObject(lambda: access_token.user) if access_token.user_id is not None else None
+            request.scopes = scopes
+            # This is needed by Django REST framework.
+            request.access_token = access_token
+            return True
+
+        valid = super().validate_bearer_token(token, scopes, request)
+        if valid:
+            self.token_cache.set(token, request.access_token)
+        return valid
@@ -1,24 +1,305 @@
-from collections import OrderedDict
+import base64
+import json
+from collections import OrderedDict, namedtuple
 
 from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.core.paginator import (
+    EmptyPage, InvalidPage, Page, PageNotAnInteger, Paginator
+)
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Q
+from django.utils.functional import cached_property
+from django.utils.translation import ugettext_lazy as _
 
 from drf_yasg import openapi
-from drf_yasg.inspectors import PaginatorInspector
+from drf_yasg.inspectors import NotHandled, PaginatorInspector
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from rest_framework.utils.urls import remove_query_param, replace_query_param
 
+from .caching import response_cache
+
+COUNT_EXACT = 'exact'
+COUNT_CACHED = 'cached'
+COUNT_ESTIMATED = 'estimated'
+
+
+def link(url, description=None):
+    data = [('href', url), ]
+    if description:
+        data.append(('desc', description))
+    return OrderedDict(data)
+
+
+def get_keyset(queryset):
+    """
+    Return the keys to paginate ``queryset`` on with a cursor, as ``(attname, descending)`` pairs: the fields of its
+    ordering (or the model ordering), followed by the primary key if they are not unique together.
+    """
+    opts = queryset.model._meta
+    ordering = queryset.query.order_by or opts.ordering
+
+    keyset = []
+    for name in ordering:
+        if not isinstance(name, str) or name.lstrip('-') in ('?', ''):
+            raise ValidationError(_('Cursor pagination is not possible with this ordering.'))
+
+        descending = name.startswith('-')
+        name = name.lstrip('-')
+        try:
+            field = opts.pk if name == 'pk' else opts.get_field(name)
+        except FieldDoesNotExist:
+            field = None
+        if field is None or not field.concrete or field.null:
+            # Comparing values of related models or NULL values does not give a strict order.
+            raise ValidationError(_('Cursor pagination is not possible with ordering on {name}.').format(name=name))
+        keyset.append((field.attname, descending))
+
+    attnames = {attname for attname, descending in keyset}
+    unique = [(opts.pk.name, )] + [fields for fields in opts.unique_together]
+    if not any({opts.get_field(name).attname for name in fields} <= attnames for fields in unique):
+        keyset.append((opts.pk.attname, False))
+    return keyset
+
+
+def get_keyset_filter(keyset, position, reverse=False):
+    """
+    Return the filter for the rows after ``position`` in the order of ``keyset`` (or before, if ``reverse``).
+
+    This is ``WHERE (a, b) > (x, y)``, written out for any combination of ascending and descending keys.
+    """
+    condition = Q()
+    for i, (attname, descending) in enumerate(keyset):
+        lookup = 'lt' if descending != reverse else 'gt'
+        equal = {previous: value for (previous, _descending), value in zip(keyset[:i], position)}
+        condition |= Q(**equal) & Q(**{'{}__{}'.format(attname, lookup): position[i]})
+
+    # The bound on the first key allows an index range scan.
+    attname, descending = keyset[0]
+    lookup = 'lte' if descending != reverse else 'gte'
+    return Q(**{'{}__{}'.format(attname, lookup): position[0]}) & condition
+
+
+def iterate_in_chunks(queryset, size, chunk_size):
+    """
+    Iterate over the first ``size`` objects of ``queryset`` with a query per ``chunk_size`` objects. The prefetches are
+    done per chunk as well, so only the instances of one chunk are kept in memory.
+    """
+    for offset in range(0, size, chunk_size):
+        chunk = list(queryset[offset:min(offset + chunk_size, size)])
+        yield from chunk
+        if len(chunk) < chunk_size:
+            return
+
+
+def get_count_estimate(queryset):
+    """
+    Return the number of rows in the table of ``queryset`` as estimated by the query planner (from the statistics
+    gathered by ``ANALYZE``), or ``None`` if the queryset is filtered or the database has no estimate.
+    """
+    query = queryset.query
+    if query.where or query.distinct or query.low_mark or query.high_mark is not None:
+        return None
+
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT reltuples FROM pg_class WHERE oid = %s::regclass', [queryset.model._meta.db_table])
+        row = cursor.fetchone()
+
+    # Tables that were never analyzed have no (or a negative) estimate.
+    if row is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+class EstimatedPage(Page):
+    """
+    A page of a paginator with an estimated count. Whether there is a next page is known from the rows themselves.
+    """
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+
+class HALPaginator(Paginator):
+    """
+    A paginator that gets its count from the callable ``get_count``, instead of always counting the rows.
+
+    If the count is ``estimated``, it is not used to limit the pages: one more row is fetched to know if there is a next
+    page, and pages beyond the estimated last page are allowed.
+    """
+    def __init__(self, object_list, per_page, get_count, estimated=False):
+        super().__init__(object_list, per_page)
+        self.get_count = get_count
+        self.estimated = estimated
+
+    @cached_property
+    def count(self):
+        return self.get_count()
+
+    def validate_number(self, number):
+        if not self.estimated:
+            return super().validate_number(number)
+
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(_('That page number is not an integer'))
+        if number < 1:
+            raise EmptyPage(_('That page number is less than 1'))
+        return number
+
+    def page(self, number):
+        if not self.estimated:
+            return super().page(number)
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        object_list = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not object_list and number > 1:
+            raise EmptyPage(_('That page contains no results'))
+        return EstimatedPage(object_list[:self.per_page], number, self, has_next=len(object_list) > self.per_page)
+
+
+Cursor = namedtuple('Cursor', ['position', 'reverse'])
+
 
 class HALPagination(PageNumberPagination):
+    """
+    Paginate with page numbers, or with a cursor if the cursor query parameter is given (use an empty value for the
+    first page).
+
+    With a cursor, the rows after (or before) the last row of the previous page are selected on the ordering of the
+    queryset. Unlike page numbers, this needs neither a count nor an offset, so deep pages are as fast as the first.
+
+    With page numbers, the total number of results is counted according to the count strategy:
+
+    * ``exact``: count the results for every page.
+    * ``cached``: count the results once for each version of the catalogus (or catalogussen) that is shown. Other pages
+      of the same results reuse the count, until the catalogus changes.
+    * ``estimated``: like ``cached``, but for unfiltered tables with at least ``count_estimate_threshold`` rows, the
+      estimate of the query planner is used. The response then has no ``last`` link and no exact count.
+    """
     page_query_param = settings.REST_FRAMEWORK_EXT.get('PAGE_PARAM', 'page')
+    page_size_query_param = settings.REST_FRAMEWORK_EXT.get('PAGE_SIZE_PARAM', 'page_size')
+    max_page_size = settings.REST_FRAMEWORK_EXT.get('MAX_PAGE_SIZE', 1000)
+    # Pages with more objects are fetched and serialized in chunks.
+    chunk_size = 100
+    cursor_query_param = settings.REST_FRAMEWORK_EXT.get('CURSOR_PARAM', 'cursor')
+
+    count_strategy = settings.REST_FRAMEWORK_EXT.get('COUNT_STRATEGY', COUNT_EXACT)
+    count_estimate_threshold = settings.REST_FRAMEWORK_EXT.get('COUNT_ESTIMATE_THRESHOLD', 100000)
+    count_cache = response_cache
 
     header_total_count = 'X-Total-Count'
+    header_total_count_estimate = 'X-Total-Count-Estimate'
     header_pagination_count = 'X-Pagination-Count'
     header_pagination_page = 'X-Pagination-Page'
     header_pagination_limit = 'X-Pagination-Limit'
 
+    invalid_cursor_message = _('Invalid cursor.')
+
+    cursor = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        self.request = request
+        if self.cursor_query_param not in request.query_params:
+            return self.paginate_queryset_by_page(queryset, page_size, view)
+
+        self.keyset = get_keyset(queryset)
+        self.cursor = self.decode_cursor(request.query_params[self.cursor_query_param])
+
+        queryset = queryset.order_by(*[
+            '{}{}'.format('-' if descending != self.cursor.reverse else '', attname)
+            for attname, descending in self.keyset
+        ])
+        if self.cursor.position is not None:
+            queryset = queryset.filter(get_keyset_filter(self.keyset, self.cursor.position, self.cursor.reverse))
+
+        field_names, defer = queryset.query.deferred_loading
+        if not defer:
+            # The keys are needed for the cursors, even if the response does not show them.
+            queryset = queryset.only(*(set(field_names) | {attname for attname, descending in self.keyset}))
+
+        # Fetch one more row, to know if there is another page.
+        results = list(queryset[:page_size + 1])
+        self.has_more = len(results) > page_size
+        self.results = results[:page_size]
+        if self.cursor.reverse:
+            self.results.reverse()
+        return self.results
+
+    def paginate_queryset_by_page(self, queryset, page_size, view=None):
+        paginator = self.get_paginator(queryset, page_size, view)
+
+        page_number = self.request.query_params.get(self.page_query_param, 1)
+        if page_number in self.last_page_strings and not paginator.estimated:
+            page_number = paginator.num_pages
+
+        try:
+            self.page = paginator.page(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(page_number=page_number, message=str(exc))
+            raise NotFound(msg)
+
+        if paginator.estimated:
+            # The objects are already fetched.
+            return list(self.page)
+        return iterate_in_chunks(self.page.object_list, page_size, self.chunk_size)
+
+    def get_paginator(self, queryset, page_size, view=None):
+        """
+        Return the paginator for ``queryset``, which counts the results according to the count strategy.
+        """
+        if self.count_strategy == COUNT_ESTIMATED:
+            estimate = get_count_estimate(queryset)
+            if estimate is not None and estimate >= self.count_estimate_threshold:
+                return HALPaginator(queryset, page_size, lambda: estimate, estimated=True)
+
+        # Views that do not show (part of) a catalogus have no fingerprint to cache the count with.
+        fingerprint = getattr(view, 'catalogus_fingerprint', None)
+        if self.count_strategy in (COUNT_CACHED, COUNT_ESTIMATED) and fingerprint is not None:
+            return HALPaginator(queryset, page_size, lambda: self.count_cache.get_count(queryset, fingerprint))
+
+        return HALPaginator(queryset, page_size, queryset.count)
+
+    def decode_cursor(self, value):
+        if not value:
+            return Cursor(None, False)
+        try:
+            position, reverse = json.loads(base64.urlsafe_b64decode(value.encode('ascii')).decode('utf-8'))
+        except (TypeError, ValueError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.keyset):
+            raise NotFound(self.invalid_cursor_message)
+        return Cursor(position, bool(reverse))
+
+    def encode_cursor(self, obj, reverse):
+        position = [getattr(obj, attname) for attname, descending in self.keyset]
+        value = json.dumps([position, reverse], cls=DjangoJSONEncoder)
+        return base64.urlsafe_b64encode(value.encode('utf-8')).decode('ascii')
+
+    def get_cursor_link(self, obj, reverse):
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(obj, reverse))
+
     def get_first_link(self):
         url = self.request.build_absolute_uri()
+        if self.cursor is not None:
+            return replace_query_param(url, self.cursor_query_param, '')
         return remove_query_param(url, self.page_query_param)
 
     def get_last_link(self):
@@ -26,11 +307,8 @@ class HALPagination(PageNumberPagination):
         return replace_query_param(url, self.page_query_param, self.page.paginator.num_pages)
 
     def get_paginated_response(self, data):
-        def link(url, description=None):
-            data = [('href', url), ]
-            if description:
-                data.append(('desc', description))
-            return OrderedDict(data)
+        if self.cursor is not None:
+            return self.get_cursor_paginated_response(data)
 
         links_data = [
             ('self', link(self.request.build_absolute_uri())),
@@ -41,22 +319,62 @@ class HALPagination(PageNumberPagination):
                 ('first', link(self.get_first_link())),
                 ('prev', link(self.get_previous_link())),
             ])
-        if self.page.number < self.page.paginator.num_pages:
+        if self.page.has_next():
             links_data.append(
                 ('next', link(self.get_next_link())),
             )
-        if self.page.paginator.num_pages > 1:
-            links_data.append(
-                ('last', link(self.get_last_link())),
-            )
+
+        paginator = self.page.paginator
+        if paginator.estimated:
+            # The last page is not known without an exact count.
+            headers = OrderedDict([
+                (self.header_total_count_estimate, paginator.count),
+            ])
+        else:
+            if paginator.num_pages > 1:
+                links_data.append(
+                    ('last', link(self.get_last_link())),
+                )
+            headers = OrderedDict([
+                (self.header_total_count, paginator.count),
+                (self.header_pagination_count, paginator.num_pages),
+            ])
+        headers[self.header_pagination_page] = self.page.number
+        headers[self.header_pagination_limit] = self.get_page_size(self.request)
+
+        return Response(OrderedDict([
+            ('_links', OrderedDict(links_data)),
+            ('results', data)
+        ]), headers=headers)
+
+    def get_cursor_paginated_response(self, data):
+        """
+        The response for a page selected with a cursor. Without a count, there is no last page.
+        """
+        links_data = [
+            ('self', link(self.request.build_absolute_uri())),
+        ]
+
+        if self.results:
+            # Going back from the first page of a forward walk (or forward from the last page of a backward walk) is
+            # not possible.
+            has_previous = self.has_more if self.cursor.reverse else self.cursor.position is not None
+            has_next = self.cursor.position is not None if self.cursor.reverse else self.has_more
+
+            if has_previous:
+                links_data.extend([
+                    ('first', link(self.get_first_link())),
+                    ('prev', link(self.get_cursor_link(self.results[0], reverse=True))),
+                ])
+            if has_next:
+                links_data.append(
+                    ('next', link(self.get_cursor_link(self.results[-1], reverse=False))),
+                )
 
         return Response(OrderedDict([
             ('_links', OrderedDict(links_data)),
             ('results', data)
         ]), headers={
-            self.header_total_count: self.page.paginator.count,
-            self.header_pagination_count: self.page.paginator.num_pages,
-            self.header_pagination_page: self.page.number,
             self.header_pagination_limit: self.get_page_size(self.request),
         })
 
@@ -67,6 +385,32 @@ class HALPaginationInspector(PaginatorInspector):
 
     Hook for `drf-yasg`.
     """
+    def get_paginator_parameters(self, paginator):
+        if not isinstance(paginator, HALPagination):
+            return NotHandled
+
+        return [
+            openapi.Parameter(
+                paginator.page_query_param,
+                openapi.IN_QUERY,
+                description='A page number within the paginated result set.',
+                type=openapi.TYPE_INTEGER,
+            ),
+            openapi.Parameter(
+                paginator.page_size_query_param,
+                openapi.IN_QUERY,
+                description='Number of results per page, at most {}.'.format(paginator.max_page_size),
+                type=openapi.TYPE_INTEGER,
+            ),
+            openapi.Parameter(
+                paginator.cursor_query_param,
+                openapi.IN_QUERY,
+                description='Paginate with a cursor instead of page numbers. Leave empty for the first page and follow '
+                            'the `next` and `prev` links for the other pages.',
+                type=openapi.TYPE_STRING,
+            ),
+        ]
+
     def get_paginated_response(self, paginator, response_schema):
         assert response_schema.type == openapi.TYPE_ARRAY, "array return expected for paged response"
         paged_schema = None
@@ -100,7 +444,8 @@ class HALPaginationInspector(PaginatorInspector):
                             ('last', openapi.Schema(
                                 type=openapi.TYPE_STRING,
                                 format=openapi.FORMAT_URI,
-                                description='URL to the last page in the result set.',
+                                description='URL to the last page in the result set. Not present when paginating '
+                                            'with a cursor, or when the total number of results is estimated.',
                             )),
                         )),
                         required=['self'],
@@ -119,11 +464,20 @@ class HALPaginationInspector(PaginatorInspector):
             schema=paged_schema,
             headers=OrderedDict([
                 (HALPagination.header_total_count, {
-                    'type': openapi.TYPE_INTEGER, 'description': 'Total number of results.'}),
+                    'type': openapi.TYPE_INTEGER,
+                    'description': 'Total number of results. Not present when paginating with a cursor, or when '
+                                   'the total number of results is estimated.'}),
+                (HALPagination.header_total_count_estimate, {
+                    'type': openapi.TYPE_INTEGER,
+                    'description': 'Estimated total number of results. Only present for large result sets, '
+                                   'instead of the exact total number of results.'}),
                 (HALPagination.header_pagination_count, {
-                    'type': openapi.TYPE_INTEGER, 'description': 'Total number of pages.'}),
+                    'type': openapi.TYPE_INTEGER,
+                    'description': 'Total number of pages. Not present when paginating with a cursor, or when the '
+                                   'total number of results is estimated.'}),
                 (HALPagination.header_pagination_page, {
-                    'type': openapi.TYPE_INTEGER, 'description': 'Current page number.'}),
+                    'type': openapi.TYPE_INTEGER,
+                    'description': 'Current page number. Not present when paginating with a cursor.'}),
                 (HALPagination.header_pagination_limit, {
                     'type': openapi.TYPE_INTEGER, 'description': 'Number of results per page.'}),
             ]),
@@ -0,0 +1,216 @@
+from collections import OrderedDict
+
+from django.contrib.postgres.search import SearchVectorField
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+
+from rest_framework import serializers
+
+LOOKUP_SEP = '__'
+
+
+def get_relation(model, attr):
+    """
+    Return the model field or reverse relation that is accessible as ``attr`` on instances of ``model``, or ``None`` if
+    ``attr`` is not a relation.
+    """
+    for field in model._meta.get_fields():
+        if not field.is_relation:
+            continue
+        if field.auto_created and not field.concrete:
+            # Reverse relations are accessed by their accessor name (ie. ``zaaktype_set``), not their query name.
+            name = field.get_accessor_name()
+        else:
+            name = field.name
+        if name == attr:
+            return field
+    return None
+
+
+def get_columns(model, attr):
+    """
+    Return the column names needed to get attribute ``attr`` of instances of ``model``, or ``None`` if this is unknown.
+    """
+    if attr == 'pk':
+        # The primary key is always loaded.
+        return []
+    try:
+        field = model._meta.get_field(attr)
+    except FieldDoesNotExist:
+        # Properties and methods might use any column.
+        return None
+    return [field.name] if field.concrete else None
+
+
+def get_search_vectors(model):
+    """
+    Return the names of the search vector fields of ``model``. These are only used to search and never need to be loaded.
+    """
+    return [field.name for field in model._meta.concrete_fields if isinstance(field, SearchVectorField)]
+
+
+class QueryPlan(object):
+    """
+    The minimal set of ``select_related`` and ``prefetch_related`` lookups needed to serialize instances of ``model``
+    without issuing additional queries per instance.
+
+    Prefetched relations get their own plan, which is applied to the queryset of the ``Prefetch`` object.
+
+    The plan also keeps track of the columns that are used. If a serializer only shows some of its fields (a sparse
+    fieldset), only those columns are loaded.
+    """
+    def __init__(self, model):
+        self.model = model
+        self.select_related = set()
+        self.prefetches = OrderedDict()
+        # Maps the path of (selected) instances to the set of used column names, or ``None`` if all are used.
+        self.columns = OrderedDict()
+
+    @classmethod
+    def for_serializer(cls, serializer):
+        """
+        Build the plan for the (bound) fields of a ``ModelSerializer`` instance.
+        """
+        if isinstance(serializer, serializers.ListSerializer):
+            serializer = serializer.child
+        plan = cls(serializer.Meta.model)
+        plan.add_serializer(serializer)
+        return plan
+
+    def apply(self, queryset):
+        """
+        Return a copy of ``queryset`` with the lookups of this plan applied.
+        """
+        if self.select_related:
+            # Selecting ``a__b`` implies selecting ``a``.
+            lookups = [
+                lookup for lookup in self.select_related
+                if not any(other.startswith(lookup + LOOKUP_SEP) for other in self.select_related)
+            ]
+            queryset = queryset.select_related(*sorted(lookups))
+        only = self.get_only()
+        if only is not None:
+            # Without any field names, ``only`` would load all columns instead of just the primary key.
+            queryset = queryset.only(*(only or [self.model._meta.pk.name]))
+        elif get_search_vectors(self.model):
+            queryset = queryset.defer(*get_search_vectors(self.model))
+        if self.prefetches:
+            queryset = queryset.prefetch_related(*[
+                Prefetch(lookup, queryset=plan.apply(plan.model._default_manager.all()))
+                for lookup, plan in self.prefetches.items()
+            ])
+        return queryset
+
+    def get_only(self):
+        """
+        Return the field names to pass to ``QuerySet.only``, or ``None`` if all columns are needed.
+        """
+        if self.columns.get(()) is None:
+            return None
+
+        only = []
+        for path, columns in self.columns.items():
+            if columns is None:
+                model = self.get_model(path)
+                columns = [
+                    field.name for field in model._meta.concrete_fields
+                    if field.name not in get_search_vectors(model)
+                ]
+            only.extend(LOOKUP_SEP.join(path + (column, )) for column in sorted(columns))
+        return only
+
+    def add_columns(self, path, columns):
+        """
+        Mark ``columns`` as used by the instances reached through ``path``. If ``columns`` is ``None``, all columns are
+        used.
+        """
+        if columns is None:
+            self.columns[path] = None
+        elif self.columns.get(path, ()) is not None:
+            self.columns.setdefault(path, set()).update(columns)
+
+    def add_serializer(self, serializer, path=()):
+        """
+        Add all lookups needed by the fields of ``serializer``, whose instances are reached through ``path``.
+        """
+        if not getattr(serializer, 'sparse_fieldset', False):
+            self.add_columns(path, None)
+
+        for field in serializer.fields.values():
+            self.add_field(field, path)
+
+    def add_field(self, field, path=()):
+        if isinstance(field, serializers.ListSerializer):
+            self.add_source(path, field.source_attrs, lambda plan, path: plan.add_serializer(field.child, path))
+        elif isinstance(field, serializers.BaseSerializer):
+            self.add_source(path, field.source_attrs, lambda plan, path: plan.add_serializer(field, path))
+        elif isinstance(field, serializers.ManyRelatedField):
+            child = field.child_relation
+            self.add_source(path, field.source_attrs, lambda plan, path: plan.add_lookups(child, path))
+        elif isinstance(field, serializers.RelatedField) and field.source_attrs and field.use_pk_only_optimization():
+            # Only the primary key of the related object is used, which is read from the foreign key.
+            attr = field.source_attrs[-1]
+            self.add_source(path, field.source_attrs[:-1], lambda plan, path: plan.add_columns(path, [attr]))
+        elif isinstance(field, serializers.RelatedField):
+            self.add_source(path, field.source_attrs, lambda plan, path: plan.add_lookups(field, path))
+        elif not field.source_attrs:
+            # The source is the instance itself (``source='*'``), which might use any column.
+            self.add_columns(path, None)
+        else:
+            # Fields with a dotted source, like ``fk.name``, span relations as well.
+            self.add_source(path, field.source_attrs)
+
+    def add_lookups(self, field, path=()):
+        """
+        Add the relations that are traversed to build the URL of a (nested) hyperlinked field.
+        """
+        if hasattr(field, 'get_lookups'):
+            # Fields that read the primary keys of related objects from their foreign keys.
+            lookups = list(field.get_lookups(self.get_model(path)).values())
+        else:
+            lookups = [getattr(field, 'lookup_field', 'pk')]
+            lookups += list(getattr(field, 'parent_lookup_kwargs', {}).values())
+            lookups = [lookup.split(LOOKUP_SEP) for lookup in lookups]
+
+        for attrs in lookups:
+            self.add_source(path, attrs)
+
+    def add_source(self, path, attrs, callback=None):
+        """
+        Follow the attributes ``attrs`` from the instances reached through ``path``. To-one relations are selected,
+        to-many relations are prefetched and continued in the plan of the prefetch.
+
+        If the source leads to related instances, ``callback`` is called with the plan and path of those instances.
+        """
+        plan, model = self, self.get_model(path)
+
+        for attr in attrs:
+            relation = get_relation(model, attr)
+            if relation is None:
+                # Not a relation (a column, property or method), there is nothing more to follow.
+                plan.add_columns(path, get_columns(model, attr))
+                return
+
+            model = relation.related_model
+            if relation.many_to_many or relation.one_to_many:
+                lookup = LOOKUP_SEP.join(path + (attr, ))
+                plan = plan.prefetches.setdefault(lookup, QueryPlan(model))
+                if relation.one_to_many:
+                    # The foreign key is needed to match the prefetched instances with their parent.
+                    plan.add_columns((), [relation.field.name])
+                path = ()
+            else:
+                if relation.concrete:
+                    # The foreign key is needed to join the related instance.
+                    plan.add_columns(path, [attr])
+                path = path + (attr, )
+                plan.select_related.add(LOOKUP_SEP.join(path))
+
+        if callback is not None:
+            callback(plan, path)
+
+    def get_model(self, path):
+        model = self.model
+        for attr in path:
+            model = get_relation(model, attr).related_model
+        return model
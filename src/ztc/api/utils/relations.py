@@ -0,0 +1,139 @@
+"""
+Hyperlinked fields that build their URLs from precompiled templates.
+
+Reversing a URL and making it absolute is relatively slow, and a response can contain many thousands of hyperlinks.
+The URL of a view only depends on its URL kwargs, the API version and the host, so it is reversed once with
+placeholders for the kwargs and the resulting template is formatted for every object.
+"""
+from collections import OrderedDict
+from functools import lru_cache, reduce
+
+from django.urls import get_script_prefix
+
+from rest_framework import relations
+from rest_framework.reverse import reverse
+from rest_framework.settings import api_settings
+from rest_framework_nested import relations as nested_relations
+
+from .query import LOOKUP_SEP, get_relation
+
+URL_TEMPLATE_CACHE_SIZE = 1024
+
+# Placeholders have to match the URL patterns of the kwargs, which can be restricted to digits.
+PLACEHOLDER = 987654321000
+
+
+@lru_cache(maxsize=None)
+def get_lookup_attrs(model, lookup):
+    """
+    Returns the attributes to follow from instances of ``model`` to get the value of ``lookup`` (ie.
+    ``zaaktype__catalogus__pk``). The primary key of a related object is taken from the foreign key column (ie.
+    ``zaaktype.catalogus_id``), so the related object itself does not need to be loaded.
+    """
+    attrs = lookup.split(LOOKUP_SEP)
+    if len(attrs) < 2 or attrs[-1] != 'pk':
+        return tuple(attrs)
+
+    for attr in attrs[:-2]:
+        relation = get_relation(model, attr)
+        if relation is None:
+            return tuple(attrs)
+        model = relation.related_model
+
+    field = get_relation(model, attrs[-2])
+    if field is None or not field.concrete or not (field.many_to_one or field.one_to_one):
+        return tuple(attrs)
+    if field.target_field != field.related_model._meta.pk:
+        return tuple(attrs)
+    return tuple(attrs[:-2] + [field.attname])
+
+
+class URLTemplateCache(object):
+    """
+    Process-wide cache of URL templates per view name, URL kwargs, API version and host.
+    """
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._templates = {}
+
+    def get(self, view_name, url_kwargs, request):
+        key = (
+            view_name, url_kwargs, request.version, request.scheme, request.get_host(), get_script_prefix(),
+            getattr(request, 'urlconf', None)
+        )
+        try:
+            return self._templates[key]
+        except KeyError:
+            pass
+
+        placeholders = OrderedDict((kwarg, PLACEHOLDER + i) for i, kwarg in enumerate(url_kwargs))
+        # The versioning scheme adds the version to the kwargs, so pass a copy.
+        template = reverse(view_name, kwargs=dict(placeholders), request=request)
+        template = template.replace('{', '{{').replace('}', '}}')
+        for i, placeholder in enumerate(placeholders.values()):
+            template = template.replace(str(placeholder), '{%d}' % i)
+
+        if len(self._templates) >= self.max_size:
+            # The host comes from the request, don't let the cache grow without bounds.
+            self._templates.clear()
+        self._templates[key] = template
+        return template
+
+    def clear(self):
+        self._templates.clear()
+
+
+url_template_cache = URLTemplateCache(URL_TEMPLATE_CACHE_SIZE)
+
+
+class URLTemplateMixin(object):
+    """
+    Builds the URL from a precompiled template, instead of reversing it for every object.
+
+    Only integer lookup values are formatted into the template, any other value falls back to ``reverse``, which also
+    validates the value against the URL pattern.
+    """
+    def get_lookups(self, model):
+        """
+        Returns the attributes to follow, from instances of ``model``, for each URL kwarg.
+        """
+        lookups = OrderedDict([(self.lookup_url_kwarg, get_lookup_attrs(model, self.lookup_field))])
+        for kwarg, lookup in getattr(self, 'parent_lookup_kwargs', {}).items():
+            lookups[kwarg] = get_lookup_attrs(model, lookup)
+        return lookups
+
+    def get_url(self, obj, view_name, request, format):
+        # Unsaved objects will not yet have a valid URL.
+        if hasattr(obj, 'pk') and obj.pk in (None, ''):
+            return None
+
+        kwargs = OrderedDict(
+            (kwarg, reduce(getattr, attrs, obj)) for kwarg, attrs in self.get_lookups(type(obj)).items()
+        )
+
+        use_template = (
+            request is not None and not format and
+            api_settings.URL_FORMAT_OVERRIDE not in request.query_params and
+            all(type(value) is int for value in kwargs.values())
+        )
+        if not use_template:
+            return self.reverse(view_name, kwargs=kwargs, request=request, format=format)
+
+        template = url_template_cache.get(view_name, tuple(kwargs), request)
+        return template.format(*kwargs.values())
+
+
+class HyperlinkedRelatedField(URLTemplateMixin, relations.HyperlinkedRelatedField):
+    pass
+
+
+class HyperlinkedIdentityField(URLTemplateMixin, relations.HyperlinkedIdentityField):
+    pass
+
+
+class NestedHyperlinkedRelatedField(URLTemplateMixin, nested_relations.NestedHyperlinkedRelatedField):
+    pass
+
+
+class NestedHyperlinkedIdentityField(URLTemplateMixin, nested_relations.NestedHyperlinkedIdentityField):
+    pass
@@ -0,0 +1,68 @@
+from django.conf import settings
+
+from rest_framework import renderers
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The encoder of the ``JSONRenderer``: ``orjson`` (if it is installed) or ``json`` for the standard library.
+JSON_ENCODER = settings.REST_FRAMEWORK_EXT.get('JSON_ENCODER', 'orjson')
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """
+    Render JSON with a faster encoder if one is installed, with the same output as the JSON renderer of DRF.
+
+    With ``orjson``, the types it does not know (like dates and lazy translations) are converted by the encoder of DRF,
+    and anything it cannot encode (like integers beyond 64 bits or keys that are not strings) is rendered with the
+    standard library instead. Indented JSON is always rendered with the standard library.
+
+    The only known difference is the notation of floats with large exponents, which the API does not have.
+    """
+    encoder = JSON_ENCODER
+
+    @property
+    def use_orjson(self):
+        return self.encoder == 'orjson' and orjson is not None and self.compact and not self.ensure_ascii
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None or not self.use_orjson:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Like DRF, escape the line terminators that are not allowed in JavaScript strings.
+        return ret.replace('\u2028'.encode('utf-8'), b'\\u2028').replace('\u2029'.encode('utf-8'), b'\\u2029')
+
+
+class NDJSONRenderer(renderers.BaseRenderer):
+    """
+    Render a list as newline delimited JSON: one object per line. Anything else, like an error, is rendered as a single
+    line.
+
+    List views stream their objects with this renderer instead of paginating them, see ``StreamingListMixin``.
+    """
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = None
+    json_renderer_class = JSONRenderer
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if not isinstance(data, list):
+            data = [data]
+        return b''.join(self.render_line(item) for item in data)
+
+    def render_line(self, item):
+        """
+        Render a single object as a line of compact JSON.
+        """
+        return self.json_renderer_class().render(item) + b'\n'
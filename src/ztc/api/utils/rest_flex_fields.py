@@ -1,4 +1,8 @@
+import copy
 import importlib
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
+from types import MappingProxyType
 
 from django.conf import settings
 
@@ -9,6 +13,114 @@ from rest_flex_fields.views import FlexFieldsMixin as _FlexFieldsMixin
 EXPAND_PARAM = settings.REST_FRAMEWORK_EXT.get('EXPAND_PARAM', 'expand')
 FIELDS_PARAM = settings.REST_FRAMEWORK_EXT.get('FIELDS_PARAM', 'fields')
 EXPAND_ALL_VALUE = settings.REST_FRAMEWORK_EXT.get('EXPAND_ALL_VALUE', '~all')
+FIELD_TREE_CACHE_SIZE = settings.REST_FRAMEWORK_EXT.get('FIELD_TREE_CACHE_SIZE', 1024)
+
+
+def normalize_field_names(field_names):
+    """
+    Returns the (comma separated) field names as a sorted tuple without duplicates, to be used as cache key.
+    """
+    if not field_names:
+        return ()
+    if isinstance(field_names, str):
+        field_names = field_names.split(',')
+    return tuple(sorted(set(name.strip() for name in field_names if name.strip())))
+
+
+@lru_cache(maxsize=FIELD_TREE_CACHE_SIZE)
+def get_dynamic_serializer_class(serializer_class, expand, include_fields):
+    """
+    Returns a subclass of `serializer_class` with the dynamic parameters set. The classes are cached, so each
+    combination of (normalized) parameters gets the same class.
+    """
+    return type('DynamicFieldsModelSerializer', (serializer_class, ), {
+        'expand': expand or None,
+        'include_fields': include_fields or None,
+    })
+
+
+FieldTree = namedtuple('FieldTree', [
+    'fields', 'expandable', 'expanded', 'next_expands', 'next_includes', 'sparse'
+])
+
+
+class FieldTreeCache(object):
+    """
+    Process-wide cache of the fields of serializers, per serializer class and (normalized) `expand` and `fields`.
+
+    The cached fields are never bound to a serializer, each serializer gets its own copy.
+    """
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._trees = {}
+
+    def get(self, key):
+        return self._trees.get(key)
+
+    def set(self, key, tree):
+        if len(self._trees) >= self.max_size:
+            # Clients can request any combination of fields, don't let the cache grow without bounds.
+            self._trees.clear()
+        self._trees[key] = tree
+
+    def clear(self):
+        self._trees.clear()
+
+
+field_tree_cache = FieldTreeCache(FIELD_TREE_CACHE_SIZE)
+
+
+class ExpandableFieldsRegistry(object):
+    """
+    Process-wide registry of the resolved `expandable_fields` of serializer classes.
+
+    The dotted serializer paths are imported and the field settings are frozen only once per serializer class, instead
+    of on every instantiation of the serializer.
+    """
+    def __init__(self):
+        self._registry = {}
+
+    def get(self, serializer_class):
+        """
+        Returns a mapping of expandable field names to their (resolved) serializer class and (read-only) settings.
+        """
+        # Subclasses that do not define their own `expandable_fields`, like the dynamic classes created for each
+        # request, share the registration of the class that does.
+        owner = next(klass for klass in serializer_class.__mro__ if 'expandable_fields' in vars(klass))
+        try:
+            return self._registry[owner]
+        except KeyError:
+            pass
+
+        resolved = MappingProxyType({
+            name: (self.import_serializer_class(field_class), MappingProxyType(dict(field_settings)))
+            for name, (field_class, field_settings) in owner.expandable_fields.items()
+        })
+        self._registry[owner] = resolved
+        return resolved
+
+    def import_serializer_class(self, location):
+        """
+        Resolves dot-notation string reference to serializer class and returns actual class.
+
+        <app>.<SerializerName> will automatically be interpreted as <app>.serializers.<SerializerName>
+        """
+        if not isinstance(location, str):
+            return location
+
+        pieces = location.split('.')
+        class_name = pieces.pop()
+        if pieces[len(pieces) - 1] != 'serializers':
+            pieces.append('serializers')
+
+        module = importlib.import_module('.'.join(pieces))
+        return getattr(module, class_name)
+
+    def clear(self):
+        self._registry.clear()
+
+
+expandable_fields_registry = ExpandableFieldsRegistry()
 
 
 class FlexFieldsMixin(_FlexFieldsMixin):
@@ -19,6 +131,7 @@ class FlexFieldsMixin(_FlexFieldsMixin):
 
         * Added settings to get params.
         * Add `expand` and `fields` parameters to the documentation.
+        * The dynamic serializer classes are cached.
 
     """
 
@@ -56,6 +169,25 @@ class FlexFieldsMixin(_FlexFieldsMixin):
 
         return super().list(request, *args, **kwargs)
 
+    def get_serializer_class(self):
+        """
+        Returns the serializer class with the dynamic parameters set from the request's GET params.
+        """
+        is_valid_request = getattr(self, 'request', None) is not None and self.request.method == 'GET'
+        if not is_valid_request:
+            return self.serializer_class
+
+        fields = self.request.query_params.get(FIELDS_PARAM)
+
+        expand = None
+        if self._expandable:
+            expand = self.request.query_params.get(EXPAND_PARAM)
+        elif len(self._force_expand) > 0:
+            expand = self._force_expand
+
+        return get_dynamic_serializer_class(
+            self.serializer_class, normalize_field_names(expand), normalize_field_names(fields))
+
 
 class FlexFieldsSerializerMixin(object):
     """
@@ -65,48 +197,88 @@ class FlexFieldsSerializerMixin(object):
 
         * Added settings to get params.
         * Added feature to add the name to the inclusion fields, if its not expandable.
+        * Added `sparse_fieldset` to indicate that only some of the fields are shown.
+        * Expandable fields are resolved once, by the `expandable_fields_registry`.
+        * The fields are cached per serializer class, `expand` and `fields`, by the `field_tree_cache`.
 
     """
     expandable_fields = {}
+    sparse_fieldset = False
 
     def __init__(self, *args, **kwargs):
         expand_field_names = self._get_dynamic_setting(kwargs, EXPAND_PARAM)
         include_field_names = self._get_dynamic_setting(kwargs, {'class_property': 'include_fields', 'kwargs': FIELDS_PARAM})
-        expand_field_names, next_expand_field_names = self._split_levels(expand_field_names)
-        include_field_names, next_include_field_names = self._split_levels(include_field_names)
-        self._expandable = self.expandable_fields.keys()
-        self.expanded_fields = []
+        self._field_tree_key = (
+            type(self), normalize_field_names(expand_field_names), normalize_field_names(include_field_names)
+        )
 
         # Instantiate the superclass normally
         super().__init__(*args, **kwargs)
 
+        field_tree = self._get_field_tree()
+        self._expandable = field_tree.expandable
+        self.expanded_fields = list(field_tree.expanded)
+        self.sparse_fieldset = field_tree.sparse
+
+    def get_fields(self):
+        """
+        Returns a copy of the cached fields, with the expanded fields instantiated.
+        """
+        field_tree = self._get_field_tree()
+
+        fields = OrderedDict()
+        for name, field in field_tree.fields.items():
+            fields[name] = None if name in field_tree.expanded else copy.deepcopy(field)
+
+        for name in field_tree.expanded:
+            fields[name] = self._make_expanded_field_serializer(
+                name, field_tree.next_expands, field_tree.next_includes
+            )
+        return fields
+
+    def _get_field_tree(self):
+        field_tree = field_tree_cache.get(self._field_tree_key)
+        if field_tree is None:
+            field_tree = self._build_field_tree(*self._field_tree_key[1:])
+            field_tree_cache.set(self._field_tree_key, field_tree)
+        return field_tree
+
+    def _build_field_tree(self, expand_field_names, include_field_names):
+        """
+        Returns the `FieldTree` of the fields remaining after applying `expand` and `fields`.
+        """
+        fields = super().get_fields()
+        expand_field_names, next_expand_field_names = self._split_levels(list(expand_field_names))
+        include_field_names, next_include_field_names = self._split_levels(list(include_field_names))
+        expandable = list(self.expandable_fields.keys())
+
         # Added feature to add the name to the inclusion fields, if its not expandable.
         for name in expand_field_names:
-            if name in self.fields.keys() and name not in self._expandable:
+            if name in fields and name not in expandable:
                 include_field_names.append(name)
 
-        self._clean_fields(include_field_names)
+        if include_field_names:
+            fields = OrderedDict((name, field) for name, field in fields.items() if name in include_field_names)
+            expandable = [name for name in expandable if name in include_field_names]
 
         if EXPAND_ALL_VALUE in expand_field_names:
             expand_field_names = self.expandable_fields.keys()
 
-        for name in expand_field_names:
-            if name not in self._expandable:
-                continue
-
-            self.expanded_fields.append(name)
-            self.fields[name] = self._make_expanded_field_serializer(
-                name, next_expand_field_names, next_include_field_names
-            )
+        return FieldTree(
+            fields=fields,
+            expandable=tuple(expandable),
+            expanded=tuple(name for name in expand_field_names if name in expandable),
+            next_expands=next_expand_field_names,
+            next_includes=next_include_field_names,
+            sparse=bool(include_field_names),
+        )
 
     def _make_expanded_field_serializer(self, name, nested_expands, nested_includes):
         """
         Returns an instance of the dynamically created embedded serializer.
         """
-        import copy
-        field_options = self.expandable_fields[name]
-        serializer_class = field_options[0]
-        serializer_settings = copy.deepcopy(field_options[1])
+        serializer_class, field_settings = expandable_fields_registry.get(type(self))[name]
+        serializer_settings = dict(field_settings)
 
         if name in nested_expands:
             serializer_settings[EXPAND_PARAM] = nested_expands[name]
@@ -117,36 +289,8 @@ class FlexFieldsSerializerMixin(object):
         if serializer_settings.get('source') == name:
             del serializer_settings['source']
 
-        if type(serializer_class) == str:
-            serializer_class = self._import_serializer_class(serializer_class)
-
         return serializer_class(**serializer_settings)
 
-    def _import_serializer_class(self, location):
-        """
-        Resolves dot-notation string reference to serializer class and returns actual class.
-
-        <app>.<SerializerName> will automatically be interpreted as <app>.serializers.<SerializerName>
-        """
-        pieces = location.split('.')
-        class_name = pieces.pop()
-        if pieces[ len(pieces)-1 ] != 'serializers':
-            pieces.append('serializers')
-
-        module = importlib.import_module( '.'.join(pieces) )
-        return getattr(module, class_name)
-
-    def _clean_fields(self, include_fields):
-        if include_fields:
-            allowed_fields = set(include_fields)
-            existing_fields = set(self.fields.keys())
-            existing_expandable_fields = set(self.expandable_fields.keys())
-
-            for field_name in existing_fields - allowed_fields:
-                self.fields.pop(field_name)
-
-            self._expandable = list( existing_expandable_fields & allowed_fields )
-
     def _split_levels(self, fields):
         """
             Convert dot-notation such as ['a', 'a.b', 'a.d', 'c'] into current-level fields ['a', 'c']
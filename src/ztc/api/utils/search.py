@@ -0,0 +1,81 @@
+import operator
+import re
+from functools import reduce
+
+from django.contrib.postgres.search import SearchRank
+from django.db import models
+from django.db.models import F
+
+from rest_framework import filters
+
+from ...datamodel.indexes import get_trigram_fields
+from ...datamodel.models.mixins import ZoekMixin
+from ...datamodel.search import PrefixSearchQuery
+
+WORD_RE = re.compile(r'\w+')
+
+
+def escape_like(value):
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+class SearchFilter(filters.SearchFilter):
+    """
+    Search with the full-text search vector of the model, if it has one, and order the results by their rank. An
+    explicit ordering (with the ordering query param) still takes precedence.
+
+    Each search term has to match the start of a word in any of the search fields, or any part of a field with a
+    trigram index.
+
+    In terms with wildcards, ``*`` matches any number of characters and ``?`` exactly one character. The pattern has to
+    match a whole field with a trigram index (or any search field, if there are none).
+    """
+    # Wildcards and their LIKE equivalents.
+    wildcards = (('*', '%'), ('?', '_'))
+
+    def filter_queryset(self, request, queryset, view):
+        search_fields = getattr(view, 'search_fields', None)
+        search_terms = self.get_search_terms(request)
+        if not search_fields or not search_terms or not issubclass(queryset.model, ZoekMixin):
+            return super().filter_queryset(request, queryset, view)
+
+        trigram_fields = get_trigram_fields(queryset.model)
+        conditions, all_words = [], []
+        for term in search_terms:
+            words = WORD_RE.findall(term)
+            if self.has_wildcards(term) or not words:
+                conditions.append(self.get_like_condition(trigram_fields or search_fields, self.get_like_pattern(term)))
+                continue
+
+            condition = models.Q(zoek_vector=PrefixSearchQuery(words))
+            if trigram_fields:
+                condition |= self.get_like_condition(trigram_fields, '%{}%'.format(escape_like(term)))
+            conditions.append(condition)
+            all_words.extend(words)
+
+        queryset = queryset.filter(reduce(operator.and_, conditions))
+        if all_words:
+            ordering = queryset.query.order_by or queryset.model._meta.ordering
+            rank = SearchRank(F('zoek_vector'), PrefixSearchQuery(all_words))
+            queryset = queryset.order_by(rank.desc(), *ordering)
+        return queryset
+
+    def has_wildcards(self, term):
+        return any(wildcard in term for wildcard, pattern in self.wildcards)
+
+    def get_like_pattern(self, term):
+        """
+        Return the ``LIKE`` pattern for a search term, with the wildcards translated.
+        """
+        pattern = escape_like(term)
+        for wildcard, replacement in self.wildcards:
+            pattern = pattern.replace(wildcard, replacement)
+        if not self.has_wildcards(term):
+            pattern = '%{}%'.format(pattern)
+        return pattern
+
+    def get_like_condition(self, fields, pattern):
+        """
+        Return the condition for objects where any of the ``fields`` match the ``LIKE`` pattern (case insensitive).
+        """
+        return reduce(operator.or_, [models.Q(**{'{}__ilike'.format(field): pattern}) for field in fields])
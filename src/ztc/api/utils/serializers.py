@@ -1,3 +1,12 @@
+from rest_framework import serializers
+from rest_framework_nested import serializers as nested_serializers
+
+from .relations import (
+    HyperlinkedIdentityField, HyperlinkedRelatedField,
+    NestedHyperlinkedIdentityField
+)
+
+
 class SourceMappingSerializerMixin(object):
     """
     Read the `Meta.source_mapping` attribute and fill the `extra_kwargs` with
@@ -19,3 +28,19 @@ class SourceMappingSerializerMixin(object):
                 extra_kwargs[field_name] = kwargs
 
         return extra_kwargs
+
+
+class HyperlinkedModelSerializer(serializers.HyperlinkedModelSerializer):
+    """
+    Use the hyperlinked fields that build their URLs from precompiled templates.
+    """
+    serializer_related_field = HyperlinkedRelatedField
+    serializer_url_field = HyperlinkedIdentityField
+
+
+class NestedHyperlinkedModelSerializer(nested_serializers.NestedHyperlinkedModelSerializer):
+    """
+    Use the hyperlinked fields that build their URLs from precompiled templates.
+    """
+    serializer_related_field = HyperlinkedRelatedField
+    serializer_url_field = NestedHyperlinkedIdentityField
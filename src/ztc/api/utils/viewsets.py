@@ -1,3 +1,10 @@
+from django.http import StreamingHttpResponse
+
+from .export import CHUNK_SIZE, iterate_with_cursor
+from .query import QueryPlan
+from .renderers import NDJSONRenderer
+
+
 class FilterSearchOrderingViewSetMixin(object):
     """
     Consult the model options to set filter-, ordering- and search fields.
@@ -50,12 +57,49 @@ class FilterSearchOrderingViewSetMixin(object):
 class NestedViewSetMixin(object):
     def get_queryset(self):
         """
-        Filter the ``QuerySet`` based on its parents.
+        Filter the ``QuerySet`` based on its parents and optimize it for the serializer.
         """
         queryset = super().get_queryset()
         if hasattr(self.serializer_class, 'parent_lookup_kwargs'):
             orm_filters = {}
             for query_param, field_name in self.serializer_class.parent_lookup_kwargs.items():
                 orm_filters[field_name] = self.kwargs[query_param]
-            return queryset.filter(**orm_filters)
-        return queryset
+            queryset = queryset.filter(**orm_filters)
+        return self.optimize_queryset(queryset)
+
+    def optimize_queryset(self, queryset):
+        """
+        Select and prefetch all relations the serializer of this request needs, to avoid queries per object.
+        """
+        if getattr(self, 'request', None) is None:
+            return queryset
+
+        plan = QueryPlan.for_serializer(self.get_serializer())
+        if plan.model is not queryset.model:
+            return queryset
+        return plan.apply(queryset)
+
+
+class StreamingListMixin(object):
+    """
+    Stream all objects of a list, one per line, if the client accepts ``application/x-ndjson``. The objects are not
+    paginated but read with a server-side cursor and serialized per ``stream_chunk_size`` objects, so memory use does not
+    grow with the number of objects and the first objects are sent right away.
+    """
+    stream_chunk_size = CHUNK_SIZE
+
+    def list(self, request, *args, **kwargs):
+        if not isinstance(request.accepted_renderer, NDJSONRenderer):
+            return super().list(request, *args, **kwargs)
+        return self.get_conditional_response(request, self.get_streaming_response, *args, **kwargs)
+
+    def get_streaming_response(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.get_serializer(many=True).child
+        renderer = request.accepted_renderer
+
+        lines = (
+            renderer.render_line(serializer.to_representation(obj))
+            for obj in iterate_with_cursor(queryset, self.stream_chunk_size)
+        )
+        return StreamingHttpResponse(lines, content_type=renderer.media_type)
@@ -1,14 +1,15 @@
-from rest_flex_fields.views import FlexFieldsMixin
 from rest_framework import viewsets
 
 from ...datamodel.models import BesluitType
 from ..serializers import BesluitTypeSerializer
+from ..utils.caching import CacheResponseMixin
+from ..utils.rest_flex_fields import FlexFieldsMixin
 from ..utils.viewsets import (
-    FilterSearchOrderingViewSetMixin, NestedViewSetMixin
+    FilterSearchOrderingViewSetMixin, NestedViewSetMixin, StreamingListMixin
 )
 
 
-class BesluitTypeViewSet(NestedViewSetMixin, FilterSearchOrderingViewSetMixin, FlexFieldsMixin, viewsets.ReadOnlyModelViewSet):
+class BesluitTypeViewSet(NestedViewSetMixin, FilterSearchOrderingViewSetMixin, FlexFieldsMixin, StreamingListMixin, CacheResponseMixin, viewsets.ReadOnlyModelViewSet):
     """
     retrieve:
     Generieke aanduiding van de aard van een besluit.
@@ -1,14 +1,25 @@
+from itertools import chain
+
+from django.http import StreamingHttpResponse
+
+from drf_yasg.utils import swagger_auto_schema
 from rest_framework import viewsets
+from rest_framework.decorators import detail_route
 
 from ...datamodel.models import Catalogus
-from ..serializers import CatalogusSerializer
+from ..serializers import (
+    CatalogusSerializer, WijzigingenQuerySerializer, WijzigingSerializer
+)
+from ..utils.caching import CacheResponseMixin
+from ..utils.export import get_export_sections, stream_json
+from ..utils.renderers import JSONRenderer
 from ..utils.rest_flex_fields import FlexFieldsMixin
 from ..utils.viewsets import (
-    FilterSearchOrderingViewSetMixin, NestedViewSetMixin
+    FilterSearchOrderingViewSetMixin, NestedViewSetMixin, StreamingListMixin
 )
 
 
-class CatalogusViewSet(NestedViewSetMixin, FilterSearchOrderingViewSetMixin, FlexFieldsMixin, viewsets.ReadOnlyModelViewSet):
+class CatalogusViewSet(NestedViewSetMixin, FilterSearchOrderingViewSetMixin, FlexFieldsMixin, StreamingListMixin, CacheResponseMixin, viewsets.ReadOnlyModelViewSet):
     """
     retrieve:
     De verzameling van ZAAKTYPEn - incl. daarvoor relevante objecttypen - voor een Domein die als één geheel beheerd
@@ -16,9 +27,50 @@ class CatalogusViewSet(NestedViewSetMixin, FilterSearchOrderingViewSetMixin, Fle
 
     list:
     Een verzameling van CATALOGUSsen.
+
+    wijzigingen:
+    De wijzigingen in de CATALOGUS, en de objecttypen die er deel van uitmaken, sinds een revisie.
+
+    export:
+    De CATALOGUS met alle objecttypen die er deel van uitmaken, in één JSON object. Naast de CATALOGUS zelf bevat het
+    een lijst per objecttype, onder dezelfde naam als in de URL van het objecttype.
     """
     # This makes the URLs consistent with `NestedSimpleRouter`, which uses `<prefix>_id` instead of `<prefix>_pk`.
     # lookup_url_kwarg = 'id'
 
     queryset = Catalogus.objects.all()
     serializer_class = CatalogusSerializer
+    # The number of objects of each objecttype that the export loads at once.
+    export_chunk_size = 100
+
+    @swagger_auto_schema(query_serializer=WijzigingenQuerySerializer, responses={200: WijzigingSerializer(many=True)})
+    @detail_route(methods=['get'])
+    def wijzigingen(self, request, *args, **kwargs):
+        catalogus = self.get_object()
+
+        query_serializer = WijzigingenQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+
+        queryset = catalogus.wijzigingen.filter(revisie__gt=query_serializer.validated_data['sinds_revisie'])
+        page = self.paginate_queryset(queryset)
+        serializer = WijzigingSerializer(page, many=True, context=self.get_serializer_context())
+        return self.get_paginated_response(serializer.data)
+
+    @swagger_auto_schema(responses={200: 'De CATALOGUS en alle objecttypen die er deel van uitmaken.'})
+    @detail_route(methods=['get'])
+    def export(self, request, *args, **kwargs):
+        return self.get_conditional_response(request, self.get_export_response, *args, **kwargs)
+
+    def get_export_response(self, request, *args, **kwargs):
+        """
+        Stream the export of the catalogus, so the objects are serialized while the response is sent.
+        """
+        from ..urls import catalogus_router, zaaktype_router
+
+        catalogus = self.get_object()
+        context = self.get_serializer_context()
+        sections = chain(
+            [('catalogus', self.get_serializer(catalogus).data)],
+            get_export_sections(catalogus, (catalogus_router, zaaktype_router), context, self.export_chunk_size),
+        )
+        return StreamingHttpResponse(stream_json(sections, JSONRenderer().render), content_type='application/json')
@@ -2,13 +2,14 @@ from rest_framework import viewsets
 
 from ...datamodel.models import Eigenschap
 from ..serializers import EigenschapSerializer
+from ..utils.caching import CacheResponseMixin
 from ..utils.rest_flex_fields import FlexFieldsMixin
 from ..utils.viewsets import (
-    FilterSearchOrderingViewSetMixin, NestedViewSetMixin
+    FilterSearchOrderingViewSetMixin, NestedViewSetMixin, StreamingListMixin
 )
 
 
-class EigenschapViewSet(NestedViewSetMixin, FilterSearchOrderingViewSetMixin, FlexFieldsMixin, viewsets.ReadOnlyModelViewSet):
+class EigenschapViewSet(NestedViewSetMixin, FilterSearchOrderingViewSetMixin, FlexFieldsMixin, StreamingListMixin, CacheResponseMixin, viewsets.ReadOnlyModelViewSet):
     """
     retrieve:
     Een relevant inhoudelijk gegeven dat bij ZAAKen van dit ZAAKTYPE geregistreerd moet kunnen worden en geen standaard
@@ -2,13 +2,14 @@ from rest_framework import viewsets
 
 from ...datamodel.models import InformatieObjectType
 from ..serializers import InformatieObjectTypeSerializer
+from ..utils.caching import CacheResponseMixin
 from ..utils.rest_flex_fields import FlexFieldsMixin
 from ..utils.viewsets import (
-    FilterSearchOrderingViewSetMixin, NestedViewSetMixin
+    FilterSearchOrderingViewSetMixin, NestedViewSetMixin, StreamingListMixin
 )
 
 
-class InformatieObjectTypeViewSet(NestedViewSetMixin, FilterSearchOrderingViewSetMixin, FlexFieldsMixin, viewsets.ReadOnlyModelViewSet):
+class InformatieObjectTypeViewSet(NestedViewSetMixin, FilterSearchOrderingViewSetMixin, FlexFieldsMixin, StreamingListMixin, CacheResponseMixin, viewsets.ReadOnlyModelViewSet):
     """
     retrieve:
     Aanduiding van de aard van INFORMATIEOBJECTen zoals gehanteerd door de zaakbehandelende organisatie.
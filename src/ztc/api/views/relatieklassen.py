@@ -8,13 +8,14 @@ from ..serializers import (
     ZaakInformatieobjectTypeArchiefregimeSerializer,
     ZaakTypeInformatieObjectTypeSerializer, ZaakTypenRelatieSerializer
 )
+from ..utils.caching import CacheResponseMixin
 from ..utils.rest_flex_fields import FlexFieldsMixin
 from ..utils.viewsets import (
-    FilterSearchOrderingViewSetMixin, NestedViewSetMixin
+    FilterSearchOrderingViewSetMixin, NestedViewSetMixin, StreamingListMixin
 )
 
 
-class ZaakTypenRelatieViewSet(NestedViewSetMixin, FilterSearchOrderingViewSetMixin, FlexFieldsMixin, viewsets.ReadOnlyModelViewSet):
+class ZaakTypenRelatieViewSet(NestedViewSetMixin, FilterSearchOrderingViewSetMixin, FlexFieldsMixin, StreamingListMixin, CacheResponseMixin, viewsets.ReadOnlyModelViewSet):
     """
     retrieve:
     Relatie met zaaktype dat gerelateerd is aan het zaaktype.
@@ -26,7 +27,7 @@ class ZaakTypenRelatieViewSet(NestedViewSetMixin, FilterSearchOrderingViewSetMix
     serializer_class = ZaakTypenRelatieSerializer
 
 
-class ZaakTypeInformatieObjectTypeViewSet(NestedViewSetMixin, FilterSearchOrderingViewSetMixin, FlexFieldsMixin, viewsets.ReadOnlyModelViewSet):
+class ZaakTypeInformatieObjectTypeViewSet(NestedViewSetMixin, FilterSearchOrderingViewSetMixin, FlexFieldsMixin, StreamingListMixin, CacheResponseMixin, viewsets.ReadOnlyModelViewSet):
     """
     retrieve:
     Relatie met informatieobjecttype dat relevant is voor zaaktype.
@@ -38,7 +39,7 @@ class ZaakTypeInformatieObjectTypeViewSet(NestedViewSetMixin, FilterSearchOrderi
     serializer_class = ZaakTypeInformatieObjectTypeSerializer
 
 
-class ZaakInformatieobjectTypeArchiefregimeViewSet(NestedViewSetMixin, FilterSearchOrderingViewSetMixin, FlexFieldsMixin, viewsets.ReadOnlyModelViewSet):
+class ZaakInformatieobjectTypeArchiefregimeViewSet(NestedViewSetMixin, FilterSearchOrderingViewSetMixin, FlexFieldsMixin, StreamingListMixin, CacheResponseMixin, viewsets.ReadOnlyModelViewSet):
     """
     retrieve:
     Afwijkende archiveringskenmerken van informatieobjecten van een INFORMATIEOBJECTTYPE bij zaken van een ZAAKTYPE op
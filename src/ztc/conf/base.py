@@ -71,7 +71,8 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 
     'corsheaders.middleware.CorsMiddleware',
-    'ztc.api.middleware.APIVersionHeaderMiddleware'
+    'ztc.api.middleware.APIVersionHeaderMiddleware',
+    'ztc.api.middleware.CompressionMiddleware',
 ]
 
 ROOT_URLCONF = 'ztc.urls'
@@ -110,6 +111,26 @@ WSGI_APPLICATION = 'ztc.wsgi.application'
 # Database: Defined in target specific settings files.
 # https://docs.djangoproject.com/en/1.11/ref/settings/#databases
 
+# Caches
+# https://docs.djangoproject.com/en/1.11/ref/settings/#caches
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # Rendered API responses, see `ztc.api.utils.caching`.
+    'api': {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': 'redis://127.0.0.1:6379/0',
+        'KEY_PREFIX': 'ztc',
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            # The API keeps working without Redis, just without cached responses.
+            'IGNORE_EXCEPTIONS': True,
+        },
+    },
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/1.11/ref/settings/#auth-password-validators
 
@@ -284,6 +305,7 @@ SHOW_ALERT = True
 
 options.DEFAULT_NAMES = options.DEFAULT_NAMES + (
     'mnemonic',
+    'catalogus_lookup',
 
     'filter_fields',
     'ordering_fields',
@@ -321,13 +343,16 @@ OAUTH2_PROVIDER = {
     'SCOPES': {
         'read': 'Read scope',
         'write': 'Write scope',
-    }
+    },
+    # Caches the access tokens, see `ztc.api.utils.oauth2`.
+    'OAUTH2_VALIDATOR_CLASS': 'ztc.api.utils.oauth2.OAuth2Validator',
 }
 
 # Django REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': (
-        'rest_framework.renderers.JSONRenderer',
+        'ztc.api.utils.renderers.JSONRenderer',
+        'ztc.api.utils.renderers.NDJSONRenderer',
         # 'rest_framework.renderers.BrowsableAPIRenderer',
     ),
     'DEFAULT_PARSER_CLASSES': (
@@ -354,7 +379,8 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'ztc.api.utils.pagination.HALPagination',
     'DEFAULT_FILTER_BACKENDS': (
         'django_filters.rest_framework.DjangoFilterBackend',
-        'rest_framework.filters.SearchFilter',
+        'ztc.api.utils.geldigheid.PeildatumFilter',
+        'ztc.api.utils.search.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ),
     #
@@ -436,9 +462,32 @@ REST_FRAMEWORK = {
 
 REST_FRAMEWORK_EXT = {
     'PAGE_PARAM': 'pagina',
+    'PAGE_SIZE_PARAM': 'paginagrootte',
+    'MAX_PAGE_SIZE': 1000,
+    'CURSOR_PARAM': 'cursor',
+    'PEILDATUM_PARAM': 'peildatum',
+    'ACTUEEL_PARAM': 'actueel',
     'EXPAND_PARAM': 'expand',
     'EXPAND_ALL_VALUE': 'true',
     'FIELDS_PARAM': 'fields',
+    'RESPONSE_CACHE': 'api',
+    'RESPONSE_CACHE_TIMEOUT': 60 * 60 * 24,
+    # One of 'exact', 'cached' or 'estimated', see `ztc.api.utils.pagination.HALPagination`.
+    'COUNT_STRATEGY': 'cached',
+    'COUNT_ESTIMATE_THRESHOLD': 100000,
+    # One of 'orjson' (used if it is installed) or 'json', see `ztc.api.utils.renderers.JSONRenderer`.
+    'JSON_ENCODER': 'orjson',
+    # Responses of at least this number of bytes are compressed, see `ztc.api.utils.compression`.
+    'COMPRESSION_MIN_LENGTH': 200,
+    # The schema files written by `manage.py generate_schema` are served from here, see `ztc.api.schema.SchemaView`.
+    'SCHEMA_DIR': os.path.join(BASE_DIR, 'schema'),
+    # Valid access tokens are cached in the shared cache and in the memory of each process, see
+    # `ztc.api.utils.oauth2`. A revoked token is removed from the shared cache right away, but other processes may
+    # still accept it for at most `TOKEN_CACHE_LOCAL_TIMEOUT` seconds.
+    'TOKEN_CACHE': 'api',
+    'TOKEN_CACHE_TIMEOUT': 60 * 5,
+    'TOKEN_CACHE_LOCAL_TIMEOUT': 10,
+    'TOKEN_CACHE_LOCAL_SIZE': 1024,
 }
 
 SWAGGER_SETTINGS = {
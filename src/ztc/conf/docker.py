@@ -34,6 +34,8 @@ DATABASES = {
     }
 }
 
+CACHES['api']['LOCATION'] = getenv('REDIS_URL', 'redis://redis:6379/0')
+
 # Hosts/domain names that are valid for this site; required if DEBUG is False
 # See https://docs.djangoproject.com/en/1.5/ref/settings/#allowed-hosts
 ALLOWED_HOSTS = getenv('ALLOWED_HOSTS', '*', split=True)
@@ -0,0 +1 @@
+default_app_config = 'ztc.datamodel.apps.DatamodelConfig'
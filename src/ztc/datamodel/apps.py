@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class DatamodelConfig(AppConfig):
+    name = 'ztc.datamodel'
+
+    def ready(self):
+        from . import search, signals  # noqa
@@ -125,3 +125,9 @@ class AardRelatieChoices(DjangoChoices):
     vervolg = ChoiceItem('vervolg', _('vervolg'))  # een zaak van het ZAAKTYPE is een te plannen vervolg op een zaak van het andere ZAAKTYPE
     bijdrage = ChoiceItem('bijdrage', _('bijdrage'))  # een zaak van het ZAAKTYPE levert een bijdrage aan het bereiken van de uitkomst van een zaak van het andere ZAAKTYPE
     onderwerp = ChoiceItem('onderwerp', _('onderwerp'))  # een zaak van het ZAAKTYPE heeft betrekking op een zaak van het andere ZAAKTYPE of een zaak van het andere ZAAKTYPE is relevant voor of is onderwerp van een zaak van het ZAAKTYPE
+
+
+class WijzigingSoort(DjangoChoices):
+    aangemaakt = ChoiceItem('aangemaakt', _('aangemaakt'))
+    gewijzigd = ChoiceItem('gewijzigd', _('gewijzigd'))
+    verwijderd = ChoiceItem('verwijderd', _('verwijderd'))
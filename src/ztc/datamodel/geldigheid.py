@@ -0,0 +1,38 @@
+"""
+Find the version of the objects that is valid on a date (the peildatum).
+
+Every model with the ``GeldigheidMixin`` is valid from its ``datum_begin_geldigheid`` up to and including its
+``datum_einde_geldigheid``, or indefinitely if it has none. The objects that are valid on a date are found with the
+``daterange`` of these fields, which has a ``GeldigheidIndex``, so this does not get slower as the history of versions
+grows. A period that ends before it begins is empty, so these objects are never valid. The tables have a check
+constraint against such periods, but it does not apply to the rows that existed before it was added.
+"""
+from django.contrib.postgres.fields import DateRangeField
+from django.db import models
+
+from .indexes import GELDIGHEID_SQL
+from .models.mixins import GeldigheidMixin
+
+
+class Geldigheid(models.Func):
+    """
+    The period of validity of the objects. It has to match the expression of the ``GeldigheidIndex`` for the index to be
+    used.
+    """
+    def __init__(self, **extra):
+        super().__init__('datum_begin_geldigheid', 'datum_einde_geldigheid', output_field=DateRangeField(), **extra)
+
+    def as_sql(self, compiler, connection):
+        (begin, begin_params), (einde, einde_params) = [
+            compiler.compile(expression) for expression in self.get_source_expressions()
+        ]
+        return GELDIGHEID_SQL.format(begin=begin, einde=einde), einde_params + begin_params * 2 + einde_params
+
+
+def filter_geldig_op(queryset, peildatum):
+    """
+    Return the objects in ``queryset`` that are valid on the date ``peildatum``.
+    """
+    if not issubclass(queryset.model, GeldigheidMixin):
+        return queryset
+    return queryset.annotate(geldigheid=Geldigheid()).filter(geldigheid__contains=peildatum)
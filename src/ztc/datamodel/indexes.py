@@ -0,0 +1,137 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+
+LOOKUP_SEP = '__'
+
+# The period of validity from ``begin`` up to and including ``einde``. A period that ends before it begins is empty,
+# instead of an error of ``daterange``.
+GELDIGHEID_SQL = "CASE WHEN {einde} < {begin} THEN 'empty'::daterange ELSE daterange({begin}, {einde}, '[]') END"
+
+
+class TrigramIndex(GinIndex):
+    """
+    A GIN index with the trigram operator class of ``pg_trgm`` on each of the fields. It is used to match any part of
+    the values, with ``LIKE`` and ``ILIKE`` patterns.
+    """
+    def get_sql_create_template_values(self, model, schema_editor, using):
+        parameters = super().get_sql_create_template_values(model, schema_editor, using)
+        parameters['columns'] = ', '.join(
+            '{} gin_trgm_ops'.format(schema_editor.quote_name(model._meta.get_field(field_name).column))
+            for field_name, order in self.fields_orders
+        )
+        return parameters
+
+
+class GeldigheidIndex(models.Index):
+    """
+    A GiST index on the period of validity, the ``daterange`` from the first to the second field (both inclusive, see
+    ``GELDIGHEID_SQL``). It is used to find the objects that are valid on a date, see ``ztc.datamodel.geldigheid``.
+    """
+    suffix = 'gist'
+
+    def create_sql(self, model, schema_editor):
+        return super().create_sql(model, schema_editor, using=' USING gist')
+
+    def get_sql_create_template_values(self, model, schema_editor, using):
+        parameters = super().get_sql_create_template_values(model, schema_editor, using)
+        begin, einde = [
+            schema_editor.quote_name(model._meta.get_field(field_name).column)
+            for field_name, order in self.fields_orders
+        ]
+        parameters['columns'] = '({})'.format(GELDIGHEID_SQL.format(begin=begin, einde=einde))
+        return parameters
+
+
+def get_trigram_fields(model):
+    """
+    Return the names of the fields of ``model`` with a trigram index.
+    """
+    return [
+        field_name
+        for index in model._meta.indexes if isinstance(index, TrigramIndex)
+        for field_name in index.fields
+    ]
+
+
+def get_local_field(model, name):
+    """
+    Return the concrete field ``name`` (or ``pk``) of ``model``, or ``None`` if it is a lookup that spans relations or
+    not a column of the model.
+    """
+    opts = model._meta
+    if name == 'pk':
+        return opts.pk
+    if LOOKUP_SEP in name:
+        return None
+    try:
+        field = opts.get_field(name)
+    except FieldDoesNotExist:
+        return None
+    return field if field.concrete and not field.many_to_many else None
+
+
+def get_parent_field(model):
+    """
+    Return the foreign key to the object that ``model`` is nested under (the first relation of its ``catalogus_lookup``),
+    or ``None``.
+    """
+    lookup = getattr(model._meta, 'catalogus_lookup', None)
+    if not lookup:
+        return None
+    field = get_local_field(model, lookup.split(LOOKUP_SEP)[0])
+    return field if field is not None and field.is_relation else None
+
+
+def get_indexed_fields(model):
+    """
+    Return the field names of all B-tree indexes of ``model``, including the implicit indexes of primary keys, foreign
+    keys and unique fields.
+    """
+    opts = model._meta
+    indexed = [[field.name] for field in opts.concrete_fields if field.primary_key or field.unique or field.db_index]
+    indexed += [list(fields) for fields in opts.unique_together]
+    indexed += [list(fields) for fields in opts.index_together]
+    indexed += [[name.lstrip('-') for name in index.fields] for index in opts.indexes if type(index) is models.Index]
+    return indexed
+
+
+def is_indexed(model, field_names):
+    """
+    Return whether an index of ``model`` starts with ``field_names``, so a lookup on these fields can use it.
+    """
+    return any(fields[:len(field_names)] == list(field_names) for fields in get_indexed_fields(model))
+
+
+def get_filter_indexes(model):
+    """
+    Return the indexes to filter and order ``model`` on its ``filter_fields``, ``ordering_fields`` and ``ordering``, that
+    are not covered by another index. These are declared in ``Meta.indexes`` of the models, so this should return none.
+
+    Nested resources are always filtered on their parent first, so these indexes are composite indexes on the foreign
+    key to the parent and the field.
+    """
+    opts = model._meta
+    parent = get_parent_field(model)
+    prefix = [parent.name] if parent is not None else []
+
+    wanted = []
+    for name in list(getattr(opts, 'filter_fields', ())) + list(getattr(opts, 'ordering_fields', ())):
+        field = get_local_field(model, name)
+        if field is not None and field.name not in prefix:
+            wanted.append(prefix + [field.name])
+
+    ordering = [get_local_field(model, name.lstrip('-')) if isinstance(name, str) else None for name in opts.ordering]
+    if ordering and None not in ordering:
+        wanted.append(prefix + [field.name for field in ordering if field.name not in prefix])
+
+    indexes = []
+    # Longer indexes also cover the lookups on their first fields.
+    for field_names in sorted(wanted, key=len, reverse=True):
+        if is_indexed(model, field_names) or any(index.fields[:len(field_names)] == field_names for index in indexes):
+            continue
+        index = models.Index(fields=field_names)
+        index.set_name_with_model(model)
+        indexes.append(index)
+    return indexes
+
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.9 on 2018-06-04 10:12
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('datamodel', '0009_auto_20180517_1642'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='catalogus',
+            name='revisie',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Wordt opgehoogd bij elke wijziging in de CATALOGUS of de objecttypen die er deel van uitmaken.', verbose_name='revisie'),
+        ),
+    ]
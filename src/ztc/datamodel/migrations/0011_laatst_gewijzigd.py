@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.9 on 2018-06-05 09:31
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('datamodel', '0010_catalogus_revisie'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='besluittype',
+            name='laatst_gewijzigd',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, help_text='Het tijdstip waarop het object voor het laatst is gewijzigd.', verbose_name='laatst gewijzigd'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='broncatalogus',
+            name='laatst_gewijzigd',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, help_text='Het tijdstip waarop het object voor het laatst is gewijzigd.', verbose_name='laatst gewijzigd'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='bronzaaktype',
+            name='laatst_gewijzigd',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, help_text='Het tijdstip waarop het object voor het laatst is gewijzigd.', verbose_name='laatst gewijzigd'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='catalogus',
+            name='laatst_gewijzigd',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, help_text='Het tijdstip waarop het object voor het laatst is gewijzigd.', verbose_name='laatst gewijzigd'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='checklistitem',
+            name='laatst_gewijzigd',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, help_text='Het tijdstip waarop het object voor het laatst is gewijzigd.', verbose_name='laatst gewijzigd'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='eigenschap',
+            name='laatst_gewijzigd',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, help_text='Het tijdstip waarop het object voor het laatst is gewijzigd.', verbose_name='laatst gewijzigd'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='eigenschapreferentie',
+            name='laatst_gewijzigd',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, help_text='Het tijdstip waarop het object voor het laatst is gewijzigd.', verbose_name='laatst gewijzigd'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='eigenschapspecificatie',
+            name='laatst_gewijzigd',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, help_text='Het tijdstip waarop het object voor het laatst is gewijzigd.', verbose_name='laatst gewijzigd'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='formulier',
+            name='laatst_gewijzigd',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, help_text='Het tijdstip waarop het object voor het laatst is gewijzigd.', verbose_name='laatst gewijzigd'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='informatieobjecttype',
+            name='laatst_gewijzigd',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, help_text='Het tijdstip waarop het object voor het laatst is gewijzigd.', verbose_name='laatst gewijzigd'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='informatieobjecttypeomschrijvinggeneriek',
+            name='laatst_gewijzigd',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, help_text='Het tijdstip waarop het object voor het laatst is gewijzigd.', verbose_name='laatst gewijzigd'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='productdienst',
+            name='laatst_gewijzigd',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, help_text='Het tijdstip waarop het object voor het laatst is gewijzigd.', verbose_name='laatst gewijzigd'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='referentieproces',
+            name='laatst_gewijzigd',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, help_text='Het tijdstip waarop het object voor het laatst is gewijzigd.', verbose_name='laatst gewijzigd'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='resultaattype',
+            name='laatst_gewijzigd',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, help_text='Het tijdstip waarop het object voor het laatst is gewijzigd.', verbose_name='laatst gewijzigd'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='roltype',
+            name='laatst_gewijzigd',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, help_text='Het tijdstip waarop het object voor het laatst is gewijzigd.', verbose_name='laatst gewijzigd'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='statustype',
+            name='laatst_gewijzigd',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, help_text='Het tijdstip waarop het object voor het laatst is gewijzigd.', verbose_name='laatst gewijzigd'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='zaakinformatieobjecttype',
+            name='laatst_gewijzigd',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, help_text='Het tijdstip waarop het object voor het laatst is gewijzigd.', verbose_name='laatst gewijzigd'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='zaakinformatieobjecttypearchiefregime',
+            name='laatst_gewijzigd',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, help_text='Het tijdstip waarop het object voor het laatst is gewijzigd.', verbose_name='laatst gewijzigd'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='zaakobjecttype',
+            name='laatst_gewijzigd',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, help_text='Het tijdstip waarop het object voor het laatst is gewijzigd.', verbose_name='laatst gewijzigd'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='zaaktype',
+            name='laatst_gewijzigd',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, help_text='Het tijdstip waarop het object voor het laatst is gewijzigd.', verbose_name='laatst gewijzigd'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='zaaktypenrelatie',
+            name='laatst_gewijzigd',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now, help_text='Het tijdstip waarop het object voor het laatst is gewijzigd.', verbose_name='laatst gewijzigd'),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.9 on 2018-06-06 14:02
+from __future__ import unicode_literals
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('datamodel', '0011_laatst_gewijzigd'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Wijziging',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('revisie', models.PositiveIntegerField(help_text='De revisie van de CATALOGUS na de wijziging.', verbose_name='revisie')),
+                ('soort', models.CharField(choices=[('aangemaakt', 'aangemaakt'), ('gewijzigd', 'gewijzigd'), ('verwijderd', 'verwijderd')], help_text='Of het object is aangemaakt, gewijzigd of verwijderd.', max_length=20, verbose_name='soort')),
+                ('resource', models.CharField(help_text='De naam van de API resource van het object.', max_length=50, verbose_name='resource')),
+                ('resource_kwargs', django.contrib.postgres.fields.jsonb.JSONField(help_text='De URL parameters van de API resource van het object.', verbose_name='resource kwargs')),
+                ('tijdstip', models.DateTimeField(auto_now_add=True, help_text='Het tijdstip van de wijziging.', verbose_name='tijdstip')),
+                ('catalogus', models.ForeignKey(db_constraint=False, help_text='De CATALOGUS waarin het object is gewijzigd.', on_delete=django.db.models.deletion.DO_NOTHING, related_name='wijzigingen', to='datamodel.Catalogus', verbose_name='catalogus')),
+            ],
+            options={
+                'verbose_name': 'wijziging',
+                'verbose_name_plural': 'wijzigingen',
+                'ordering': ('catalogus', 'revisie', 'pk'),
+            },
+        ),
+        migrations.AddIndex(
+            model_name='wijziging',
+            index=models.Index(fields=['catalogus', 'revisie'], name='wijziging_catalogus_rev_idx'),
+        ),
+    ]
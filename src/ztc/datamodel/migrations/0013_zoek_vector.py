@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.9 on 2018-06-08 10:12
+from __future__ import unicode_literals
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.operations import UnaccentExtension
+from django.db import migrations, models
+
+# The search fields of the models, in order of their weight, as they were when the search vectors were added.
+SEARCH_FIELDS = {
+    'besluittype': [
+        'besluittype_omschrijving', 'besluittype_omschrijving_generiek', 'besluitcategorie', 'toelichting',
+        'publicatietekst',
+    ],
+    'catalogus': ['domein', 'rsin', 'contactpersoon_beheer_naam'],
+    'eigenschap': ['eigenschapnaam', 'definitie', 'toelichting'],
+    'informatieobjecttype': [
+        'informatieobjecttype_omschrijving', 'informatieobjectcategorie', 'informatieobjecttypetrefwoord',
+        'toelichting',
+    ],
+    'resultaattype': [
+        'resultaattypeomschrijving', 'resultaattypeomschrijving_generiek', 'selectielijstklasse', 'toelichting',
+    ],
+    'roltype': ['roltypeomschrijving', 'roltypeomschrijving_generiek'],
+    'statustype': ['statustype_omschrijving', 'statustype_omschrijving_generiek', 'statustypevolgnummer'],
+    'zaakinformatieobjecttype': ['volgnummer'],
+    'zaakinformatieobjecttypearchiefregime': ['selectielijstklasse'],
+    'zaakobjecttype': ['objecttype', 'relatieomschrijving'],
+    'zaaktype': [
+        'zaaktype_identificatie', 'zaaktype_omschrijving', 'zaaktype_omschrijving_generiek', 'zaakcategorie', 'doel',
+        'aanleiding', 'onderwerp', 'toelichting',
+    ],
+    'zaaktypenrelatie': ['toelichting'],
+}
+
+WEIGHTS = ('A', 'B', 'C', 'D')
+
+
+def get_text_sql(field, column):
+    if isinstance(field, ArrayField):
+        return "array_to_string({}, ' ')".format(column)
+    if isinstance(field, (models.CharField, models.TextField)):
+        return column
+    return '{}::text'.format(column)
+
+
+def update_zoek_vectors(apps, schema_editor):
+    quote_name = schema_editor.quote_name
+    for model_name, search_fields in SEARCH_FIELDS.items():
+        model = apps.get_model('datamodel', model_name)
+        vectors = []
+        for i, name in enumerate(search_fields):
+            field = model._meta.get_field(name)
+            vectors.append("setweight(to_tsvector('dutch_unaccent'::regconfig, COALESCE({}, '')), '{}')".format(
+                get_text_sql(field, quote_name(field.column)), WEIGHTS[min(i, len(WEIGHTS) - 1)]))
+        schema_editor.execute('UPDATE {} SET zoek_vector = {}'.format(
+            quote_name(model._meta.db_table), ' || '.join(vectors)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('datamodel', '0012_wijziging'),
+    ]
+
+    operations = [
+        UnaccentExtension(),
+        migrations.RunSQL(
+            sql=[
+                'CREATE TEXT SEARCH CONFIGURATION dutch_unaccent ( COPY = pg_catalog.dutch )',
+                'ALTER TEXT SEARCH CONFIGURATION dutch_unaccent '
+                'ALTER MAPPING FOR hword, hword_part, word WITH unaccent, dutch_stem',
+            ],
+            reverse_sql='DROP TEXT SEARCH CONFIGURATION dutch_unaccent',
+        ),
+        migrations.AddField(
+            model_name='besluittype',
+            name='zoek_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='catalogus',
+            name='zoek_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='eigenschap',
+            name='zoek_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='informatieobjecttype',
+            name='zoek_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='resultaattype',
+            name='zoek_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='roltype',
+            name='zoek_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='statustype',
+            name='zoek_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='zaakinformatieobjecttype',
+            name='zoek_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='zaakinformatieobjecttypearchiefregime',
+            name='zoek_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='zaakobjecttype',
+            name='zoek_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='zaaktype',
+            name='zoek_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='zaaktypenrelatie',
+            name='zoek_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(update_zoek_vectors, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='besluittype',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['zoek_vector'], name='besluittype_zoek_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='catalogus',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['zoek_vector'], name='catalogus_zoek_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eigenschap',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['zoek_vector'], name='eigenschap_zoek_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='informatieobjecttype',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['zoek_vector'], name='iotype_zoek_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resultaattype',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['zoek_vector'], name='resultaattype_zoek_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='roltype',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['zoek_vector'], name='roltype_zoek_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='statustype',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['zoek_vector'], name='statustype_zoek_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zaakinformatieobjecttype',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['zoek_vector'], name='ziotype_zoek_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zaakinformatieobjecttypearchiefregime',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['zoek_vector'], name='ziotypearchief_zoek_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zaakobjecttype',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['zoek_vector'], name='zaakobjecttype_zoek_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zaaktype',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['zoek_vector'], name='zaaktype_zoek_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zaaktypenrelatie',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['zoek_vector'], name='zaaktypenrelatie_zoek_idx'),
+        ),
+    ]
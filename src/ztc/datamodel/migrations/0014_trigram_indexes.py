@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.9 on 2018-06-11 09:47
+from __future__ import unicode_literals
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+import ztc.datamodel.indexes
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('datamodel', '0013_zoek_vector'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='besluittype',
+            index=ztc.datamodel.indexes.TrigramIndex(fields=['besluittype_omschrijving', 'besluittype_omschrijving_generiek', 'besluitcategorie'], name='besluittype_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='catalogus',
+            index=ztc.datamodel.indexes.TrigramIndex(fields=['domein', 'rsin', 'contactpersoon_beheer_naam'], name='catalogus_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eigenschap',
+            index=ztc.datamodel.indexes.TrigramIndex(fields=['eigenschapnaam'], name='eigenschap_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='informatieobjecttype',
+            index=ztc.datamodel.indexes.TrigramIndex(fields=['informatieobjecttype_omschrijving', 'informatieobjectcategorie'], name='iotype_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resultaattype',
+            index=ztc.datamodel.indexes.TrigramIndex(fields=['resultaattypeomschrijving', 'resultaattypeomschrijving_generiek', 'selectielijstklasse'], name='resultaattype_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='roltype',
+            index=ztc.datamodel.indexes.TrigramIndex(fields=['roltypeomschrijving', 'roltypeomschrijving_generiek'], name='roltype_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='statustype',
+            index=ztc.datamodel.indexes.TrigramIndex(fields=['statustype_omschrijving', 'statustype_omschrijving_generiek'], name='statustype_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zaakinformatieobjecttypearchiefregime',
+            index=ztc.datamodel.indexes.TrigramIndex(fields=['selectielijstklasse'], name='ziotypearchief_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zaakobjecttype',
+            index=ztc.datamodel.indexes.TrigramIndex(fields=['objecttype', 'relatieomschrijving'], name='zaakobjecttype_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zaaktype',
+            index=ztc.datamodel.indexes.TrigramIndex(fields=['zaaktype_omschrijving', 'zaaktype_omschrijving_generiek', 'zaakcategorie'], name='zaaktype_trgm_idx'),
+        ),
+    ]
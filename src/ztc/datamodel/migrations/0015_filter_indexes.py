@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.9 on 2018-06-12 10:21
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('datamodel', '0014_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='catalogus',
+            index=models.Index(fields=['rsin'], name='datamodel_c_rsin_ccf305_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='informatieobjecttype',
+            index=models.Index(fields=['maakt_deel_uit_van', 'informatieobjectcategorie'], name='datamodel_i_maakt_d_1118d0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resultaattype',
+            index=models.Index(fields=['is_relevant_voor', 'archiefnominatie'], name='datamodel_r_is_rele_ddfd4e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resultaattype',
+            index=models.Index(fields=['is_relevant_voor', 'brondatum_archiefprocedure'], name='datamodel_r_is_rele_9ace71_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='statustype',
+            index=models.Index(fields=['is_van', 'informeren'], name='datamodel_s_is_van__81627c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zaakinformatieobjecttype',
+            index=models.Index(fields=['zaaktype', 'informatie_object_type'], name='datamodel_z_zaaktyp_fa6cb7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zaakinformatieobjecttype',
+            index=models.Index(fields=['zaaktype', 'richting'], name='datamodel_z_zaaktyp_64c51e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zaakinformatieobjecttypearchiefregime',
+            index=models.Index(fields=['zaak_informatieobject_type', 'archiefnominatie'], name='datamodel_z_zaak_in_1f5dbe_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zaakinformatieobjecttypearchiefregime',
+            index=models.Index(fields=['zaak_informatieobject_type', 'id'], name='datamodel_z_zaak_in_73eb4b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zaakobjecttype',
+            index=models.Index(fields=['is_relevant_voor', 'ander_objecttype'], name='datamodel_z_is_rele_de482a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zaaktype',
+            index=models.Index(fields=['maakt_deel_uit_van', 'publicatie_indicatie'], name='datamodel_z_maakt_d_664db5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zaaktype',
+            index=models.Index(fields=['maakt_deel_uit_van', 'verlenging_mogelijk'], name='datamodel_z_maakt_d_955dea_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zaaktype',
+            index=models.Index(fields=['maakt_deel_uit_van', 'opschorting_aanhouding_mogelijk'], name='datamodel_z_maakt_d_b1d991_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zaaktype',
+            index=models.Index(fields=['maakt_deel_uit_van', 'indicatie_intern_of_extern'], name='datamodel_z_maakt_d_59d8eb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zaaktype',
+            index=models.Index(fields=['maakt_deel_uit_van', 'vertrouwelijkheidaanduiding'], name='datamodel_z_maakt_d_ff422f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zaaktypenrelatie',
+            index=models.Index(fields=['zaaktype_van', 'aard_relatie'], name='datamodel_z_zaaktyp_df6dbb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zaaktypenrelatie',
+            index=models.Index(fields=['zaaktype_van', 'id'], name='datamodel_z_zaaktyp_da8789_idx'),
+        ),
+    ]
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.9 on 2018-06-13 14:05
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+import ztc.datamodel.indexes
+
+MODEL_NAMES = [
+    'besluittype',
+    'eigenschap',
+    'informatieobjecttype',
+    'resultaattype',
+    'roltype',
+    'statustype',
+    'zaakobjecttype',
+    'zaaktype',
+]
+
+
+def check_geldigheid(model_name):
+    """
+    Return the operation to add a check constraint that the period of validity does not end before it begins. It is
+    ``NOT VALID``, so it only applies to new and changed rows: existing rows are left alone and can be fixed by hand.
+    """
+    table = 'datamodel_{}'.format(model_name)
+    return migrations.RunSQL(
+        sql='ALTER TABLE {table} ADD CONSTRAINT {table}_geldigheid_check '
+            'CHECK (datum_einde_geldigheid IS NULL OR datum_einde_geldigheid >= datum_begin_geldigheid) '
+            'NOT VALID'.format(table=table),
+        reverse_sql='ALTER TABLE {table} DROP CONSTRAINT {table}_geldigheid_check'.format(table=table),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('datamodel', '0015_filter_indexes'),
+    ]
+
+    operations = [check_geldigheid(model_name) for model_name in MODEL_NAMES] + [
+        migrations.AddIndex(
+            model_name='besluittype',
+            index=ztc.datamodel.indexes.GeldigheidIndex(fields=['datum_begin_geldigheid', 'datum_einde_geldigheid'], name='besluittype_geldig_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eigenschap',
+            index=ztc.datamodel.indexes.GeldigheidIndex(fields=['datum_begin_geldigheid', 'datum_einde_geldigheid'], name='eigenschap_geldig_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='informatieobjecttype',
+            index=ztc.datamodel.indexes.GeldigheidIndex(fields=['datum_begin_geldigheid', 'datum_einde_geldigheid'], name='iotype_geldig_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resultaattype',
+            index=ztc.datamodel.indexes.GeldigheidIndex(fields=['datum_begin_geldigheid', 'datum_einde_geldigheid'], name='resultaattype_geldig_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='roltype',
+            index=ztc.datamodel.indexes.GeldigheidIndex(fields=['datum_begin_geldigheid', 'datum_einde_geldigheid'], name='roltype_geldig_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='statustype',
+            index=ztc.datamodel.indexes.GeldigheidIndex(fields=['datum_begin_geldigheid', 'datum_einde_geldigheid'], name='statustype_geldig_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zaakobjecttype',
+            index=ztc.datamodel.indexes.GeldigheidIndex(fields=['datum_begin_geldigheid', 'datum_einde_geldigheid'], name='zaakobjecttype_geldig_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='zaaktype',
+            index=ztc.datamodel.indexes.GeldigheidIndex(fields=['datum_begin_geldigheid', 'datum_einde_geldigheid'], name='zaaktype_geldig_idx'),
+        ),
+    ]
@@ -7,3 +7,4 @@ from .resultaattype import *  # noqa
 from .roltype import *  # noqa
 from .statustype import *  # noqa
 from .zaken import *  # noqa
+from .wijziging import *  # noqa
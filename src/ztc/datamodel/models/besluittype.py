@@ -1,15 +1,17 @@
 from datetime import timedelta
 
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
 
 from ..choices import JaNee
-from .mixins import GeldigheidMixin
+from ..indexes import GeldigheidIndex, TrigramIndex
+from .mixins import GeldigheidMixin, LaatstGewijzigdMixin, ZoekMixin
 
 
-class BesluitType(GeldigheidMixin, models.Model):
+class BesluitType(GeldigheidMixin, LaatstGewijzigdMixin, ZoekMixin, models.Model):
     """
     Generieke aanduiding van de aard van een besluit.
 
@@ -70,7 +72,17 @@ class BesluitType(GeldigheidMixin, models.Model):
         unique_together = ('maakt_deel_uit_van', 'besluittype_omschrijving')
         verbose_name = _('Besluittype')
         verbose_name_plural = _('Besluittypen')
+        catalogus_lookup = 'maakt_deel_uit_van'
         ordering = unique_together
+        indexes = [
+            GinIndex(fields=['zoek_vector'], name='besluittype_zoek_idx'),
+            TrigramIndex(fields=[
+                'besluittype_omschrijving',
+                'besluittype_omschrijving_generiek',
+                'besluitcategorie',
+            ], name='besluittype_trgm_idx'),
+            GeldigheidIndex(fields=['datum_begin_geldigheid', 'datum_einde_geldigheid'], name='besluittype_geldig_idx'),
+        ]
 
         filter_fields = (
             'maakt_deel_uit_van',
@@ -1,11 +1,14 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import validate_integer
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
 
+from ..indexes import TrigramIndex
 from ..validators import validate_uppercase
+from .mixins import LaatstGewijzigdMixin, ZoekMixin
 
 
-class Catalogus(models.Model):
+class Catalogus(LaatstGewijzigdMixin, ZoekMixin, models.Model):
     """
     De verzameling van ZAAKTYPEn - incl. daarvoor relevante objecttypen - voor een Domein die als één geheel beheerd
     wordt.
@@ -40,12 +43,22 @@ class Catalogus(models.Model):
         _('emailadres'), max_length=254, blank=True, null=True,
         help_text=_('Het emailadres van de contactpersoon die verantwoordelijk is voor het beheer van de CATALOGUS.'))
 
+    revisie = models.PositiveIntegerField(
+        _('revisie'), default=0, editable=False,
+        help_text=_('Wordt opgehoogd bij elke wijziging in de CATALOGUS of de objecttypen die er deel van uitmaken.'))
+
     class Meta:
         mnemonic = 'CAT'
         unique_together = ('domein', 'rsin')
         verbose_name = _('Catalogus')
         verbose_name_plural = _('Catalogussen')
+        catalogus_lookup = 'pk'
         ordering = unique_together
+        indexes = [
+            GinIndex(fields=['zoek_vector'], name='catalogus_zoek_idx'),
+            TrigramIndex(fields=['domein', 'rsin', 'contactpersoon_beheer_naam'], name='catalogus_trgm_idx'),
+            models.Index(fields=['rsin'], name='datamodel_c_rsin_ccf305_idx'),
+        ]
 
         filter_fields = (
             'domein',
@@ -60,3 +73,12 @@ class Catalogus(models.Model):
 
     def __str__(self):
         return '{} - {}'.format(self.domein, self.rsin)
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and not kwargs.get('force_insert') and kwargs.get('update_fields') is None:
+            # The revisie is only changed by (atomic) updates, see `ztc.datamodel.signals`. Saving an instance should
+            # never overwrite it with a stale value.
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields if not field.primary_key and field.name != 'revisie'
+            ]
+        super().save(*args, **kwargs)
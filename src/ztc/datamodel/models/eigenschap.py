@@ -2,20 +2,22 @@ from datetime import timedelta
 from decimal import Decimal, InvalidOperation
 
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
 
 from ..choices import FormaatChoices
+from ..indexes import GeldigheidIndex, TrigramIndex
 from ..validators import (
     validate_kardinaliteit, validate_letters_numbers_underscores,
     validate_letters_numbers_underscores_spaces
 )
 
-from .mixins import GeldigheidMixin
+from .mixins import GeldigheidMixin, LaatstGewijzigdMixin, ZoekMixin
 
 
-class EigenschapSpecificatie(models.Model):
+class EigenschapSpecificatie(LaatstGewijzigdMixin, models.Model):
     """
     Met de ‘subattributen’ (van deze groepattribuutsoort) Groep, Formaat, Lengte, Kardinaliteit en Waardenverzameling
     wordt een eigenschap gedetailleerd gespecificeerd. Dit vindt alleen plaats als de eigenschap niet gespecificeerd is
@@ -41,6 +43,7 @@ class EigenschapSpecificatie(models.Model):
     class Meta:
         verbose_name = _('Eigenschap specificatie')
         verbose_name_plural = _('Eigenschap specificaties')
+        catalogus_lookup = 'eigenschap__is_van__maakt_deel_uit_van'
 
     def clean(self):
         """
@@ -75,7 +78,7 @@ class EigenschapSpecificatie(models.Model):
                 raise ValidationError(_("Als formaat datum/tijd is, moet de lengte 14 zijn."))
 
 
-class EigenschapReferentie(models.Model):
+class EigenschapReferentie(LaatstGewijzigdMixin, models.Model):
     """
     Met de ‘subattributen’ (van deze groepattribuutsoort) Objecttype, Informatiemodel, Namespace, Schemalocatie, X-path
     element en Entiteittype wordt een eigenschap gespecificeerd door te refereren naar een berichtenmodel cq. namespace
@@ -106,6 +109,7 @@ class EigenschapReferentie(models.Model):
     class Meta:
         verbose_name = _('Eigenschap referentie')
         verbose_name_plural = _('Eigenschap referenties')
+        catalogus_lookup = 'eigenschap__is_van__maakt_deel_uit_van'
 
     def clean(self):
         """
@@ -120,7 +124,7 @@ class EigenschapReferentie(models.Model):
         pass
 
 
-class Eigenschap(GeldigheidMixin, models.Model):
+class Eigenschap(GeldigheidMixin, LaatstGewijzigdMixin, ZoekMixin, models.Model):
     """
     Een relevant inhoudelijk gegeven dat bij ZAAKen van dit ZAAKTYPE geregistreerd moet kunnen worden en geen standaard
     kenmerk is van een zaak.
@@ -187,7 +191,13 @@ class Eigenschap(GeldigheidMixin, models.Model):
         unique_together = ('is_van', 'eigenschapnaam')
         verbose_name = _('Eigenschap')
         verbose_name_plural = _('Eigenschappen')
+        catalogus_lookup = 'is_van__maakt_deel_uit_van'
         ordering = unique_together
+        indexes = [
+            GinIndex(fields=['zoek_vector'], name='eigenschap_zoek_idx'),
+            TrigramIndex(fields=['eigenschapnaam'], name='eigenschap_trgm_idx'),
+            GeldigheidIndex(fields=['datum_begin_geldigheid', 'datum_einde_geldigheid'], name='eigenschap_geldig_idx'),
+        ]
 
         filter_fields = (
             'is_van',
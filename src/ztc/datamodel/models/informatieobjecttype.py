@@ -1,13 +1,15 @@
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
 
 from ..choices import VertrouwelijkheidAanduiding
-from .mixins import GeldigheidMixin
+from ..indexes import GeldigheidIndex, TrigramIndex
+from .mixins import GeldigheidMixin, LaatstGewijzigdMixin, ZoekMixin
 
 
-class InformatieObjectTypeOmschrijvingGeneriek(GeldigheidMixin, models.Model):
+class InformatieObjectTypeOmschrijvingGeneriek(GeldigheidMixin, LaatstGewijzigdMixin, models.Model):
     """
     Algemeen binnen de overheid gehanteerde omschrijvingen van de typen informatieobjecten
 
@@ -40,6 +42,7 @@ class InformatieObjectTypeOmschrijvingGeneriek(GeldigheidMixin, models.Model):
         mnemonic = 'DOG'
         verbose_name = _('Generieke informatieobjecttype-omschrijving')
         verbose_name_plural = _('Generieke informatieobjecttype-omschrijvingen')
+        catalogus_lookup = 'informatieobjecttype__maakt_deel_uit_van'
 
     def __str__(self):
         return self.informatieobjecttype_omschrijving_generiek
@@ -53,7 +56,7 @@ class InformatieObjectTypeOmschrijvingGeneriek(GeldigheidMixin, models.Model):
         super().clean()
 
 
-class InformatieObjectType(GeldigheidMixin, models.Model):
+class InformatieObjectType(GeldigheidMixin, LaatstGewijzigdMixin, ZoekMixin, models.Model):
     """
     Aanduiding van de aard van INFORMATIEOBJECTen zoals gehanteerd door de zaakbehandelende organisatie.
 
@@ -99,7 +102,18 @@ class InformatieObjectType(GeldigheidMixin, models.Model):
         unique_together = ('maakt_deel_uit_van', 'informatieobjecttype_omschrijving')
         verbose_name = _('Informatieobjecttype')
         verbose_name_plural = _('Informatieobjecttypen')
+        catalogus_lookup = 'maakt_deel_uit_van'
         ordering = unique_together
+        indexes = [
+            GinIndex(fields=['zoek_vector'], name='iotype_zoek_idx'),
+            TrigramIndex(fields=[
+                'informatieobjecttype_omschrijving',
+                'informatieobjectcategorie',
+            ], name='iotype_trgm_idx'),
+            GeldigheidIndex(fields=['datum_begin_geldigheid', 'datum_einde_geldigheid'], name='iotype_geldig_idx'),
+            models.Index(
+                fields=['maakt_deel_uit_van', 'informatieobjectcategorie'], name='datamodel_i_maakt_d_1118d0_idx'),
+        ]
 
         filter_fields = (
             'maakt_deel_uit_van',
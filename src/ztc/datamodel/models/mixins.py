@@ -1,5 +1,6 @@
 from datetime import timedelta
 
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
@@ -85,3 +86,23 @@ class GeldigheidMixin(models.Model):
         if self.datum_einde_geldigheid:
             if self.datum_einde_geldigheid + timedelta(days=1) != zaaktype.versiedatum:
                 raise ValidationError(_("'Datum einde geldigheid' moet gelijk zijn aan de dag voor een Versiedatum van het gerelateerde zaaktype."))
+
+
+class LaatstGewijzigdMixin(models.Model):
+    laatst_gewijzigd = models.DateTimeField(
+        _('laatst gewijzigd'), auto_now=True, db_index=True,
+        help_text=_('Het tijdstip waarop het object voor het laatst is gewijzigd.'))
+
+    class Meta:
+        abstract = True
+
+
+class ZoekMixin(models.Model):
+    """
+    Keep the ``search_fields`` of the model in a full-text search vector, which is updated on save (see
+    ``ztc.datamodel.search``). Each model indexes the vector with a ``GinIndex`` in its ``Meta.indexes``.
+    """
+    zoek_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        abstract = True
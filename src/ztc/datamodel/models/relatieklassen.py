@@ -1,3 +1,4 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
@@ -6,8 +7,11 @@ from ztc.datamodel.choices import (
     AardRelatieChoices, ArchiefNominatieChoices, RichtingChoices
 )
 
+from ..indexes import TrigramIndex
+from .mixins import LaatstGewijzigdMixin, ZoekMixin
 
-class ZaakInformatieobjectType(models.Model):
+
+class ZaakInformatieobjectType(LaatstGewijzigdMixin, ZoekMixin, models.Model):
     """
     ZAAK-INFORMATIEOBJECT-TYPE
 
@@ -37,7 +41,13 @@ class ZaakInformatieobjectType(models.Model):
         unique_together = ('zaaktype', 'volgnummer',)
         verbose_name = _('Zaak-Informatieobject-Type')
         verbose_name_plural = _('Zaak-Informatieobject-Typen')
+        catalogus_lookup = 'zaaktype__maakt_deel_uit_van'
         ordering = unique_together
+        indexes = [
+            GinIndex(fields=['zoek_vector'], name='ziotype_zoek_idx'),
+            models.Index(fields=['zaaktype', 'informatie_object_type'], name='datamodel_z_zaaktyp_fa6cb7_idx'),
+            models.Index(fields=['zaaktype', 'richting'], name='datamodel_z_zaaktyp_64c51e_idx'),
+        ]
 
         filter_fields = (
             'zaaktype',
@@ -46,14 +56,14 @@ class ZaakInformatieobjectType(models.Model):
         )
         ordering_fields = filter_fields
         search_fields = (
-            'volgnummer'
+            'volgnummer',
         )
 
     def __str__(self):
         return '{} - {}'.format(self.zaaktype, self.volgnummer)
 
 
-class ZaakInformatieobjectTypeArchiefregime(models.Model):
+class ZaakInformatieobjectTypeArchiefregime(LaatstGewijzigdMixin, ZoekMixin, models.Model):
     """
     ZAAK-INFORMATIETOBJECT-TYPE ARCHIEFREGIME
 
@@ -88,7 +98,15 @@ class ZaakInformatieobjectTypeArchiefregime(models.Model):
         unique_together = ('zaak_informatieobject_type', 'resultaattype')
         verbose_name = _('Zaak-Informatieobject-Type Archiefregime')
         verbose_name_plural = _('Zaak-Informatieobject-Type Archiefregimes')
+        catalogus_lookup = 'zaak_informatieobject_type__zaaktype__maakt_deel_uit_van'
         ordering = ('pk', )
+        indexes = [
+            GinIndex(fields=['zoek_vector'], name='ziotypearchief_zoek_idx'),
+            TrigramIndex(fields=['selectielijstklasse'], name='ziotypearchief_trgm_idx'),
+            models.Index(
+                fields=['zaak_informatieobject_type', 'archiefnominatie'], name='datamodel_z_zaak_in_1f5dbe_idx'),
+            models.Index(fields=['zaak_informatieobject_type', 'id'], name='datamodel_z_zaak_in_73eb4b_idx'),
+        ]
 
         filter_fields = (
             'zaak_informatieobject_type',
@@ -104,7 +122,7 @@ class ZaakInformatieobjectTypeArchiefregime(models.Model):
         return '{} - {}'.format('zaak_informatieobject_type', 'resultaattype')
 
 
-class ZaakTypenRelatie(models.Model):
+class ZaakTypenRelatie(LaatstGewijzigdMixin, ZoekMixin, models.Model):
     """
     ZAAKTYPENRELATIE
 
@@ -125,7 +143,13 @@ class ZaakTypenRelatie(models.Model):
         unique_together = ('zaaktype_van', 'zaaktype_naar')
         verbose_name = _('Zaaktypenrelatie')
         verbose_name_plural = _('Zaaktypenrelaties')
+        catalogus_lookup = 'zaaktype_van__maakt_deel_uit_van'
         ordering = ('pk', )
+        indexes = [
+            GinIndex(fields=['zoek_vector'], name='zaaktypenrelatie_zoek_idx'),
+            models.Index(fields=['zaaktype_van', 'aard_relatie'], name='datamodel_z_zaaktyp_df6dbb_idx'),
+            models.Index(fields=['zaaktype_van', 'id'], name='datamodel_z_zaaktyp_da8789_idx'),
+        ]
 
         filter_fields = (
             'zaaktype_van',
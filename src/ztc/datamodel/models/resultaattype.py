@@ -1,13 +1,15 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import MaxValueValidator
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
 
 from ..choices import ArchiefNominaties, ArchiefProcedure
+from ..indexes import GeldigheidIndex, TrigramIndex
 
-from .mixins import GeldigheidMixin
+from .mixins import GeldigheidMixin, LaatstGewijzigdMixin, ZoekMixin
 
 
-class ResultaatType(GeldigheidMixin, models.Model):
+class ResultaatType(GeldigheidMixin, LaatstGewijzigdMixin, ZoekMixin, models.Model):
     """
     Het betreft de indeling of groepering van resultaten van zaken van hetzelfde
     ZAAKTYPE naar hun aard, zoals 'verleend', 'geweigerd', 'verwerkt', et cetera.
@@ -88,7 +90,20 @@ class ResultaatType(GeldigheidMixin, models.Model):
         unique_together = ('is_relevant_voor', 'resultaattypeomschrijving')
         verbose_name = _('Resultaattype')
         verbose_name_plural = _('Resultaattypen')
+        catalogus_lookup = 'is_relevant_voor__maakt_deel_uit_van'
         ordering = unique_together
+        indexes = [
+            GinIndex(fields=['zoek_vector'], name='resultaattype_zoek_idx'),
+            TrigramIndex(fields=[
+                'resultaattypeomschrijving',
+                'resultaattypeomschrijving_generiek',
+                'selectielijstklasse',
+            ], name='resultaattype_trgm_idx'),
+            GeldigheidIndex(fields=['datum_begin_geldigheid', 'datum_einde_geldigheid'], name='resultaattype_geldig_idx'),
+            models.Index(fields=['is_relevant_voor', 'archiefnominatie'], name='datamodel_r_is_rele_ddfd4e_idx'),
+            models.Index(
+                fields=['is_relevant_voor', 'brondatum_archiefprocedure'], name='datamodel_r_is_rele_9ace71_idx'),
+        ]
 
         filter_fields = (
             'is_relevant_voor',
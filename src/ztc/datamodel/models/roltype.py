@@ -1,13 +1,15 @@
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
 
 from ..choices import RolTypeOmschrijving
+from ..indexes import GeldigheidIndex, TrigramIndex
 
-from .mixins import GeldigheidMixin
+from .mixins import GeldigheidMixin, LaatstGewijzigdMixin, ZoekMixin
 
 
-class RolType(GeldigheidMixin, models.Model):
+class RolType(GeldigheidMixin, LaatstGewijzigdMixin, ZoekMixin, models.Model):
     """
     Generieke aanduiding van de aard van een ROL die een BETROKKENE kan
     uitoefenen in ZAAKen van een ZAAKTYPE.
@@ -47,7 +49,13 @@ class RolType(GeldigheidMixin, models.Model):
         unique_together = ('is_van', 'roltypeomschrijving')
         verbose_name = _('Roltype')
         verbose_name_plural = _('Roltypen')
+        catalogus_lookup = 'is_van__maakt_deel_uit_van'
         ordering = unique_together
+        indexes = [
+            GinIndex(fields=['zoek_vector'], name='roltype_zoek_idx'),
+            TrigramIndex(fields=['roltypeomschrijving', 'roltypeomschrijving_generiek'], name='roltype_trgm_idx'),
+            GeldigheidIndex(fields=['datum_begin_geldigheid', 'datum_einde_geldigheid'], name='roltype_geldig_idx'),
+        ]
 
         filter_fields = (
             'is_van',
@@ -1,5 +1,6 @@
 from datetime import timedelta
 
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
@@ -7,10 +8,11 @@ from django.utils.translation import ugettext_lazy as _
 
 
 from ..choices import JaNee
-from .mixins import GeldigheidMixin
+from ..indexes import GeldigheidIndex, TrigramIndex
+from .mixins import GeldigheidMixin, LaatstGewijzigdMixin, ZoekMixin
 
 
-class CheckListItem(models.Model):
+class CheckListItem(LaatstGewijzigdMixin, models.Model):
     """
     Te controleren aandachtspunt voorafgaand aan het bereiken van een status van het STATUSTYPE.
 
@@ -31,8 +33,11 @@ class CheckListItem(models.Model):
     toelichting = models.CharField(_('toelichting'), max_length=1000, blank=True, null=True, help_text=_(
         'Beschrijving van de overwegingen bij het controleren van het aandachtspunt'))
 
+    class Meta:
+        catalogus_lookup = 'statustype__is_van__maakt_deel_uit_van'
+
 
-class StatusType(GeldigheidMixin, models.Model):
+class StatusType(GeldigheidMixin, LaatstGewijzigdMixin, ZoekMixin, models.Model):
     """
     Generieke aanduiding van de aard van een STATUS
 
@@ -80,7 +85,17 @@ class StatusType(GeldigheidMixin, models.Model):
         unique_together = ('is_van', 'statustypevolgnummer')
         verbose_name = _('Statustype')
         verbose_name_plural = _('Statustypen')
+        catalogus_lookup = 'is_van__maakt_deel_uit_van'
         ordering = unique_together
+        indexes = [
+            GinIndex(fields=['zoek_vector'], name='statustype_zoek_idx'),
+            TrigramIndex(fields=[
+                'statustype_omschrijving',
+                'statustype_omschrijving_generiek',
+            ], name='statustype_trgm_idx'),
+            GeldigheidIndex(fields=['datum_begin_geldigheid', 'datum_einde_geldigheid'], name='statustype_geldig_idx'),
+            models.Index(fields=['is_van', 'informeren'], name='datamodel_s_is_van__81627c_idx'),
+        ]
 
         filter_fields = (
             'is_van',
@@ -0,0 +1,39 @@
+from django.contrib.postgres.fields import JSONField
+from django.db import models
+from django.utils.translation import ugettext_lazy as _
+
+from ..choices import WijzigingSoort
+
+
+class Wijziging(models.Model):
+    """
+    Een wijziging van een object in een CATALOGUS. Afnemers die de CATALOGUS spiegelen, hoeven zo alleen de objecten op
+    te halen die sinds hun laatst bekende revisie zijn gewijzigd.
+    """
+    # The log is written while objects (and catalogussen) are deleted, so it can not have a database constraint. The
+    # log of a catalogus is removed with the catalogus.
+    catalogus = models.ForeignKey(
+        'datamodel.Catalogus', verbose_name=_('catalogus'), related_name='wijzigingen', on_delete=models.DO_NOTHING,
+        db_constraint=False, help_text=_('De CATALOGUS waarin het object is gewijzigd.'))
+    revisie = models.PositiveIntegerField(
+        _('revisie'), help_text=_('De revisie van de CATALOGUS na de wijziging.'))
+    soort = models.CharField(
+        _('soort'), max_length=20, choices=WijzigingSoort.choices,
+        help_text=_('Of het object is aangemaakt, gewijzigd of verwijderd.'))
+    resource = models.CharField(
+        _('resource'), max_length=50, help_text=_('De naam van de API resource van het object.'))
+    resource_kwargs = JSONField(
+        _('resource kwargs'), help_text=_('De URL parameters van de API resource van het object.'))
+    tijdstip = models.DateTimeField(
+        _('tijdstip'), auto_now_add=True, help_text=_('Het tijdstip van de wijziging.'))
+
+    class Meta:
+        verbose_name = _('wijziging')
+        verbose_name_plural = _('wijzigingen')
+        ordering = ('catalogus', 'revisie', 'pk')
+        indexes = [
+            models.Index(fields=['catalogus', 'revisie'], name='wijziging_catalogus_rev_idx'),
+        ]
+
+    def __str__(self):
+        return '{} {} {}'.format(self.resource, self.soort, self.resource_kwargs)
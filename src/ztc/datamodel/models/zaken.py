@@ -2,6 +2,7 @@ from datetime import datetime
 
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.core.validators import (
     MaxValueValidator, MinValueValidator, RegexValidator
@@ -14,10 +15,11 @@ from django.utils.translation import ugettext_lazy as _
 from ..choices import (
     InternExtern, JaNee, ObjectTypen, VertrouwelijkheidAanduiding
 )
-from .mixins import GeldigheidMixin
+from ..indexes import GeldigheidIndex, TrigramIndex
+from .mixins import GeldigheidMixin, LaatstGewijzigdMixin, ZoekMixin
 
 
-class ZaakObjectType(GeldigheidMixin, models.Model):
+class ZaakObjectType(GeldigheidMixin, LaatstGewijzigdMixin, ZoekMixin, models.Model):
     """
     De objecttypen van objecten waarop een zaak van het ZAAKTYPE betrekking
     kan hebben.
@@ -53,7 +55,14 @@ class ZaakObjectType(GeldigheidMixin, models.Model):
         unique_together = ('is_relevant_voor', 'objecttype')
         verbose_name = _('Zaakobjecttype')
         verbose_name_plural = _('Zaakobjecttypen')
+        catalogus_lookup = 'is_relevant_voor__maakt_deel_uit_van'
         ordering = unique_together
+        indexes = [
+            GinIndex(fields=['zoek_vector'], name='zaakobjecttype_zoek_idx'),
+            TrigramIndex(fields=['objecttype', 'relatieomschrijving'], name='zaakobjecttype_trgm_idx'),
+            GeldigheidIndex(fields=['datum_begin_geldigheid', 'datum_einde_geldigheid'], name='zaakobjecttype_geldig_idx'),
+            models.Index(fields=['is_relevant_voor', 'ander_objecttype'], name='datamodel_z_is_rele_de482a_idx'),
+        ]
 
         filter_fields = (
             'is_relevant_voor',
@@ -92,7 +101,7 @@ class ZaakObjectType(GeldigheidMixin, models.Model):
         return '{} - {}{}'.format(self.is_relevant_voor, self.objecttype, self.ander_objecttype)
 
 
-class ProductDienst(models.Model):
+class ProductDienst(LaatstGewijzigdMixin, models.Model):
     """
     Het product of de dienst die door ZAAKen van dit ZAAKTYPE
     wordt voortgebracht.
@@ -120,9 +129,10 @@ class ProductDienst(models.Model):
     class Meta:
         verbose_name = _('Product / Dienst')
         verbose_name_plural = _('Product / Diensten')
+        catalogus_lookup = 'zaaktype__maakt_deel_uit_van'
 
 
-class Formulier(models.Model):
+class Formulier(LaatstGewijzigdMixin, models.Model):
     """
     Het formulier dat ZAAKen van dit ZAAKTYPE initieert.
 
@@ -149,9 +159,10 @@ class Formulier(models.Model):
     class Meta:
         verbose_name = _('Formulier')
         verbose_name_plural = _('Formulieren')
+        catalogus_lookup = 'zaaktype__maakt_deel_uit_van'
 
 
-class ReferentieProces(models.Model):
+class ReferentieProces(LaatstGewijzigdMixin, models.Model):
     """
     Het Referentieproces dat ten grondslag ligt aan dit ZAAKTYPE.
 
@@ -170,9 +181,10 @@ class ReferentieProces(models.Model):
     class Meta:
         verbose_name = _('Referentieprocess')
         verbose_name_plural = _('Referentieprocessen')
+        catalogus_lookup = 'zaaktype__maakt_deel_uit_van'
 
 
-class BronCatalogus(models.Model):
+class BronCatalogus(LaatstGewijzigdMixin, models.Model):
     """
     De CATALOGUS waaraan het ZAAKTYPE is ontleend.
 
@@ -203,9 +215,10 @@ class BronCatalogus(models.Model):
     class Meta:
         verbose_name = _('Bron catalogus')
         verbose_name_plural = _('Bron catalogussen')
+        catalogus_lookup = 'zaaktype__maakt_deel_uit_van'
 
 
-class BronZaakType(models.Model):
+class BronZaakType(LaatstGewijzigdMixin, models.Model):
     """
     Het zaaktype binnen de CATALOGUS waaraan dit ZAAKTYPE is ontleend.
 
@@ -240,9 +253,10 @@ class BronZaakType(models.Model):
     class Meta:
         verbose_name = _('Bron zaaktype')
         verbose_name_plural = _('Bron zaaktypen')
+        catalogus_lookup = 'zaaktype__maakt_deel_uit_van'
 
 
-class ZaakType(GeldigheidMixin, models.Model):
+class ZaakType(GeldigheidMixin, LaatstGewijzigdMixin, ZoekMixin, models.Model):
     """
     Het geheel van karakteristieke eigenschappen van zaken van eenzelfde soort
 
@@ -367,7 +381,26 @@ class ZaakType(GeldigheidMixin, models.Model):
         unique_together = ('maakt_deel_uit_van', 'zaaktype_identificatie')
         verbose_name = _('Zaaktype')
         verbose_name_plural = _('Zaaktypen')
+        catalogus_lookup = 'maakt_deel_uit_van'
         ordering = unique_together
+        indexes = [
+            GinIndex(fields=['zoek_vector'], name='zaaktype_zoek_idx'),
+            TrigramIndex(fields=[
+                'zaaktype_omschrijving',
+                'zaaktype_omschrijving_generiek',
+                'zaakcategorie',
+            ], name='zaaktype_trgm_idx'),
+            GeldigheidIndex(fields=['datum_begin_geldigheid', 'datum_einde_geldigheid'], name='zaaktype_geldig_idx'),
+            models.Index(fields=['maakt_deel_uit_van', 'publicatie_indicatie'], name='datamodel_z_maakt_d_664db5_idx'),
+            models.Index(fields=['maakt_deel_uit_van', 'verlenging_mogelijk'], name='datamodel_z_maakt_d_955dea_idx'),
+            models.Index(
+                fields=['maakt_deel_uit_van', 'opschorting_aanhouding_mogelijk'],
+                name='datamodel_z_maakt_d_b1d991_idx'),
+            models.Index(
+                fields=['maakt_deel_uit_van', 'indicatie_intern_of_extern'], name='datamodel_z_maakt_d_59d8eb_idx'),
+            models.Index(
+                fields=['maakt_deel_uit_van', 'vertrouwelijkheidaanduiding'], name='datamodel_z_maakt_d_ff422f_idx'),
+        ]
 
         filter_fields = (
             'maakt_deel_uit_van',
@@ -0,0 +1,103 @@
+"""
+Full-text search on the ``search_fields`` of the models.
+
+Every model with the ``ZoekMixin`` keeps its search fields in ``zoek_vector``, a ``tsvector`` made with the Dutch text
+search configuration that also ignores accents (created by migration 0013). The fields are weighted in the order of
+``search_fields``: the first field gets weight A, the second B, the third C and all others D.
+
+The vector is updated in the database after every save. Changes that do not call ``save`` (like ``QuerySet.update``)
+have to call ``update_zoek_vector`` themselves.
+
+Full-text search only matches (the start of) words. The short, identifying fields of a model also have a
+``TrigramIndex``, which the ``ilike`` lookup uses to match any part of their values.
+"""
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.db import models
+from django.db.models.functions import Cast
+from django.db.models.lookups import Lookup
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models.mixins import ZoekMixin
+
+SEARCH_CONFIG = 'dutch_unaccent'
+
+WEIGHTS = ('A', 'B', 'C', 'D')
+
+
+def get_search_fields(model):
+    search_fields = getattr(model._meta, 'search_fields', ())
+    if isinstance(search_fields, str):
+        return (search_fields, )
+    return tuple(search_fields)
+
+
+def get_zoek_vector(model):
+    """
+    Return the expression for the search vector of ``model``, from its ``search_fields``.
+    """
+    vector = None
+    for i, name in enumerate(get_search_fields(model)):
+        field = model._meta.get_field(name)
+        if isinstance(field, ArrayField):
+            text = models.Func(name, models.Value(' '), function='array_to_string', output_field=models.TextField())
+        elif isinstance(field, (models.CharField, models.TextField)):
+            text = models.F(name)
+        else:
+            text = Cast(name, models.TextField())
+
+        weighted = SearchVector(text, config=SEARCH_CONFIG, weight=WEIGHTS[min(i, len(WEIGHTS) - 1)])
+        vector = weighted if vector is None else vector + weighted
+    return vector
+
+
+def update_zoek_vector(queryset):
+    """
+    Update the search vector of all objects in ``queryset``.
+    """
+    vector = get_zoek_vector(queryset.model)
+    if vector is None:
+        return 0
+    return queryset.update(zoek_vector=vector)
+
+
+class PrefixSearchQuery(SearchQuery):
+    """
+    A query for objects that have words starting with each of the given ``words``.
+
+    ``SearchQuery`` only matches whole words, but searching for part of a word should keep working.
+    """
+    def __init__(self, words, **extra):
+        extra.setdefault('config', SEARCH_CONFIG)
+        value = ' & '.join("'{}':*".format(word) for word in words)
+        super().__init__(value, **extra)
+
+    def as_sql(self, compiler, connection):
+        config_sql, config_params = compiler.compile(self.config)
+        template = 'to_tsquery({}::regconfig, %s)'.format(config_sql)
+        if self.invert:
+            template = '!!({})'.format(template)
+        return template, config_params + [self.value]
+
+
+@models.Field.register_lookup
+class ILike(Lookup):
+    """
+    Match a case insensitive ``LIKE`` pattern, which a trigram index can be used for (unlike ``icontains``, which matches
+    the upper case value).
+    """
+    lookup_name = 'ilike'
+    # The pattern is always text, whatever the type of the field.
+    prepare_rhs = False
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return '{}::text ILIKE {}'.format(lhs, rhs), lhs_params + rhs_params
+
+
+@receiver(post_save)
+def update_zoek_vector_on_save(sender, instance, **kwargs):
+    if issubclass(sender, ZoekMixin):
+        update_zoek_vector(sender._default_manager.filter(pk=instance.pk))
@@ -0,0 +1,91 @@
+"""
+Keep the revisie and modification time of each ``Catalogus`` up to date.
+
+Every model in the datamodel has a ``catalogus_lookup`` option: the lookup from the model to the primary key of the
+catalogus (or catalogussen) it is part of. Whenever an object changes, the revisie of these catalogussen is increased
+and their ``laatst_gewijzigd`` is set to the current time. Unlike the modification times of the objects themselves,
+this also covers objects that were deleted.
+
+Afterwards, ``catalogus_changed`` is sent, so the change can be recorded.
+"""
+from django.db.models import F
+from django.db.models.signals import (
+    m2m_changed, post_save, pre_delete, pre_save
+)
+from django.dispatch import Signal, receiver
+from django.utils import timezone
+
+from .choices import WijzigingSoort
+from .models import Catalogus
+
+# Sent for every changed object that is part of one or more catalogussen, with the kind of change (a
+# ``WijzigingSoort``) and the new revisies of these catalogussen.
+catalogus_changed = Signal(providing_args=['instance', 'soort', 'revisies'])
+
+
+def get_catalogus_pks(model, pks):
+    """
+    Return the primary keys of the catalogussen that the objects of ``model`` with primary keys ``pks`` are part of.
+    """
+    lookup = getattr(model._meta, 'catalogus_lookup', None)
+    if lookup is None or not pks:
+        return set()
+
+    catalogus_pks = model._default_manager.filter(pk__in=pks).values_list(lookup, flat=True)
+    return {pk for pk in catalogus_pks if pk is not None}
+
+
+def increase_revisie(catalogus_pks):
+    """
+    Increase the revisie of the catalogussen and return their new revisies, by primary key.
+    """
+    if not catalogus_pks:
+        return {}
+
+    queryset = Catalogus.objects.filter(pk__in=catalogus_pks)
+    queryset.update(revisie=F('revisie') + 1, laatst_gewijzigd=timezone.now())
+    return dict(queryset.values_list('pk', 'revisie'))
+
+
+def notify_changes(sender, instances, soort, revisies):
+    if not revisies:
+        return
+    for instance in instances:
+        catalogus_changed.send(sender=sender, instance=instance, soort=soort, revisies=revisies)
+
+
+@receiver(pre_save)
+def remember_catalogussen(sender, instance, **kwargs):
+    # An object can be moved to another catalogus, in which case both catalogussen change.
+    if instance.pk is not None:
+        instance._catalogus_pks = get_catalogus_pks(sender, [instance.pk])
+
+
+@receiver(post_save)
+def increase_revisie_on_save(sender, instance, created, **kwargs):
+    catalogus_pks = get_catalogus_pks(sender, [instance.pk])
+    revisies = increase_revisie(catalogus_pks | getattr(instance, '_catalogus_pks', set()))
+
+    soort = WijzigingSoort.aangemaakt if created else WijzigingSoort.gewijzigd
+    notify_changes(sender, [instance], soort, revisies)
+
+
+@receiver(pre_delete)
+def increase_revisie_on_delete(sender, instance, **kwargs):
+    # After the delete, the catalogussen can no longer be looked up.
+    revisies = increase_revisie(get_catalogus_pks(sender, [instance.pk]))
+    notify_changes(sender, [instance], WijzigingSoort.verwijderd, revisies)
+
+
+@receiver(m2m_changed)
+def increase_revisie_on_m2m_change(sender, instance, action, model, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'pre_clear'):
+        return
+
+    catalogus_pks = get_catalogus_pks(type(instance), [instance.pk])
+    catalogus_pks |= get_catalogus_pks(model, pk_set)
+    revisies = increase_revisie(catalogus_pks)
+
+    notify_changes(type(instance), [instance], WijzigingSoort.gewijzigd, revisies)
+    if pk_set:
+        notify_changes(model, model._default_manager.filter(pk__in=pk_set), WijzigingSoort.gewijzigd, revisies)
@@ -0,0 +1,81 @@
+from django.test import TestCase
+
+from ..models import Catalogus
+from .factories import (
+    CatalogusFactory, ProductDienstFactory, StatusTypeFactory, ZaakTypeFactory
+)
+
+
+class CatalogusRevisieTests(TestCase):
+    def setUp(self):
+        self.catalogus = CatalogusFactory.create()
+        self.other_catalogus = CatalogusFactory.create()
+        self.zaaktype = ZaakTypeFactory.create(maakt_deel_uit_van=self.catalogus)
+
+    def get_revisie(self, catalogus):
+        return Catalogus.objects.values_list('revisie', flat=True).get(pk=catalogus.pk)
+
+    def test_change_increases_revisie(self):
+        revisie = self.get_revisie(self.catalogus)
+        other_revisie = self.get_revisie(self.other_catalogus)
+
+        self.zaaktype.save()
+
+        self.assertEqual(self.get_revisie(self.catalogus), revisie + 1)
+        self.assertEqual(self.get_revisie(self.other_catalogus), other_revisie)
+
+    def test_nested_change_increases_revisie(self):
+        revisie = self.get_revisie(self.catalogus)
+
+        StatusTypeFactory.create(is_van=self.zaaktype)
+
+        self.assertGreater(self.get_revisie(self.catalogus), revisie)
+
+    def test_move_increases_both_revisies(self):
+        revisie = self.get_revisie(self.catalogus)
+        other_revisie = self.get_revisie(self.other_catalogus)
+
+        self.zaaktype.maakt_deel_uit_van = self.other_catalogus
+        self.zaaktype.save()
+
+        self.assertGreater(self.get_revisie(self.catalogus), revisie)
+        self.assertGreater(self.get_revisie(self.other_catalogus), other_revisie)
+
+    def test_delete_increases_revisie(self):
+        statustype = StatusTypeFactory.create(is_van=self.zaaktype)
+        revisie = self.get_revisie(self.catalogus)
+
+        statustype.delete()
+
+        self.assertGreater(self.get_revisie(self.catalogus), revisie)
+
+    def test_m2m_change_increases_revisie(self):
+        product_dienst = ProductDienstFactory.create()
+        revisie = self.get_revisie(self.catalogus)
+
+        self.zaaktype.product_dienst.add(product_dienst)
+        self.assertGreater(self.get_revisie(self.catalogus), revisie)
+
+        revisie = self.get_revisie(self.catalogus)
+        product_dienst.zaaktype_set.clear()
+        self.assertGreater(self.get_revisie(self.catalogus), revisie)
+
+    def test_shared_object_change_increases_revisie(self):
+        product_dienst = ProductDienstFactory.create()
+        self.zaaktype.product_dienst.add(product_dienst)
+        revisie = self.get_revisie(self.catalogus)
+
+        product_dienst.naam = 'Nieuwe naam'
+        product_dienst.save()
+
+        self.assertGreater(self.get_revisie(self.catalogus), revisie)
+
+    def test_save_does_not_overwrite_revisie(self):
+        catalogus = Catalogus.objects.get(pk=self.catalogus.pk)
+        self.zaaktype.save()
+        revisie = self.get_revisie(self.catalogus)
+
+        # The instance still has the old revisie.
+        catalogus.save()
+
+        self.assertEqual(self.get_revisie(self.catalogus), revisie + 1)
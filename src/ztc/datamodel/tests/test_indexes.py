@@ -0,0 +1,56 @@
+from datetime import date
+
+from django.apps import apps
+from django.db import IntegrityError, connection, transaction
+from django.test import SimpleTestCase, TestCase
+
+from ..geldigheid import filter_geldig_op
+from ..indexes import GELDIGHEID_SQL, get_filter_indexes, is_indexed
+from ..models import Catalogus, ZaakType, ZaakTypenRelatie
+from .factories import ZaakTypeFactory
+
+
+class FilterIndexTests(SimpleTestCase):
+
+    def test_filter_fields_indexed(self):
+        self.assertTrue(is_indexed(Catalogus, ['rsin']))
+        self.assertTrue(is_indexed(ZaakType, ['maakt_deel_uit_van', 'vertrouwelijkheidaanduiding']))
+
+    def test_ordering_indexed(self):
+        self.assertTrue(is_indexed(ZaakTypenRelatie, ['zaaktype_van', 'id']))
+
+    def test_no_indexes_missing(self):
+        models = [
+            model for model in apps.get_app_config('datamodel').get_models()
+            if getattr(model._meta, 'filter_fields', None) is not None
+        ]
+        self.assertIn(ZaakType, models)
+        for model in models:
+            with self.subTest(model=model._meta.label):
+                self.assertEqual([index.fields for index in get_filter_indexes(model)], [])
+
+    def test_unique_together_not_duplicated(self):
+        fields = [index.fields for index in ZaakType._meta.indexes]
+
+        self.assertNotIn(['maakt_deel_uit_van', 'zaaktype_identificatie'], fields)
+
+
+class GeldigheidConstraintTests(TestCase):
+
+    def test_einde_before_begin(self):
+        zaaktype = ZaakTypeFactory.create(datum_begin_geldigheid=date(2018, 1, 1))
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            ZaakType.objects.filter(pk=zaaktype.pk).update(datum_einde_geldigheid=date(2017, 12, 31))
+
+        ZaakType.objects.filter(pk=zaaktype.pk).update(datum_einde_geldigheid=date(2018, 1, 1))
+        self.assertEqual(list(filter_geldig_op(ZaakType.objects.all(), date(2018, 1, 1))), [zaaktype])
+
+    def test_period_ending_before_it_begins_is_empty(self):
+        """
+        Rows from before the check constraint may still end before they begin. They are never valid.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT isempty({})'.format(
+                GELDIGHEID_SQL.format(begin="'2018-01-02'::date", einde="'2018-01-01'::date")))
+            self.assertTrue(cursor.fetchone()[0])
@@ -0,0 +1,34 @@
+from django.test import TestCase
+
+from ..models import Catalogus, InformatieObjectType, ZaakInformatieobjectType
+from ..search import PrefixSearchQuery
+from .factories import (
+    CatalogusFactory, InformatieObjectTypeFactory,
+    ZaakInformatieobjectTypeFactory
+)
+
+
+class ZoekVectorTests(TestCase):
+
+    def search(self, model, *words):
+        return list(model.objects.filter(zoek_vector=PrefixSearchQuery(words)))
+
+    def test_zoek_vector_updated_on_save(self):
+        catalogus = CatalogusFactory.create(contactpersoon_beheer_naam='Jan Jansen')
+        self.assertEqual(self.search(Catalogus, 'jansen'), [catalogus])
+
+        catalogus.contactpersoon_beheer_naam = 'Piet Pietersen'
+        catalogus.save()
+
+        self.assertEqual(self.search(Catalogus, 'jansen'), [])
+        self.assertEqual(self.search(Catalogus, 'pieters'), [catalogus])
+
+    def test_zoek_vector_of_array_field(self):
+        informatieobjecttype = InformatieObjectTypeFactory.create(informatieobjecttypetrefwoord=['besluit', 'advies'])
+
+        self.assertEqual(self.search(InformatieObjectType, 'advies'), [informatieobjecttype])
+
+    def test_zoek_vector_of_integer_field(self):
+        zaakinformatieobjecttype = ZaakInformatieobjectTypeFactory.create(volgnummer=4321)
+
+        self.assertEqual(self.search(ZaakInformatieobjectType, '4321'), [zaakinformatieobjecttype])